@@ -0,0 +1,72 @@
+"""
+Benchmark: catalog file size and load time, columnar (zlib/lzma) versus JSON and pickle.
+
+Run from the repository root:
+    python -m benchmarks.bench_catalog_export --songs 1000000
+"""
+
+import argparse
+import json
+import os
+import pickle
+import tempfile
+import time
+
+from benchmarks.common import best_of, make_catalog
+from catalog_columnar import export_songs, import_songs
+
+
+def _write_json(songs, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(songs, f)
+
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return [tuple(song) for song in json.load(f)]
+
+
+def _write_pickle(songs, path):
+    with open(path, "wb") as f:
+        pickle.dump(songs, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _read_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--songs", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    songs = make_catalog(args.songs)
+    print(f"catalog={args.songs}")
+
+    formats = (
+        ("json", _write_json, _read_json),
+        ("pickle", _write_pickle, _read_pickle),
+        ("columnar zlib", lambda s, p: export_songs(s, p, codec="zlib"), import_songs),
+        ("columnar lzma", lambda s, p: export_songs(s, p, codec="lzma"), import_songs),
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for name, write, read in formats:
+            path = os.path.join(directory, name.replace(" ", "_"))
+            start = time.perf_counter()
+            write(songs, path)
+            saved = time.perf_counter() - start
+            loaded = best_of(lambda: read(path), args.repeat)
+            assert read(path) == songs, name
+            size = os.path.getsize(path)
+            print(f"{name:14}: {size / 1e6:8.2f} MB  write {saved:7.3f}s  load {loaded:7.3f}s"
+                  f"  {args.songs / loaded:12,.0f} songs/s")
+            if name.startswith("columnar"):
+                partial = best_of(lambda: import_songs(path, fields=("id", "release_year")), args.repeat)
+                first = best_of(lambda: import_songs(path, blocks=(0,)), args.repeat)
+                print(f"{'':14}  id+year only {partial:7.3f}s  first block only {first:7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
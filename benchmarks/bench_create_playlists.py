@@ -0,0 +1,49 @@
+"""
+Benchmark: create_playlist called in a loop versus one create_playlists batch.
+
+Run from the repository root:
+    python -m benchmarks.bench_create_playlists --songs 100000 --playlists 50000
+"""
+
+import argparse
+import random
+import time
+
+import skeleton
+from benchmarks.common import make_catalog
+from playlist_batch import build_song_index, create_playlists
+
+
+def make_specs(songs, count, length, seed=0):
+    rng = random.Random(seed)
+    ids = [song[0] for song in songs]
+    return [(f"Auto Mix {i}", rng.sample(ids, length)) for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--songs", type=int, default=100000)
+    parser.add_argument("--playlists", type=int, default=20000)
+    parser.add_argument("--length", type=int, default=25)
+    args = parser.parse_args()
+
+    songs = make_catalog(args.songs)
+    specs = make_specs(songs, args.playlists, args.length)
+
+    start = time.perf_counter()
+    for name, song_ids in specs:
+        skeleton.create_playlist(name, song_ids, songs)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = build_song_index(songs)
+    create_playlists(specs, song_index=index)
+    batch = time.perf_counter() - start
+
+    print(f"catalog={args.songs} playlists={args.playlists} length={args.length}")
+    print(f"create_playlist loop : {single:8.3f}s  {args.playlists / single:12,.0f} playlists/s")
+    print(f"create_playlists     : {batch:8.3f}s  {args.playlists / batch:12,.0f} playlists/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Benchmark: partitioned parallel filters by worker count.
+
+Run from the repository root:
+    python -m benchmarks.bench_parallel_filter --songs 5000000 --workers 1 2 4 8
+"""
+
+import argparse
+
+from benchmarks.common import best_of, make_catalog
+from parallel_filter import PartitionedCatalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--songs", type=int, default=1000000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    songs = make_catalog(args.songs)
+    serial = best_of(lambda: [s for s in songs if 180 <= s[4] <= 300], args.repeat)
+    print(f"catalog={args.songs}")
+    print(f"{'serial scan':>14}: duration {serial:7.3f}s")
+
+    for workers in args.workers:
+        with PartitionedCatalog(songs, workers=workers) as catalog:
+            catalog.filter_by_decade(1990)  # start the workers before timing
+            duration = best_of(lambda: catalog.filter_by_duration(180, 300), args.repeat)
+            decade = best_of(lambda: catalog.filter_by_decade(1990), args.repeat)
+        print(f"{workers:>6} workers: duration {duration:7.3f}s ({serial / duration:4.2f}x)"
+              f"  decade {decade:7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
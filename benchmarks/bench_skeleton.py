@@ -0,0 +1,182 @@
+"""
+Benchmark suite for the public functions in skeleton.py.
+
+Times every function on synthetic catalogs of increasing size and reports
+operations per second, peak traced memory and a scaling exponent (1.0 means
+linear). Results can be saved as a baseline and later runs compared to it.
+
+Run from the repository root:
+    python -m benchmarks.bench_skeleton --sizes 1000 10000 100000
+    python -m benchmarks.bench_skeleton --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_skeleton --compare benchmarks/baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import sys
+import timeit
+import tracemalloc
+
+import skeleton
+from benchmarks.common import make_catalog
+from catalog_generator import GENRES
+
+
+def size_independent_cases(songs):
+    """Cases whose cost does not depend on catalog size."""
+    song = songs[0]
+    playlist = ("Benchmark", "2024-01-01 00:00:00", tuple(s[0] for s in songs[:50]))
+    return {
+        "initialize_data": lambda: skeleton.initialize_data(),
+        "create_song_record": lambda: skeleton.create_song_record(*song),
+        "format_duration": lambda: skeleton.format_duration(354),
+        "get_formatted_song": lambda: skeleton.get_formatted_song(song),
+        "get_playlist_info": lambda: skeleton.get_playlist_info(playlist, songs),
+    }
+
+
+def sized_cases(songs):
+    """Cases that scale with the catalog."""
+    artist = songs[0][2]
+    new_releases = make_catalog(max(len(songs) // 100, 1), seed=1)
+    playlist_ids = [s[0] for s in songs[::max(len(songs) // 50, 1)]]
+    cases = {
+        "filter_by_genre": lambda: skeleton.filter_by_genre(songs, "rock"),
+        "filter_by_artist": lambda: skeleton.filter_by_artist(songs, artist),
+        "filter_by_duration": lambda: skeleton.filter_by_duration(songs, 180, 300),
+        "filter_by_decade": lambda: skeleton.filter_by_decade(songs, 1990),
+        "calculate_genre_distribution": lambda: skeleton.calculate_genre_distribution(songs, GENRES),
+        "calculate_total_duration": lambda: skeleton.calculate_total_duration(songs),
+        "integrate_new_releases": lambda: skeleton.integrate_new_releases(songs, new_releases),
+        "create_playlist": lambda: skeleton.create_playlist("Benchmark", playlist_ids, songs),
+        "create_named_tuple_songs": lambda: skeleton.create_named_tuple_songs(songs),
+        "display_data": lambda: skeleton.display_data(songs, "songs"),
+    }
+    for key in skeleton.SORT_KEYS:
+        cases[f"sort_songs[{key}]"] = lambda key=key: skeleton.sort_songs(songs, key)
+    return cases
+
+
+def measure(func, repeat):
+    """
+    Measure one case.
+
+    Args:
+        func (callable): Case to run
+        repeat (int): Number of timing rounds
+
+    Returns:
+        dict: ops_per_sec and peak_bytes
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {"ops_per_sec": 1 / best if best else float("inf"), "peak_bytes": peak}
+
+
+def run_suite(sizes, repeat):
+    """
+    Run every case at every size.
+
+    Args:
+        sizes (list): Catalog sizes
+        repeat (int): Number of timing rounds per case
+
+    Returns:
+        dict: Mapping of "name@size" to measurements
+    """
+    results = {}
+    for name, func in size_independent_cases(make_catalog(100)).items():
+        results[f"{name}@1"] = measure(func, repeat)
+    for size in sizes:
+        songs = make_catalog(size)
+        for name, func in sized_cases(songs).items():
+            results[f"{name}@{size}"] = measure(func, repeat)
+    return results
+
+
+def scaling_exponents(results, sizes):
+    """Fit time ~ size**k between the smallest and largest size for each case."""
+    if len(sizes) < 2:
+        return {}
+    low, high = min(sizes), max(sizes)
+    exponents = {}
+    for key in results:
+        name, size = key.rsplit("@", 1)
+        if int(size) != low or f"{name}@{high}" not in results:
+            continue
+        ratio = results[f"{name}@{low}"]["ops_per_sec"] / results[f"{name}@{high}"]["ops_per_sec"]
+        exponents[name] = math.log(ratio) / math.log(high / low) if ratio > 0 else 0.0
+    return exponents
+
+
+def compare(results, baseline, tolerance):
+    """
+    List cases whose throughput dropped by more than tolerance.
+
+    Args:
+        results (dict): Current measurements
+        baseline (dict): Saved measurements
+        tolerance (float): Allowed fractional slowdown
+
+    Returns:
+        list: (key, baseline ops/sec, current ops/sec) for each regression
+    """
+    regressions = []
+    for key, old in baseline.items():
+        new = results.get(key)
+        if new and new["ops_per_sec"] < old["ops_per_sec"] * (1 - tolerance):
+            regressions.append((key, old["ops_per_sec"], new["ops_per_sec"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the public functions in skeleton.py")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    sizes = sorted(args.sizes)
+    results = run_suite(sizes, args.repeat)
+
+    print(f"{'case':<36}{'size':>10}{'ops/sec':>16}{'peak KiB':>12}")
+    for key, value in results.items():
+        name, size = key.rsplit("@", 1)
+        print(f"{name:<36}{size:>10}{value['ops_per_sec']:>16,.1f}{value['peak_bytes'] / 1024:>12,.1f}")
+
+    exponents = scaling_exponents(results, sizes)
+    if exponents:
+        print(f"\nscaling exponent between {sizes[0]} and {sizes[-1]} songs")
+        for name, exponent in exponents.items():
+            print(f"{name:<36}{exponent:>10.2f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"sizes": sizes, "results": results}, f, indent=2)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for key, old, new in regressions:
+                print(f"  {key}: {old:,.1f} -> {new:,.1f} ops/sec")
+            sys.exit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Helpers shared by the benchmark scripts.
+"""
+
+import time
+
+from catalog_generator import generate_songs
+
+
+def make_catalog(size, seed=0):
+    """
+    Build a synthetic list of song tuples.
+
+    Args:
+        size (int): Number of songs
+        seed (int): Random seed
+
+    Returns:
+        list: List of song tuples
+    """
+    return list(generate_songs(size, seed=seed))
+
+
+def best_of(func, repeat):
+    """
+    Time func several times.
+
+    Args:
+        func (callable): Function to time
+        repeat (int): Number of runs
+
+    Returns:
+        float: Fastest run in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
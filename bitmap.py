@@ -0,0 +1,266 @@
+"""
+Row Bitmaps
+Compressed sets of catalog row positions for fast playlist set operations
+("songs in A but not in B"). The layout follows roaring bitmaps: rows are
+split into chunks of 65536 by their high bits, and each chunk is stored
+as a sorted array of 16-bit offsets while sparse, or as a 65536-bit
+integer once dense. Bitmaps convert to and from the song_ids tuples that
+create_playlist returns.
+"""
+
+import sys
+from array import array
+
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+
+# Chunks with more rows than this are stored as a dense bitset
+SPARSE_LIMIT = 4096
+
+
+def _bits_of(container):
+    """Dense integer bitset for a container."""
+    if isinstance(container, int):
+        return container
+    dense = bytearray(CHUNK_SIZE // 8)
+    for offset in container:
+        dense[offset >> 3] |= 1 << (offset & 7)
+    return int.from_bytes(dense, "little")
+
+
+def _offsets_of(bits):
+    """Sorted offsets of the set bits in an integer bitset."""
+    offsets = array("H")
+    append = offsets.append
+    words = array("Q", bits.to_bytes(CHUNK_SIZE // 8, "little"))
+    if sys.byteorder != "little":
+        words.byteswap()
+    # Visit only non-zero 64-bit words, then peel off their lowest set bit
+    for index in [index for index, word in enumerate(words) if word]:
+        word = words[index]
+        base = (index << 6) - 1
+        while word:
+            low = word & -word
+            append(base + low.bit_length())
+            word ^= low
+    return offsets
+
+
+def _compact(bits):
+    """Choose the smaller representation for a chunk, or None if empty."""
+    count = bits.bit_count()
+    if count == 0:
+        return None
+    if count <= SPARSE_LIMIT:
+        return _offsets_of(bits)
+    return bits
+
+
+def _sparse(offsets):
+    """Container for sorted offsets: an array while sparse, else a bitset."""
+    if not offsets:
+        return None
+    if len(offsets) <= SPARSE_LIMIT:
+        return array("H", offsets)
+    return _bits_of(offsets)
+
+
+def _cardinality(container):
+    return container.bit_count() if isinstance(container, int) else len(container)
+
+
+class RowBitmap:
+    """
+    Immutable compressed set of row positions.
+
+    Args:
+        rows (iterable): Non-negative row positions
+    """
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, rows=()):
+        grouped = {}
+        for row in rows:
+            if not isinstance(row, int) or row < 0:
+                raise ValueError(f"Row positions must be non-negative integers: {row!r}")
+            grouped.setdefault(row >> CHUNK_BITS, set()).add(row & (CHUNK_SIZE - 1))
+        self._chunks = {}
+        for high, offsets in sorted(grouped.items()):
+            if len(offsets) <= SPARSE_LIMIT:
+                self._chunks[high] = array("H", sorted(offsets))
+            else:
+                self._chunks[high] = _bits_of(offsets)
+
+    @classmethod
+    def _from_chunks(cls, chunks):
+        bitmap = cls.__new__(cls)
+        bitmap._chunks = chunks
+        return bitmap
+
+    @classmethod
+    def from_song_ids(cls, song_ids, row_of_id):
+        """
+        Build a bitmap from playlist song IDs.
+
+        Args:
+            song_ids (iterable): Song IDs, e.g. the third element of a playlist tuple
+            row_of_id (dict): Song ID to catalog row position, see row_index
+
+        Returns:
+            RowBitmap: Bitmap of the songs' rows
+        """
+        try:
+            return cls(row_of_id[song_id] for song_id in song_ids)
+        except KeyError as e:
+            raise ValueError(f"Unknown song ID: {e.args[0]}") from None
+
+    @classmethod
+    def full(cls, size):
+        """
+        Bitmap containing every row from 0 to size - 1.
+
+        Args:
+            size (int): Number of rows in the catalog
+
+        Returns:
+            RowBitmap: Bitmap of all rows
+        """
+        if not isinstance(size, int) or size < 0:
+            raise ValueError("Size must be a non-negative integer")
+        chunks = {}
+        for high in range((size + CHUNK_SIZE - 1) >> CHUNK_BITS):
+            width = min(CHUNK_SIZE, size - (high << CHUNK_BITS))
+            chunks[high] = _compact((1 << width) - 1)
+        return cls._from_chunks(chunks)
+
+    def __len__(self):
+        return sum(_cardinality(container) for container in self._chunks.values())
+
+    def __bool__(self):
+        return bool(self._chunks)
+
+    def __contains__(self, row):
+        container = self._chunks.get(row >> CHUNK_BITS)
+        if container is None:
+            return False
+        offset = row & (CHUNK_SIZE - 1)
+        if isinstance(container, int):
+            return bool(container >> offset & 1)
+        low, high = 0, len(container)
+        while low < high:
+            middle = (low + high) // 2
+            if container[middle] < offset:
+                low = middle + 1
+            else:
+                high = middle
+        return low < len(container) and container[low] == offset
+
+    def __iter__(self):
+        for high in sorted(self._chunks):
+            container = self._chunks[high]
+            base = high << CHUNK_BITS
+            offsets = _offsets_of(container) if isinstance(container, int) else container
+            for offset in offsets:
+                yield base + offset
+
+    def __eq__(self, other):
+        if not isinstance(other, RowBitmap):
+            return NotImplemented
+        if self._chunks.keys() != other._chunks.keys():
+            return False
+        return all(_bits_of(self._chunks[h]) == _bits_of(other._chunks[h]) for h in self._chunks)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return f"RowBitmap({len(self)} rows)"
+
+    def _combine(self, other, op, set_op, keep_left, keep_right):
+        if not isinstance(other, RowBitmap):
+            return NotImplemented
+        chunks = {}
+        for high in sorted(self._chunks.keys() | other._chunks.keys()):
+            left = self._chunks.get(high)
+            right = other._chunks.get(high)
+            if right is None:
+                if keep_left:
+                    chunks[high] = left
+                continue
+            if left is None:
+                if keep_right:
+                    chunks[high] = right
+                continue
+            if isinstance(left, array) and isinstance(right, array):
+                # Two sparse chunks: combine the offsets directly rather than
+                # expanding both sides to 65536-bit integers
+                container = _sparse(sorted(set_op(set(left), right)))
+            else:
+                container = _compact(op(_bits_of(left), _bits_of(right)))
+            if container is not None:
+                chunks[high] = container
+        return self._from_chunks(chunks)
+
+    def __and__(self, other):
+        return self._combine(other, int.__and__, set.intersection, False, False)
+
+    def __or__(self, other):
+        return self._combine(other, int.__or__, set.union, True, True)
+
+    def __sub__(self, other):
+        return self._combine(other, lambda a, b: a & ~b, set.difference, True, False)
+
+    def __xor__(self, other):
+        return self._combine(other, int.__xor__, set.symmetric_difference, True, True)
+
+    def complement(self, size):
+        """
+        Rows from 0 to size - 1 that are not in this bitmap.
+
+        Args:
+            size (int): Number of rows in the catalog
+
+        Returns:
+            RowBitmap: The complement within the catalog
+        """
+        return RowBitmap.full(size) - self
+
+    def to_songs(self, songs):
+        """
+        Materialize the bitmap as song tuples in catalog order.
+
+        Args:
+            songs (list): List of all available songs
+
+        Returns:
+            list: Song tuples
+        """
+        return [songs[row] for row in self]
+
+    def to_song_ids(self, songs):
+        """
+        Materialize the bitmap as a song_ids tuple for a playlist.
+
+        Args:
+            songs (list): List of all available songs
+
+        Returns:
+            tuple: Song IDs in catalog order
+        """
+        return tuple(songs[row][0] for row in self)
+
+
+def row_index(songs):
+    """
+    Map song IDs to catalog row positions.
+
+    Args:
+        songs (list): List of all available songs
+
+    Returns:
+        dict: Song ID to row position
+    """
+    if songs is None:
+        raise ValueError("Songs cannot be None")
+    return {song[0]: row for row, song in enumerate(songs)}
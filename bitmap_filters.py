@@ -0,0 +1,157 @@
+"""
+Bitmap Filters
+Filter variants that can return RowBitmaps of matching row positions
+instead of lists of song tuples. Compound queries combine bitmaps with
+& (AND), | (OR) and negate (NOT), and only the final result is turned
+into song tuples:
+
+    filters = BitmapFilters(songs)
+    hits = (filters.filter_by_genre("rock", as_bitmap=True)
+            & filters.filter_by_decade(1980, as_bitmap=True)
+            & filters.negate(filters.filter_by_duration(0, 179, as_bitmap=True)))
+    songs_found = filters.materialize(hits)
+"""
+
+from bitmap import RowBitmap
+from skeleton import SONG_FIELDS
+from song_keys import KeyedCatalog, normalize_key
+
+_DURATION = SONG_FIELDS.index("duration")
+_YEAR = SONG_FIELDS.index("release_year")
+
+
+class BitmapFilters:
+    """
+    Filters over one catalog that can answer with row bitmaps.
+
+    Genre and artist bitmaps are cached per normalized value and decade
+    bitmaps per decade, so repeated predicates cost nothing after the
+    first query.
+
+    Args:
+        songs (list): List of song tuples
+    """
+
+    def __init__(self, songs):
+        if songs is None:
+            raise ValueError("Songs cannot be None")
+        self.catalog = KeyedCatalog(songs)
+        self._cache = {}
+
+    @property
+    def songs(self):
+        return self.catalog.songs
+
+    def add_songs(self, songs):
+        """
+        Add songs, e.g. new releases, and drop cached bitmaps.
+
+        Args:
+            songs (list): Song tuples to append
+        """
+        self.catalog.add_songs(songs)
+        self._cache.clear()
+
+    def _result(self, bitmap, as_bitmap):
+        return bitmap if as_bitmap else self.materialize(bitmap)
+
+    def _key_bitmap(self, field, value, label):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"{label} must be a non-empty string")
+        key = normalize_key(value)
+        bitmap = self._cache.get((field, key))
+        if bitmap is None:
+            column = self.catalog.keys[field]
+            bitmap = RowBitmap(row for row, k in enumerate(column) if k == key)
+            self._cache[(field, key)] = bitmap
+        return bitmap
+
+    def filter_by_genre(self, genre, as_bitmap=False):
+        """
+        Filter songs by genre.
+
+        Args:
+            genre (str): Genre to filter by
+            as_bitmap (bool): Return a RowBitmap instead of song tuples
+
+        Returns:
+            list or RowBitmap: Matching songs
+        """
+        return self._result(self._key_bitmap("genre", genre, "Genre"), as_bitmap)
+
+    def filter_by_artist(self, artist, as_bitmap=False):
+        """
+        Filter songs by artist.
+
+        Args:
+            artist (str): Artist to filter by
+            as_bitmap (bool): Return a RowBitmap instead of song tuples
+
+        Returns:
+            list or RowBitmap: Matching songs
+        """
+        return self._result(self._key_bitmap("artist", artist, "Artist"), as_bitmap)
+
+    def filter_by_duration(self, min_duration, max_duration, as_bitmap=False):
+        """
+        Filter songs by duration range.
+
+        Args:
+            min_duration (int): Minimum duration in seconds
+            max_duration (int): Maximum duration in seconds
+            as_bitmap (bool): Return a RowBitmap instead of song tuples
+
+        Returns:
+            list or RowBitmap: Matching songs
+        """
+        if not isinstance(min_duration, int) or not isinstance(max_duration, int):
+            raise ValueError("Durations must be integers")
+        if min_duration < 0 or min_duration > max_duration:
+            raise ValueError("Invalid duration range")
+        bitmap = RowBitmap(row for row, song in enumerate(self.songs)
+                           if min_duration <= song[_DURATION] <= max_duration)
+        return self._result(bitmap, as_bitmap)
+
+    def filter_by_decade(self, decade, as_bitmap=False):
+        """
+        Filter songs by release decade.
+
+        Args:
+            decade (int): Decade to filter by (e.g., 1970 for the 1970s)
+            as_bitmap (bool): Return a RowBitmap instead of song tuples
+
+        Returns:
+            list or RowBitmap: Matching songs
+        """
+        if not isinstance(decade, int) or decade % 10 != 0:
+            raise ValueError("Decade must be an integer multiple of 10")
+        bitmap = self._cache.get(("decade", decade))
+        if bitmap is None:
+            bitmap = RowBitmap(row for row, song in enumerate(self.songs)
+                               if decade <= song[_YEAR] <= decade + 9)
+            self._cache[("decade", decade)] = bitmap
+        return self._result(bitmap, as_bitmap)
+
+    def negate(self, bitmap):
+        """
+        Rows of the catalog that are not in bitmap (NOT).
+
+        Args:
+            bitmap (RowBitmap): Bitmap to negate
+
+        Returns:
+            RowBitmap: The complement within this catalog
+        """
+        return bitmap.complement(len(self.songs))
+
+    def materialize(self, bitmap):
+        """
+        Turn a bitmap into song tuples, in catalog order.
+
+        Args:
+            bitmap (RowBitmap): Rows to materialize
+
+        Returns:
+            list: Song tuples
+        """
+        return bitmap.to_songs(self.songs)
@@ -0,0 +1,170 @@
+"""
+Catalog Startup Cache
+Saves the data returned by initialize_data as a checksummed marshal
+snapshot. Later launches load the snapshot directly instead of rebuilding
+the catalog. The snapshot is rebuilt when the module defining the loader
+changes, or when the file fails its checksum. Loading still reads the
+whole catalog, so startup time keeps growing with catalog size; the
+snapshot only removes the cost of building it.
+"""
+
+import contextlib
+import hashlib
+import marshal
+import os
+import sys
+
+SNAPSHOT_VERSION = 2
+CACHE_ENV = "PLAYLIST_CACHE"
+
+_MAGIC = b"PLCAT1\n"
+_DIGEST_SIZE = 64
+
+
+def _source_fingerprint(loader):
+    """Identify the code that produced the snapshot by its file's size and mtime."""
+    module = sys.modules.get(loader.__module__)
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    stat = os.stat(path)
+    return (SNAPSHOT_VERSION, loader.__qualname__, os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+
+def default_cache_path(loader):
+    """
+    Choose where the snapshot for a loader is stored.
+
+    Args:
+        loader (callable): Function such as initialize_data
+
+    Returns:
+        str: PLAYLIST_CACHE if set, otherwise a file in the loader's __pycache__
+    """
+    if os.environ.get(CACHE_ENV):
+        return os.environ[CACHE_ENV]
+    module = sys.modules.get(loader.__module__)
+    directory = os.path.dirname(os.path.abspath(getattr(module, "__file__", None) or "."))
+    return os.path.join(directory, "__pycache__", f"{loader.__name__}.catalog")
+
+
+def write_checksummed(path, obj, magic=_MAGIC):
+    """
+    Marshal obj to a checksummed file, replacing any existing one atomically.
+
+    The temporary file is removed if the write fails.
+
+    Args:
+        path (str): Destination file
+        obj: Marshallable object
+        magic (bytes): File type marker written before the checksum
+    """
+    payload = marshal.dumps(obj)
+    digest = hashlib.sha256(payload).hexdigest().encode("ascii")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(magic + digest + b"\n" + payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+def read_checksummed(path, magic=_MAGIC):
+    """
+    Load an object saved by write_checksummed.
+
+    Args:
+        path (str): File to read
+        magic (bytes): File type marker the file must start with
+
+    Returns:
+        The saved object
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file has the wrong marker, fails its checksum or
+            does not unmarshal
+    """
+    with open(path, "rb") as f:
+        blob = f.read()
+    header = len(magic) + _DIGEST_SIZE + 1
+    if not blob.startswith(magic) or len(blob) < header:
+        raise ValueError(f"Unrecognized file format: {path}")
+    payload = blob[header:]
+    if hashlib.sha256(payload).hexdigest().encode("ascii") != blob[len(magic):header - 1]:
+        raise ValueError(f"File failed its checksum: {path}")
+    try:
+        return marshal.loads(payload)
+    except (EOFError, TypeError) as e:
+        raise ValueError(f"File is corrupt: {path}") from e
+
+
+def _read(path):
+    try:
+        return read_checksummed(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _load(loader, path):
+    """Return (snapshot, raw loader output); snapshot is None if the output is unusable."""
+    path = path or default_cache_path(loader)
+    fingerprint = _source_fingerprint(loader)
+    snapshot = _read(path)
+    if snapshot is not None and fingerprint is not None and snapshot.get("fingerprint") == fingerprint:
+        return snapshot, None
+
+    data = loader()
+    if not isinstance(data, tuple) or len(data) != 3 or any(part is None for part in data):
+        return None, data
+    songs, new_releases, genres = data
+    snapshot = {
+        "fingerprint": fingerprint,
+        "songs": songs,
+        "new_releases": new_releases,
+        "genres": genres,
+    }
+    if fingerprint is not None:
+        try:
+            write_checksummed(path, snapshot)
+        except (OSError, ValueError):
+            # Unwritable cache location or unmarshallable data: run uncached
+            pass
+    return snapshot, data
+
+
+def load_snapshot(loader, path=None):
+    """
+    Load the cached catalog snapshot, rebuilding it from loader when stale.
+
+    Args:
+        loader (callable): Function returning (songs, new_releases, genres)
+        path (str): Snapshot file, defaults to default_cache_path(loader)
+
+    Returns:
+        dict: Snapshot with "songs", "new_releases" and "genres",
+        or None if loader did not return a usable catalog
+    """
+    return _load(loader, path)[0]
+
+
+def load_catalog(loader, path=None):
+    """
+    Return loader's (songs, new_releases, genres), served from the snapshot when possible.
+
+    Args:
+        loader (callable): Function returning (songs, new_releases, genres)
+        path (str): Snapshot file, defaults to default_cache_path(loader)
+
+    Returns:
+        tuple: (songs, new_releases, genres), or whatever loader returned if it
+        was not a usable catalog
+    """
+    snapshot, data = _load(loader, path)
+    if snapshot is None:
+        return data
+    return snapshot["songs"], snapshot["new_releases"], snapshot["genres"]
@@ -0,0 +1,231 @@
+"""
+Columnar Catalog Files
+Exports song lists to a compressed columnar file and imports them back.
+Songs are written in blocks of rows; within a block each field is stored
+as its own separately compressed column (zlib or lzma). Text columns are
+dictionary-encoded: the distinct strings once, then one integer code per
+row. A footer records where every column of every block starts, so a
+reader can load only the blocks and fields it needs:
+
+    export_songs(songs, "catalog.plc")
+    songs = import_songs("catalog.plc")
+    years = import_songs("catalog.plc", fields=("id", "release_year"))
+
+Layout: magic, column chunks, marshal footer, footer length (8 bytes,
+little-endian), magic.
+
+The footer and non-numeric columns are marshal data. Marshal is not
+guaranteed to be readable by a different Python version, and loading it
+is not safe on untrusted input: only import files exported by the same
+Python version from a trusted source.
+"""
+
+import contextlib
+import lzma
+import marshal
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from skeleton import SONG_FIELDS
+
+FORMAT_VERSION = 1
+CODECS = {
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+DEFAULT_BLOCK_ROWS = 65536
+
+_MAGIC = b"PLCOL1\n"
+_TRAILER = struct.Struct("<Q")
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def _little_endian(values):
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def _encode_column(values):
+    """Return (kind, raw bytes) for one column of a block."""
+    if all(type(value) is int and _INT64_MIN <= value <= _INT64_MAX for value in values):
+        return "int", _little_endian(array("q", values))
+    if all(type(value) is str for value in values):
+        codes = {}
+        column = array("I", (codes.setdefault(value, len(codes)) for value in values))
+        return "dict", marshal.dumps((tuple(codes), _little_endian(column)))
+    return "marshal", marshal.dumps(tuple(values))
+
+
+def _decode_column(kind, data):
+    if kind == "int":
+        return _from_little_endian("q", data)
+    if kind == "dict":
+        strings, codes = marshal.loads(data)
+        return [strings[code] for code in _from_little_endian("I", codes)]
+    return marshal.loads(data)
+
+
+def export_songs(songs, path, codec="zlib", block_rows=DEFAULT_BLOCK_ROWS):
+    """
+    Write songs to a compressed columnar file, replacing it atomically.
+
+    Args:
+        songs (iterable): Song tuples; consumed one block at a time
+        path (str): Destination file
+        codec (str): "zlib" (faster) or "lzma" (smaller)
+        block_rows (int): Rows per block, the unit of selective reads
+
+    Returns:
+        int: Number of songs written
+    """
+    if songs is None:
+        raise ValueError("Songs cannot be None")
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec {codec!r}; expected one of {sorted(CODECS)}")
+    if not isinstance(block_rows, int) or block_rows < 1:
+        raise ValueError("block_rows must be a positive integer")
+    compress = CODECS[codec][0]
+    width = len(SONG_FIELDS)
+
+    blocks = []
+    total = 0
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(_MAGIC)
+            offset = len(_MAGIC)
+            iterator = iter(songs)
+            while True:
+                rows = [song for _, song in zip(range(block_rows), iterator)]
+                if not rows:
+                    break
+                for song in rows:
+                    if len(song) != width:
+                        raise ValueError(f"Song tuples must have {width} fields: {song!r}")
+                columns = {}
+                for position, field in enumerate(SONG_FIELDS):
+                    kind, raw = _encode_column([song[position] for song in rows])
+                    chunk = compress(raw)
+                    f.write(chunk)
+                    columns[field] = (kind, offset, len(chunk))
+                    offset += len(chunk)
+                blocks.append((len(rows), columns))
+                total += len(rows)
+            footer = marshal.dumps({
+                "version": FORMAT_VERSION,
+                "codec": codec,
+                "fields": SONG_FIELDS,
+                "blocks": blocks,
+            })
+            f.write(footer + _TRAILER.pack(len(footer)) + _MAGIC)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+    return total
+
+
+def read_footer(f):
+    """
+    Read the footer of an open columnar file.
+
+    Args:
+        f (file): File opened in binary mode
+
+    Returns:
+        dict: "version", "codec", "fields" and "blocks", a list of
+        (row count, {field: (kind, offset, length)})
+
+    Raises:
+        ValueError: If the file is not a columnar catalog or its footer is corrupt
+    """
+    tail = len(_MAGIC) + _TRAILER.size
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    f.seek(0)
+    if f.read(len(_MAGIC)) != _MAGIC or size < len(_MAGIC) + tail:
+        raise ValueError("Not a columnar catalog file")
+    f.seek(size - tail)
+    (footer_size,) = _TRAILER.unpack(f.read(_TRAILER.size))
+    if f.read(len(_MAGIC)) != _MAGIC or footer_size > size - len(_MAGIC) - tail:
+        raise ValueError("Columnar catalog file is truncated")
+    f.seek(size - tail - footer_size)
+    try:
+        footer = marshal.loads(f.read(footer_size))
+    except (EOFError, TypeError, ValueError) as e:
+        raise ValueError("Columnar catalog footer is corrupt") from e
+    if not isinstance(footer, dict):
+        raise ValueError("Columnar catalog footer is corrupt")
+    if footer.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar catalog version: {footer.get('version')}")
+    return footer
+
+
+def iter_blocks(path, fields=None, blocks=None):
+    """
+    Read a columnar file one block at a time.
+
+    Args:
+        path (str): File written by export_songs
+        fields (tuple): Fields to read, in the order wanted; all of SONG_FIELDS if None
+        blocks (iterable): Block numbers to read; all blocks if None
+
+    Yields:
+        list: Tuples holding the requested fields, one per song in the block
+
+    Raises:
+        ValueError: If the file is not a columnar catalog or a column is corrupt
+    """
+    with open(path, "rb") as f:
+        footer = read_footer(f)
+        fields = tuple(footer["fields"]) if fields is None else tuple(fields)
+        unknown = [field for field in fields if field not in footer["fields"]]
+        if unknown:
+            raise ValueError(f"Unknown fields: {unknown}")
+        decompress = CODECS[footer["codec"]][1]
+        wanted = range(len(footer["blocks"])) if blocks is None else blocks
+        for number in wanted:
+            _, columns = footer["blocks"][number]
+            decoded = []
+            for field in fields:
+                kind, offset, length = columns[field]
+                f.seek(offset)
+                try:
+                    decoded.append(_decode_column(kind, decompress(f.read(length))))
+                except (zlib.error, lzma.LZMAError, EOFError, IndexError, TypeError, ValueError) as e:
+                    raise ValueError(f"Column {field!r} of block {number} is corrupt: {path}") from e
+            yield list(zip(*decoded))
+
+
+def import_songs(path, fields=None, blocks=None):
+    """
+    Load songs from a columnar file.
+
+    Args:
+        path (str): File written by export_songs
+        fields (tuple): Fields to read; full song tuples if None
+        blocks (iterable): Block numbers to read; all blocks if None
+
+    Returns:
+        list: Song tuples, or tuples of the requested fields
+    """
+    songs = []
+    for rows in iter_blocks(path, fields, blocks):
+        songs.extend(rows)
+    return songs
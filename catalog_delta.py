@@ -0,0 +1,138 @@
+"""
+Catalog Deltas
+Compares two catalogs by song ID and content hash in one pass over each,
+and produces a compact CatalogDelta of added, replaced and removed songs.
+Deltas are applied with integrate_new_releases and can be saved as
+checksummed delta files, so a refresh costs time and bytes proportional to
+what changed rather than to the catalog size:
+
+    delta = diff_catalogs(manifest(yesterday), today)
+    write_delta(delta, "catalog.delta")
+    ...
+    songs = apply_delta(songs, read_delta("catalog.delta"))
+"""
+
+import hashlib
+from collections import namedtuple
+
+import skeleton
+from catalog_cache import read_checksummed, write_checksummed
+from change_feed import ADDED, REMOVED, REPLACED, diff_by_id
+
+CatalogDelta = namedtuple("CatalogDelta", ["added", "replaced", "removed"])
+CatalogDelta.__doc__ = ("Changes between two catalogs: tuples of added and replaced song "
+                        "tuples, and a tuple of removed song IDs.")
+
+_MAGIC = b"PLDLT1\n"
+
+
+def song_digest(song):
+    """
+    Content hash of a song tuple, stable across processes.
+
+    The hash covers the repr of the fields, which depends only on their
+    values; marshal output also depends on object identity, so equal songs
+    loaded separately could hash differently.
+
+    Args:
+        song (tuple): Song tuple
+
+    Returns:
+        bytes: 16-byte digest
+    """
+    return hashlib.blake2b(repr(tuple(song)).encode("utf-8"), digest_size=16).digest()
+
+
+def manifest(songs):
+    """
+    Map each song ID to its content hash.
+
+    A manifest stands in for the old catalog in diff_catalogs and is far
+    smaller than the songs themselves.
+
+    Args:
+        songs (list): List of song tuples
+
+    Returns:
+        dict: Song ID to song_digest; for repeated IDs the last row wins
+    """
+    if songs is None:
+        raise ValueError("Songs cannot be None")
+    return {song[0]: song_digest(song) for song in songs}
+
+
+def diff_catalogs(old, new):
+    """
+    Compute the delta that turns one catalog into another.
+
+    Args:
+        old (list or dict): Old song tuples, or their manifest
+        new (list): New song tuples
+
+    Returns:
+        CatalogDelta: Added and replaced songs in new-catalog order, removed IDs
+        in old-catalog order
+    """
+    if old is None or new is None:
+        raise ValueError("Both catalogs are required")
+    old_hashes = old if isinstance(old, dict) else manifest(old)
+    changes = diff_by_id(old_hashes, new, song_digest)
+    added = tuple(song for kind, _, song, _ in changes if kind == ADDED)
+    replaced = tuple(song for kind, _, song, _ in changes if kind == REPLACED)
+    removed = tuple(song_id for kind, song_id, _, _ in changes if kind == REMOVED)
+    return CatalogDelta(added, replaced, removed)
+
+
+def apply_delta(songs, delta):
+    """
+    Apply a delta to a song list.
+
+    Removed songs are dropped and replaced songs updated in place, keeping
+    catalog order; added songs are then integrated like new releases.
+
+    Args:
+        songs (list): List of song tuples the delta was computed from
+        delta (CatalogDelta): Changes to apply
+
+    Returns:
+        list: Updated list of song tuples
+    """
+    if songs is None or delta is None:
+        raise ValueError("Songs and delta are required")
+    removed = set(delta.removed)
+    replacements = {song[0]: song for song in delta.replaced}
+    kept = [replacements.get(song[0], song) for song in songs if song[0] not in removed]
+    if not delta.added:
+        return kept
+    result = skeleton.integrate_new_releases(kept, list(delta.added))
+    if result is None:
+        raise ValueError("integrate_new_releases returned no songs")
+    return result
+
+
+def write_delta(delta, path):
+    """
+    Save a delta as a checksummed file, replacing any existing one atomically.
+
+    Args:
+        delta (CatalogDelta): Delta to save
+        path (str): Destination file
+    """
+    write_checksummed(path, (delta.added, delta.replaced, delta.removed), magic=_MAGIC)
+
+
+def read_delta(path):
+    """
+    Load a delta written by write_delta.
+
+    Args:
+        path (str): Delta file
+
+    Returns:
+        CatalogDelta: The saved delta
+
+    Raises:
+        ValueError: If the file is not a delta file or fails its checksum
+    """
+    added, replaced, removed = read_checksummed(path, magic=_MAGIC)
+    return CatalogDelta(added, replaced, removed)
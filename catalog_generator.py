@@ -0,0 +1,146 @@
+"""
+Synthetic Catalog Generator
+Produces large, realistic and reproducible song catalogs for load testing.
+Songs are yielded one at a time as tuples valid for create_song_record, so
+catalogs of any size can be streamed to a file without being held in memory.
+
+    python catalog_generator.py --count 100000000 --output songs.csv
+"""
+
+import argparse
+import csv
+import json
+import math
+import random
+import sys
+from array import array
+from bisect import bisect
+from itertools import accumulate
+
+from skeleton import SONG_FIELDS
+
+GENRES = ("rock", "pop", "hip-hop", "electronic", "jazz", "classical",
+          "country", "r&b", "metal", "folk", "reggae", "blues")
+
+# Fixed rather than the current year so a seed gives the same catalog every year
+LATEST_YEAR = 2025
+
+_WORDS = ("love", "night", "fire", "dream", "heart", "river", "light", "rain", "city",
+          "summer", "shadow", "gold", "wild", "blue", "home", "star", "road", "ocean",
+          "echo", "storm", "silver", "broken", "dancing", "midnight", "forever", "electric")
+
+
+def _zipf_table(size, exponent):
+    """Cumulative Zipf weights for ranks 1..size."""
+    return list(accumulate(1 / (rank ** exponent) for rank in range(1, size + 1)))
+
+
+def _draw(rng, table):
+    return bisect(table, rng.random() * table[-1])
+
+
+def _phrase(rng, words):
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).title()
+
+
+def generate_songs(count, seed=0, artists=None, genres=GENRES, skew=1.1, start=1, prefix="S",
+                   latest_year=LATEST_YEAR):
+    """
+    Yield synthetic song tuples.
+
+    Artist popularity follows a Zipf distribution and each artist keeps one
+    main genre, so genre counts are skewed the same way. Durations are
+    log-normal around 3.5 minutes and release years lean towards recent decades.
+
+    Args:
+        count (int): Number of songs to generate
+        seed (int): Random seed; the same seed always produces the same catalog
+        artists (int): Number of distinct artists, defaults to count // 20
+        genres (tuple): Genres to draw from, most popular first
+        skew (float): Zipf exponent for artist and genre popularity
+        start (int): Number of the first song ID
+        prefix (str): Song ID prefix
+        latest_year (int): Most recent release year
+
+    Yields:
+        tuple: Song tuple (id, title, artist, genre, duration, release_year, album)
+    """
+    if not isinstance(count, int) or count < 0:
+        raise ValueError("Count must be a non-negative integer")
+    if not genres:
+        raise ValueError("At least one genre is required")
+    if skew <= 0:
+        raise ValueError("Skew must be positive")
+    artists = artists or min(max(count // 20, 1), 1_000_000)
+    rng = random.Random(seed)
+    width = max(3, len(str(start + count - 1)))
+
+    artist_table = _zipf_table(artists, skew)
+    genre_table = _zipf_table(len(genres), skew)
+    # Each artist gets one main genre, drawn once up front
+    artist_genre = array("H", (_draw(rng, genre_table) for _ in range(artists)))
+
+    for number in range(start, start + count):
+        artist = _draw(rng, artist_table)
+        genre = genres[artist_genre[artist]] if rng.random() < 0.9 else genres[_draw(rng, genre_table)]
+        duration = min(max(int(rng.lognormvariate(math.log(210), 0.35)), 30), 1800)
+        release_year = min(int(rng.triangular(1950, latest_year + 1, latest_year)), latest_year)
+        yield (
+            f"{prefix}{number:0{width}d}",
+            _phrase(rng, rng.randint(1, 4)),
+            f"Artist {artist + 1}",
+            genre,
+            duration,
+            release_year,
+            f"{_phrase(rng, rng.randint(1, 3))} ({release_year})",
+        )
+
+
+def write_songs(songs, output, fmt="csv"):
+    """
+    Stream song tuples to a file object.
+
+    Args:
+        songs (iterable): Song tuples
+        output (file): Text file object to write to
+        fmt (str): "csv" or "jsonl"
+
+    Returns:
+        int: Number of songs written
+    """
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported format: {fmt}")
+    written = 0
+    if fmt == "csv":
+        writer = csv.writer(output)
+        writer.writerow(SONG_FIELDS)
+        for song in songs:
+            writer.writerow(song)
+            written += 1
+    else:
+        for song in songs:
+            output.write(json.dumps(song) + "\n")
+            written += 1
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic song catalog")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--artists", type=int)
+    parser.add_argument("--skew", type=float, default=1.1)
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument("--output", help="file to write, defaults to stdout")
+    args = parser.parse_args()
+
+    songs = generate_songs(args.count, seed=args.seed, artists=args.artists, skew=args.skew)
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_songs(songs, f, args.format)
+    else:
+        write_songs(songs, sys.stdout, args.format)
+
+
+if __name__ == "__main__":
+    main()
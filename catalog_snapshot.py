@@ -0,0 +1,96 @@
+"""
+Copy-on-Write Catalog
+Thread-safe wrapper for a song catalog that is read far more often than
+it changes. Readers take the current immutable snapshot without locking;
+writers build a new snapshot and publish it by swapping one reference, so
+readers never wait and every query sees one consistent song list.
+"""
+
+import threading
+from collections import namedtuple
+
+import skeleton
+
+CatalogSnapshot = namedtuple("CatalogSnapshot", ["version", "songs", "genres"])
+CatalogSnapshot.__doc__ = "Immutable catalog version: version number, songs tuple and genres tuple."
+
+
+class SharedCatalog:
+    """
+    Read-mostly catalog with copy-on-write publication.
+
+    Args:
+        songs (list): Initial list of song tuples
+        genres (tuple): Tuple of valid genres
+    """
+
+    def __init__(self, songs, genres):
+        if songs is None or genres is None:
+            raise ValueError("Songs and genres are required")
+        self._snapshot = CatalogSnapshot(0, tuple(songs), tuple(genres))
+        self._write_lock = threading.Lock()
+
+    def snapshot(self):
+        """
+        Return the current catalog version.
+
+        Reading one attribute is atomic, so this never blocks on writers.
+
+        Returns:
+            CatalogSnapshot: Current immutable snapshot
+        """
+        return self._snapshot
+
+    @property
+    def version(self):
+        return self._snapshot.version
+
+    @property
+    def songs(self):
+        return self._snapshot.songs
+
+    def query(self, func, *args):
+        """
+        Run a read-only function such as filter_by_genre against one snapshot.
+
+        Args:
+            func (callable): Function taking the song list as its first argument
+            *args: Remaining arguments for func
+
+        Returns:
+            Result of func
+        """
+        return func(self._snapshot.songs, *args)
+
+    def update(self, func):
+        """
+        Publish a new version computed from the current song list.
+
+        Writers are serialized; readers keep using the previous snapshot
+        until the new one is published.
+
+        Args:
+            func (callable): Takes a list of song tuples and returns the new list
+
+        Returns:
+            CatalogSnapshot: The published snapshot
+        """
+        with self._write_lock:
+            current = self._snapshot
+            new_songs = func(list(current.songs))
+            if new_songs is None:
+                raise ValueError("Catalog update returned no songs")
+            self._snapshot = CatalogSnapshot(current.version + 1, tuple(new_songs), current.genres)
+            return self._snapshot
+
+    def integrate_new_releases(self, new_releases):
+        """
+        Add new releases and publish the result as a new version.
+
+        Args:
+            new_releases (list): List of new release tuples
+
+        Returns:
+            CatalogSnapshot: The published snapshot
+        """
+        return self.update(lambda songs: skeleton.integrate_new_releases(songs, new_releases))
@@ -0,0 +1,202 @@
+"""
+SQLite Catalog Backend
+Optional on-disk storage for song catalogs that do not fit in memory.
+The filter and sort operations run as indexed SQL queries and return the
+same song tuples as the in-memory functions in skeleton.py: genre and
+artist match exactly, and text sorts compare code points like Python.
+"""
+
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+from skeleton import SONG_FIELDS, SORT_KEYS
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS songs (
+        pos INTEGER PRIMARY KEY,
+        id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        artist TEXT NOT NULL,
+        genre TEXT NOT NULL,
+        duration INTEGER NOT NULL,
+        release_year INTEGER NOT NULL,
+        album TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_songs_genre ON songs (genre)",
+    "CREATE INDEX IF NOT EXISTS idx_songs_artist ON songs (artist)",
+    "CREATE INDEX IF NOT EXISTS idx_songs_duration ON songs (duration)",
+    "CREATE INDEX IF NOT EXISTS idx_songs_release_year ON songs (release_year)",
+    "CREATE INDEX IF NOT EXISTS idx_songs_title ON songs (title)",
+)
+
+_COLUMNS = ", ".join(SONG_FIELDS)
+
+# Statements are kept as constant strings so sqlite3's per-connection
+# statement cache reuses the prepared form on every call.
+_INSERT = f"INSERT INTO songs ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+_COUNT = "SELECT COUNT(*) FROM songs"
+_BY_GENRE = f"SELECT {_COLUMNS} FROM songs WHERE genre = ? ORDER BY pos"
+_BY_ARTIST = f"SELECT {_COLUMNS} FROM songs WHERE artist = ? ORDER BY pos"
+_BY_DURATION = f"SELECT {_COLUMNS} FROM songs WHERE duration BETWEEN ? AND ? ORDER BY pos"
+_BY_YEAR_RANGE = f"SELECT {_COLUMNS} FROM songs WHERE release_year BETWEEN ? AND ? ORDER BY pos"
+_SORTED = {
+    key: f"SELECT {_COLUMNS} FROM songs ORDER BY {SONG_FIELDS[index]}, pos"
+    for key, index in SORT_KEYS.items()
+}
+
+
+class SQLiteCatalog:
+    """
+    Song catalog stored in an SQLite database with a small connection pool.
+
+    Args:
+        path (str): Database file path, or ":memory:" for a private in-memory database
+        pool_size (int): Number of pooled connections
+    """
+
+    def __init__(self, path, pool_size=4):
+        if not isinstance(pool_size, int) or pool_size < 1:
+            raise ValueError("pool_size must be a positive integer")
+        if path == ":memory:":
+            # A shared-cache URI lets every pooled connection see the same data
+            path = f"file:catalog_{id(self)}?mode=memory&cache=shared"
+        self._path = path
+        self._pool = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        with self._connection() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+
+    def _connect(self):
+        conn = sqlite3.connect(self._path, uri=self._path.startswith("file:"),
+                               check_same_thread=False, cached_statements=64)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def _query(self, sql, params=()):
+        with self._connection() as conn:
+            return [tuple(row) for row in conn.execute(sql, params)]
+
+    def load(self, songs, batch_size=10000):
+        """
+        Append song tuples to the catalog.
+
+        Args:
+            songs (iterable): Song tuples to store
+            batch_size (int): Number of rows inserted per transaction
+
+        Returns:
+            int: Number of songs stored
+        """
+        if songs is None:
+            raise ValueError("Songs cannot be None")
+        stored = 0
+        batch = []
+        with self._connection() as conn:
+            for song in songs:
+                if not isinstance(song, tuple) or len(song) != len(SONG_FIELDS):
+                    raise ValueError(f"Invalid song record: {song!r}")
+                batch.append(song)
+                if len(batch) >= batch_size:
+                    conn.executemany(_INSERT, batch)
+                    conn.commit()
+                    stored += len(batch)
+                    batch = []
+            if batch:
+                conn.executemany(_INSERT, batch)
+                conn.commit()
+                stored += len(batch)
+        return stored
+
+    def __len__(self):
+        with self._connection() as conn:
+            return conn.execute(_COUNT).fetchone()[0]
+
+    def filter_by_genre(self, genre):
+        """
+        Filter songs by genre.
+
+        Args:
+            genre (str): Genre to filter by
+
+        Returns:
+            list: Filtered list of song tuples
+        """
+        if not isinstance(genre, str) or not genre.strip():
+            raise ValueError("Genre must be a non-empty string")
+        return self._query(_BY_GENRE, (genre,))
+
+    def filter_by_artist(self, artist):
+        """
+        Filter songs by artist.
+
+        Args:
+            artist (str): Artist to filter by
+
+        Returns:
+            list: Filtered list of song tuples
+        """
+        if not isinstance(artist, str) or not artist.strip():
+            raise ValueError("Artist must be a non-empty string")
+        return self._query(_BY_ARTIST, (artist,))
+
+    def filter_by_duration(self, min_duration, max_duration):
+        """
+        Filter songs by duration range.
+
+        Args:
+            min_duration (int): Minimum duration in seconds
+            max_duration (int): Maximum duration in seconds
+
+        Returns:
+            list: Filtered list of song tuples
+        """
+        if not isinstance(min_duration, int) or not isinstance(max_duration, int):
+            raise ValueError("Durations must be integers")
+        if min_duration < 0 or min_duration > max_duration:
+            raise ValueError("Invalid duration range")
+        return self._query(_BY_DURATION, (min_duration, max_duration))
+
+    def filter_by_decade(self, decade):
+        """
+        Filter songs by release decade.
+
+        Args:
+            decade (int): Decade to filter by (e.g., 1970 for the 1970s)
+
+        Returns:
+            list: Filtered list of song tuples
+        """
+        if not isinstance(decade, int) or decade % 10 != 0:
+            raise ValueError("Decade must be an integer multiple of 10")
+        return self._query(_BY_YEAR_RANGE, (decade, decade + 9))
+
+    def sort_songs(self, sort_key):
+        """
+        Return every song sorted by the given attribute.
+
+        Args:
+            sort_key (str): Attribute to sort by ("title", "artist", "year", "duration")
+
+        Returns:
+            list: Sorted list of song tuples
+        """
+        if sort_key not in _SORTED:
+            raise ValueError(f"Invalid sort key: {sort_key}")
+        return self._query(_SORTED[sort_key])
+
+    def close(self):
+        """Close every pooled connection."""
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
@@ -0,0 +1,243 @@
+"""
+Catalog Change Feed
+Append-only log of catalog mutations so caches and indexes can update
+incrementally instead of diffing whole song lists. Every published catalog
+version appends one ChangeEvent per added, replaced or removed song, each
+with a monotonically increasing sequence number. Consumers read the log
+from a sequence number they have already seen, block on it for new
+events, or register a callback:
+
+    catalog = FeedCatalog(songs, genres)
+    catalog.feed.subscribe(lambda event: index.add_songs([event.song]))
+    catalog.integrate_new_releases(new_releases)
+"""
+
+import logging
+import threading
+from collections import deque, namedtuple
+
+from catalog_snapshot import CatalogSnapshot, SharedCatalog
+
+logger = logging.getLogger(__name__)
+
+ChangeEvent = namedtuple("ChangeEvent", ["sequence", "version", "kind", "song", "previous"])
+ChangeEvent.__doc__ = ("One catalog change: sequence number, catalog version, kind "
+                       "(added, replaced or removed), the new song tuple and the song it replaced.")
+
+ADDED = "added"
+REPLACED = "replaced"
+REMOVED = "removed"
+
+
+def diff_by_id(old_by_id, new_songs, fingerprint=None):
+    """
+    Compare songs against an ID-keyed view of an older catalog.
+
+    When an ID appears more than once in new_songs, the last row wins,
+    matching how a dict built from the list would see it.
+
+    Args:
+        old_by_id (dict): Song ID to the old song, or to its fingerprint
+        new_songs (iterable): Song tuples after the change
+        fingerprint (callable): Maps a new song to the value stored in
+            old_by_id; None compares the songs themselves
+
+    Returns:
+        list: (kind, song_id, song, previous) tuples in new-list order,
+        removals last in old order; previous is the old_by_id value
+    """
+    new_by_id = {song[0]: song for song in new_songs}
+    changes = []
+    for song_id, song in new_by_id.items():
+        previous = old_by_id.get(song_id)
+        if previous is None:
+            changes.append((ADDED, song_id, song, None))
+        elif previous != (song if fingerprint is None else fingerprint(song)):
+            changes.append((REPLACED, song_id, song, previous))
+    for song_id, previous in old_by_id.items():
+        if song_id not in new_by_id:
+            changes.append((REMOVED, song_id, None, previous))
+    return changes
+
+
+def diff_songs(old_songs, new_songs):
+    """
+    Compare two song lists by song ID.
+
+    Args:
+        old_songs (iterable): Song tuples before the change
+        new_songs (iterable): Song tuples after the change
+
+    Returns:
+        list: (kind, song, previous) triples in new-list order, removals last
+    """
+    old_by_id = {song[0]: song for song in old_songs}
+    return [(kind, song, previous) for kind, _, song, previous in diff_by_id(old_by_id, new_songs)]
+
+
+class ChangeFeed:
+    """
+    Thread-safe append-only event log with callbacks.
+
+    Args:
+        max_events (int): Events kept for readers; older ones are dropped and
+            readers that fall that far behind must resynchronize. None keeps all.
+    """
+
+    def __init__(self, max_events=None):
+        if max_events is not None and max_events < 1:
+            raise ValueError("max_events must be positive or None")
+        self._events = deque(maxlen=max_events)
+        self._sequence = 0
+        self._subscribers = []
+        self._changed = threading.Condition()
+
+    @property
+    def sequence(self):
+        """Sequence number of the newest event, 0 before any event."""
+        return self._sequence
+
+    def publish(self, version, changes):
+        """
+        Append events for one catalog version and notify subscribers.
+
+        Args:
+            version (int): Catalog version the changes produced
+            changes (iterable): (kind, song, previous) triples
+
+        Returns:
+            list: The appended ChangeEvents
+        """
+        with self._changed:
+            events = []
+            for kind, song, previous in changes:
+                self._sequence += 1
+                events.append(ChangeEvent(self._sequence, version, kind, song, previous))
+            self._events.extend(events)
+            subscribers = list(self._subscribers)
+            self._changed.notify_all()
+        for callback in subscribers:
+            for event in events:
+                try:
+                    callback(event)
+                except Exception:
+                    # The catalog version is already published: a failing
+                    # subscriber must not keep events from the others
+                    logger.exception("Change feed subscriber %r failed on event %d", callback, event.sequence)
+        return events
+
+    def subscribe(self, callback):
+        """
+        Call callback(event) for every event published from now on.
+
+        Callbacks run on the publishing thread, in order, after the new
+        catalog version is visible. They must not update the catalog
+        themselves. An exception raised by a callback is logged and does
+        not stop delivery to it or to other subscribers.
+
+        Args:
+            callback (callable): Takes one ChangeEvent
+
+        Returns:
+            callable: Call it to unsubscribe
+        """
+        with self._changed:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._changed:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def events(self, since=0):
+        """
+        Events with a sequence number above since, oldest first.
+
+        Args:
+            since (int): Last sequence number the reader has processed
+
+        Returns:
+            list: ChangeEvents
+
+        Raises:
+            ValueError: If events after since were already dropped
+        """
+        with self._changed:
+            return self._events_after(since)
+
+    def _events_after(self, since):
+        if not self._events:
+            return []
+        first = self._events[0].sequence
+        if since < first - 1:
+            raise ValueError(f"Events after sequence {since} are no longer available")
+        skip = max(since - first + 1, 0)
+        return [self._events[i] for i in range(skip, len(self._events))]
+
+    def follow(self, since=0, timeout=None):
+        """
+        Iterate over events as they are published.
+
+        Args:
+            since (int): Last sequence number the reader has processed
+            timeout (float): Stop after waiting this many seconds with no new
+                events; None waits forever
+
+        Yields:
+            ChangeEvent: Events in sequence order
+        """
+        while True:
+            with self._changed:
+                if not self._changed.wait_for(lambda: self._sequence > since, timeout):
+                    return
+                batch = self._events_after(since)
+            for event in batch:
+                yield event
+                since = event.sequence
+
+
+class FeedCatalog(SharedCatalog):
+    """
+    SharedCatalog that records every published version in a ChangeFeed.
+
+    Args:
+        songs (list): Initial list of song tuples
+        genres (tuple): Tuple of valid genres
+        feed (ChangeFeed): Feed to publish to, a new one if omitted
+    """
+
+    def __init__(self, songs, genres, feed=None):
+        super().__init__(songs, genres)
+        self.feed = feed if feed is not None else ChangeFeed()
+        self._by_id = {song[0]: song for song in self._snapshot.songs}
+
+    def update(self, func):
+        """
+        Publish a new version and append its changes to the feed.
+
+        Args:
+            func (callable): Takes a list of song tuples and returns the new list
+
+        Returns:
+            CatalogSnapshot: The published snapshot
+        """
+        with self._write_lock:
+            current = self._snapshot
+            new_songs = func(list(current.songs))
+            if new_songs is None:
+                raise ValueError("Catalog update returned no songs")
+            new_songs = tuple(new_songs)
+            count = len(current.songs)
+            if new_songs[:count] == current.songs:
+                # Appends, the common case for integrate_new_releases: only
+                # the tail can hold changes
+                tail = new_songs[count:]
+                changes = diff_songs((self._by_id[song[0]] for song in tail if song[0] in self._by_id), tail)
+                self._by_id.update((song[0], song) for song in tail)
+            else:
+                changes = diff_songs(current.songs, new_songs)
+                self._by_id = {song[0]: song for song in new_songs}
+            self._snapshot = CatalogSnapshot(current.version + 1, new_songs, current.genres)
+            self.feed.publish(self._snapshot.version, changes)
+            return self._snapshot
@@ -0,0 +1,50 @@
+"""
+Collation Keys
+Sort keys that order text the way readers expect instead of by code point:
+accents and case only break ties between otherwise equal strings. A pure
+Python key is always available; locale_collator uses the C library's
+locale collation when a locale is installed.
+"""
+
+import locale
+import unicodedata
+
+
+def collation_key(text):
+    """
+    Pure Python multi-level collation key.
+
+    Primary level: letters without accents, casefolded, whitespace collapsed.
+    Secondary level: the accents. Tertiary level: case, lowercase first.
+
+    Args:
+        text (str): Text to build a key for
+
+    Returns:
+        tuple: (primary, secondary, tertiary) strings
+    """
+    if not isinstance(text, str):
+        raise ValueError("Text must be a string")
+    decomposed = unicodedata.normalize("NFKD", text)
+    base = "".join(char for char in decomposed if not unicodedata.combining(char))
+    accents = "".join(char for char in decomposed if unicodedata.combining(char))
+    return (" ".join(base.casefold().split()), accents, base.swapcase())
+
+
+def locale_collator(name):
+    """
+    Collation key function for a system locale.
+
+    Sets LC_COLLATE for the whole process, so choose it once at startup.
+
+    Args:
+        name (str): Locale name, e.g. "de_DE.UTF-8"
+
+    Returns:
+        callable: Function mapping text to a sort key
+    """
+    try:
+        locale.setlocale(locale.LC_COLLATE, name)
+    except locale.Error:
+        raise ValueError(f"Locale not available: {name}") from None
+    return locale.strxfrm
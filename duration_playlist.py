@@ -0,0 +1,137 @@
+"""
+Duration-Targeted Playlists
+Builds a playlist whose total length lands within a tolerance of a target,
+e.g. "about an hour of 1980s rock". Songs are added greedily until the
+remaining time is small, then an exact subset-sum over the remaining
+candidates (a bitset dynamic program on integer seconds) closes the gap.
+"""
+
+import random
+
+from playlist_batch import playlist_record
+from skeleton import SONG_FIELDS
+from song_keys import normalize_key
+
+_ARTIST = SONG_FIELDS.index("artist")
+_GENRE = SONG_FIELDS.index("genre")
+_DURATION = SONG_FIELDS.index("duration")
+_YEAR = SONG_FIELDS.index("release_year")
+
+# Most candidates fed to the subset-sum step
+MAX_DP_SONGS = 2000
+
+
+def _matches(song, genre, artist, decade, min_duration, max_duration, keys):
+    if genre is not None and _cached_key(song[_GENRE], keys) != genre:
+        return False
+    if artist is not None and _cached_key(song[_ARTIST], keys) != artist:
+        return False
+    if decade is not None and not decade <= song[_YEAR] <= decade + 9:
+        return False
+    return min_duration <= song[_DURATION] <= max_duration
+
+
+def _cached_key(text, keys):
+    key = keys.get(text)
+    if key is None:
+        key = keys[text] = normalize_key(text)
+    return key
+
+
+def _closest_subset(durations, low, high, goal):
+    """
+    Pick durations whose sum lies in [low, high], as close to goal as possible.
+
+    Returns:
+        list: Indexes into durations, or None if no subset fits
+    """
+    mask = (1 << (high + 1)) - 1
+    reachable = 1
+    history = [reachable]
+    for duration in durations:
+        reachable = (reachable | (reachable << duration)) & mask
+        history.append(reachable)
+    window = reachable >> low
+    if not window:
+        return None
+    best = None
+    for offset in range(high - low + 1):
+        if window >> offset & 1:
+            total = low + offset
+            if best is None or abs(total - goal) < abs(best - goal):
+                best = total
+    chosen = []
+    for i in range(len(durations), 0, -1):
+        if not history[i - 1] >> best & 1:
+            chosen.append(i - 1)
+            best -= durations[i - 1]
+    chosen.reverse()
+    return chosen
+
+
+def generate_duration_playlist(name, songs, target_seconds, tolerance=60, genre=None, artist=None,
+                               decade=None, min_duration=0, max_duration=None, seed=None):
+    """
+    Create a playlist of songs matching the criteria whose total length is near a target.
+
+    Args:
+        name (str): Playlist name
+        songs (list): List of all available songs
+        target_seconds (int): Desired total duration in seconds
+        tolerance (int): Allowed difference from the target in seconds
+        genre (str): Only songs of this genre
+        artist (str): Only songs by this artist
+        decade (int): Only songs released in this decade (e.g., 1980)
+        min_duration (int): Shortest song allowed, in seconds
+        max_duration (int): Longest song allowed, in seconds
+        seed (int): Random seed for which songs are picked; None picks differently each call
+
+    Returns:
+        tuple: Playlist tuple (name, created, song_ids)
+    """
+    if songs is None:
+        raise ValueError("Songs cannot be None")
+    if not isinstance(target_seconds, int) or target_seconds <= 0:
+        raise ValueError("Target duration must be a positive integer")
+    if not isinstance(tolerance, int) or not 0 <= tolerance < target_seconds:
+        raise ValueError("Tolerance must be a non-negative integer below the target")
+    if decade is not None and (not isinstance(decade, int) or decade % 10 != 0):
+        raise ValueError("Decade must be an integer multiple of 10")
+    genre = normalize_key(genre) if genre is not None else None
+    artist = normalize_key(artist) if artist is not None else None
+    max_duration = target_seconds + tolerance if max_duration is None else max_duration
+
+    seen = set()
+    keys = {}  # genres and artists repeat, so normalize each distinct value once
+    candidates = []
+    for song in songs:
+        if song[0] not in seen and song[_DURATION] > 0 and _matches(
+                song, genre, artist, decade, min_duration, max_duration, keys):
+            seen.add(song[0])
+            candidates.append(song)
+    if not candidates:
+        raise ValueError("No songs match the criteria")
+    random.Random(seed).shuffle(candidates)
+
+    # Greedy phase: fill up while leaving room for the exact step to finish
+    reserve = 2 * max(song[_DURATION] for song in candidates)
+    picked = []
+    total = 0
+    remaining = []
+    for song in candidates:
+        if total + song[_DURATION] <= target_seconds - reserve:
+            picked.append(song)
+            total += song[_DURATION]
+        elif len(remaining) < MAX_DP_SONGS:
+            remaining.append(song)
+
+    low = max(target_seconds - tolerance - total, 0)
+    high = target_seconds + tolerance - total
+    chosen = _closest_subset([song[_DURATION] for song in remaining], low, high, target_seconds - total)
+    if chosen is None:
+        raise ValueError(f"No combination of matching songs lasts {target_seconds}s ± {tolerance}s")
+    picked.extend(remaining[i] for i in chosen)
+    if not picked:
+        raise ValueError("No songs selected for the target duration")
+
+    return playlist_record(name, (song[0] for song in picked))
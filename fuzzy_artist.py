@@ -0,0 +1,158 @@
+"""
+Fuzzy Artist Matching
+Approximate artist lookup for misspelled queries. A trigram index narrows
+the distinct artist names to a few candidates, and only those are checked
+with an edit-distance computation that stops once it passes the limit,
+so a lookup never compares the query against every song.
+"""
+
+from collections import Counter
+
+from skeleton import SONG_FIELDS
+from song_keys import normalize_key
+
+_ARTIST = SONG_FIELDS.index("artist")
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def bounded_edit_distance(a, b, limit):
+    """
+    Levenshtein distance between two strings, giving up past a limit.
+
+    Only the diagonal band of width 2 * limit + 1 is computed.
+
+    Args:
+        a (str): First string
+        b (str): Second string
+        limit (int): Largest distance of interest
+
+    Returns:
+        int: The distance, or limit + 1 if it exceeds limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) > len(b):
+        a, b = b, a
+    over = limit + 1
+    previous = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [over] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        low = max(1, i - limit)
+        high = min(len(b), i + limit)
+        char = a[i - 1]
+        for j in range(low, high + 1):
+            cost = 0 if char == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost, over)
+        if min(current[low - 1:high + 1]) > limit:
+            return over
+        previous = current
+    return min(previous[len(b)], over)
+
+
+class ArtistIndex:
+    """
+    Trigram index over the distinct artist names in a catalog.
+
+    Args:
+        songs (list): Initial list of song tuples
+    """
+
+    def __init__(self, songs=()):
+        self.songs = []
+        self._names = []        # artist id -> normalized name
+        self._display = []      # artist id -> name as first seen
+        self._ids = {}          # normalized name -> artist id
+        self._rows = []         # artist id -> row positions
+        self._grams = {}        # trigram -> (artist id, occurrences in the name) pairs
+        self.add_songs(songs)
+
+    def add_songs(self, songs):
+        """
+        Index additional songs.
+
+        Args:
+            songs (list): Song tuples to append to the index
+        """
+        if songs is None:
+            raise ValueError("Songs cannot be None")
+        for song in songs:
+            row = len(self.songs)
+            self.songs.append(song)
+            key = normalize_key(song[_ARTIST])
+            artist_id = self._ids.get(key)
+            if artist_id is None:
+                artist_id = self._ids[key] = len(self._names)
+                self._names.append(key)
+                self._display.append(song[_ARTIST])
+                self._rows.append([])
+                for gram, count in Counter(_trigrams(key)).items():
+                    self._grams.setdefault(gram, []).append((artist_id, count))
+            self._rows[artist_id].append(row)
+
+    def _candidates(self, key, max_distance):
+        grams = _trigrams(key)
+        # Each edit destroys at most three of the query's trigrams
+        needed = len(grams) - 3 * max_distance
+        if needed <= 0:
+            # Query too short for the trigram filter to prune anything
+            return [i for i, name in enumerate(self._names)
+                    if abs(len(name) - len(key)) <= max_distance]
+        # Trigrams shared as multisets: a trigram repeated in the query
+        # counts as often as it also repeats in the name
+        shared = Counter()
+        for gram, wanted in Counter(grams).items():
+            for artist_id, count in self._grams.get(gram, ()):
+                shared[artist_id] += min(wanted, count)
+        return [artist_id for artist_id, count in shared.items()
+                if count >= needed and abs(len(self._names[artist_id]) - len(key)) <= max_distance]
+
+    def match_artists(self, artist, max_distance=2):
+        """
+        Find artist names within an edit distance of the query.
+
+        Args:
+            artist (str): Artist name, possibly misspelled
+            max_distance (int): Largest allowed edit distance
+
+        Returns:
+            list: (artist name, distance) pairs, closest first
+        """
+        if not isinstance(artist, str) or not artist.strip():
+            raise ValueError("Artist must be a non-empty string")
+        if not isinstance(max_distance, int) or max_distance < 0:
+            raise ValueError("max_distance must be a non-negative integer")
+        key = normalize_key(artist)
+        exact = self._ids.get(key)
+        if max_distance == 0:
+            return [(self._display[exact], 0)] if exact is not None else []
+        matches = []
+        for artist_id in self._candidates(key, max_distance):
+            distance = bounded_edit_distance(key, self._names[artist_id], max_distance)
+            if distance <= max_distance:
+                matches.append((distance, artist_id))
+        matches.sort()
+        return [(self._display[artist_id], distance) for distance, artist_id in matches]
+
+    def filter_by_artist(self, artist, max_distance=2):
+        """
+        Filter songs by artist, tolerating small spelling mistakes.
+
+        Args:
+            artist (str): Artist to filter by
+            max_distance (int): Largest allowed edit distance, 0 for exact matching
+
+        Returns:
+            list: Filtered list of song tuples in catalog order
+        """
+        matched = self.match_artists(artist, max_distance)
+        rows = []
+        for name, _ in matched:
+            rows.extend(self._rows[self._ids[normalize_key(name)]])
+        rows.sort()
+        return [self.songs[row] for row in rows]
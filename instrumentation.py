@@ -0,0 +1,195 @@
+"""
+Hot-Path Instrumentation
+Opt-in timing for the filter, sort, statistics and playlist functions.
+install() swaps timed wrappers into the skeleton module and uninstall()
+puts the originals back, so nothing is measured (and nothing costs
+anything) until it is switched on.
+
+Collected per function: call and error counts, a latency histogram,
+songs passed in and items returned, and a log warning for calls slower than a threshold.
+Snapshots export as JSON or Prometheus text.
+"""
+
+import functools
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+import skeleton
+
+logger = logging.getLogger(__name__)
+
+# Instrumented function -> position of its songs argument, whose length is
+# recorded as the input size
+INSTRUMENTED_FUNCTIONS = {
+    "filter_by_genre": 0,
+    "filter_by_artist": 0,
+    "filter_by_duration": 0,
+    "filter_by_decade": 0,
+    "sort_songs": 0,
+    "calculate_genre_distribution": 0,
+    "calculate_total_duration": 0,
+    "integrate_new_releases": 0,
+    "create_playlist": 2,
+    "get_playlist_info": 1,
+}
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+_lock = threading.Lock()
+_stats = {}
+_originals = {}
+_slow_threshold = 1.0
+
+
+def _new_stats():
+    return {
+        "calls": 0,
+        "errors": 0,
+        "total_seconds": 0.0,
+        "max_seconds": 0.0,
+        "buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+        "input_items": 0,
+        "output_items": 0,
+    }
+
+
+def _size(value):
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
+
+def _record(name, elapsed, failed, input_items, output_items):
+    with _lock:
+        stats = _stats.setdefault(name, _new_stats())
+        stats["calls"] += 1
+        stats["errors"] += failed
+        stats["total_seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+        stats["buckets"][bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        stats["input_items"] += input_items
+        stats["output_items"] += output_items
+    if elapsed >= _slow_threshold:
+        logger.warning("Slow call: %s took %.3fs (input %d items, output %d items)",
+                       name, elapsed, input_items, output_items)
+
+
+def _input_size(name, args, kwargs):
+    position = INSTRUMENTED_FUNCTIONS[name]
+    if position < len(args):
+        return _size(args[position])
+    return _size(kwargs.get("songs"))
+
+
+def _timed(name, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = None
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            _record(name, time.perf_counter() - start, failed,
+                    _input_size(name, args, kwargs), _size(result))
+    wrapper.__wrapped_for_timing__ = True
+    return wrapper
+
+
+def install(slow_threshold=1.0, module=skeleton):
+    """
+    Start timing the instrumented functions.
+
+    Only calls made through the module attribute (skeleton.filter_by_genre)
+    are timed; names imported before install() keep the original function.
+
+    Args:
+        slow_threshold (float): Calls taking at least this many seconds are logged
+        module (module): Module whose functions are wrapped
+    """
+    global _slow_threshold
+    if slow_threshold <= 0:
+        raise ValueError("slow_threshold must be positive")
+    _slow_threshold = slow_threshold
+    for name in INSTRUMENTED_FUNCTIONS:
+        func = getattr(module, name)
+        if getattr(func, "__wrapped_for_timing__", False):
+            continue
+        _originals[(module, name)] = func
+        setattr(module, name, _timed(name, func))
+
+
+def uninstall():
+    """Restore the original functions."""
+    for (module, name), func in _originals.items():
+        setattr(module, name, func)
+    _originals.clear()
+
+
+def is_installed():
+    return bool(_originals)
+
+
+def reset():
+    """Discard every collected measurement."""
+    with _lock:
+        _stats.clear()
+
+
+def snapshot():
+    """
+    Copy the current measurements.
+
+    Returns:
+        dict: Per-function statistics keyed by function name
+    """
+    with _lock:
+        return {name: dict(stats, buckets=list(stats["buckets"])) for name, stats in _stats.items()}
+
+
+def to_json(indent=2):
+    """
+    Export the measurements as JSON.
+
+    Returns:
+        str: JSON document with bucket bounds and per-function statistics
+    """
+    return json.dumps({"latency_buckets": LATENCY_BUCKETS, "functions": snapshot()}, indent=indent)
+
+
+def to_prometheus():
+    """
+    Export the measurements in the Prometheus text exposition format.
+
+    Returns:
+        str: Metrics text
+    """
+    lines = [
+        "# HELP playlist_call_seconds Latency of playlist system calls.",
+        "# TYPE playlist_call_seconds histogram",
+    ]
+    data = snapshot()
+    for name, stats in sorted(data.items()):
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), stats["buckets"]):
+            cumulative += count
+            lines.append(f'playlist_call_seconds_bucket{{function="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'playlist_call_seconds_sum{{function="{name}"}} {stats["total_seconds"]}')
+        lines.append(f'playlist_call_seconds_count{{function="{name}"}} {stats["calls"]}')
+    for metric, key, help_text in (
+        ("playlist_call_errors_total", "errors", "Calls that raised an exception."),
+        ("playlist_input_items_total", "input_items", "Songs passed in."),
+        ("playlist_output_items_total", "output_items", "Items returned."),
+    ):
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for name, stats in sorted(data.items()):
+            lines.append(f'{metric}{{function="{name}"}} {stats[key]}')
+    return "\n".join(lines) + "\n"
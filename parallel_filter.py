@@ -0,0 +1,127 @@
+"""
+Partitioned Parallel Filters
+Runs filter_by_duration and filter_by_decade over very large catalogs on
+several cores. The duration and release year columns are copied once into
+shared memory; worker processes each scan one shard of row positions and
+the parent merges the matches back in original catalog order.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# Shared column name -> song tuple position
+_COLUMNS = {"duration": 4, "release_year": 5}
+
+# Column views attached in each worker process
+_worker_columns = {}
+
+
+def _attach_columns(names):
+    for column, name in names.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _worker_columns[column] = (shm, shm.buf.cast("i"))
+
+
+def _scan_shard(column, low, high, start, stop):
+    values = _worker_columns[column][1]
+    return array("q", [i for i in range(start, stop) if low <= values[i] <= high])
+
+
+class PartitionedCatalog:
+    """
+    Catalog whose numeric columns are filtered in parallel worker processes.
+
+    Args:
+        songs (list): List of song tuples
+        workers (int): Number of worker processes, defaults to the CPU count
+        shards_per_worker (int): Shards handed to each worker per query
+    """
+
+    def __init__(self, songs, workers=None, shards_per_worker=4):
+        if songs is None:
+            raise ValueError("Songs cannot be None")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if not isinstance(workers, int) or workers < 1 or shards_per_worker < 1:
+            raise ValueError("workers and shards_per_worker must be positive")
+        self.songs = songs
+        self.workers = workers
+        self._blocks = {}
+        self._pool = None
+        try:
+            for column, position in _COLUMNS.items():
+                values = array("i", (song[position] for song in songs))
+                shm = shared_memory.SharedMemory(create=True, size=max(len(values) * values.itemsize, 1))
+                self._blocks[column] = shm
+                shm.buf[:len(values) * values.itemsize] = values.tobytes()
+            count = len(songs)
+            shard_count = min(max(count, 1), self.workers * shards_per_worker)
+            step = -(-count // shard_count) if count else 0
+            self._shards = [(start, min(start + step, count)) for start in range(0, count, step or 1)]
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_attach_columns,
+                initargs=({column: shm.name for column, shm in self._blocks.items()},),
+            )
+        except BaseException:
+            # Shared memory outlives the process unless unlinked
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _filter_range(self, column, low, high):
+        futures = [
+            self._pool.submit(_scan_shard, column, low, high, start, stop)
+            for start, stop in self._shards
+        ]
+        songs = self.songs
+        # Shards are in catalog order, so collecting them in order keeps the result ordered
+        return [songs[i] for future in futures for i in future.result()]
+
+    def filter_by_duration(self, min_duration, max_duration):
+        """
+        Filter songs by duration range.
+
+        Args:
+            min_duration (int): Minimum duration in seconds
+            max_duration (int): Maximum duration in seconds
+
+        Returns:
+            list: Filtered list of song tuples
+        """
+        if not isinstance(min_duration, int) or not isinstance(max_duration, int):
+            raise ValueError("Durations must be integers")
+        if min_duration < 0 or min_duration > max_duration:
+            raise ValueError("Invalid duration range")
+        return self._filter_range("duration", min_duration, max_duration)
+
+    def filter_by_decade(self, decade):
+        """
+        Filter songs by release decade.
+
+        Args:
+            decade (int): Decade to filter by (e.g., 1970 for the 1970s)
+
+        Returns:
+            list: Filtered list of song tuples
+        """
+        if not isinstance(decade, int) or decade % 10 != 0:
+            raise ValueError("Decade must be an integer multiple of 10")
+        return self._filter_range("release_year", decade, decade + 9)
+
+    def close(self):
+        """Stop the workers and release the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for shm in self._blocks.values():
+            shm.close()
+            shm.unlink()
+        self._blocks = {}
@@ -0,0 +1,93 @@
+"""
+Bulk Playlist Creation
+Creates many playlists in one call for scheduled jobs that generate
+playlists automatically. Song IDs are resolved against one shared index
+built a single time, and every playlist in a batch gets the same
+creation timestamp.
+"""
+
+from datetime import datetime
+
+# Format of the creation timestamp stored in playlist tuples
+CREATED_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def build_song_index(songs):
+    """
+    Build a lookup of song IDs for resolving playlist entries.
+
+    Args:
+        songs (list): List of all available songs
+
+    Returns:
+        dict: Mapping of song ID to the catalog's own ID string
+    """
+    if songs is None:
+        raise ValueError("Songs cannot be None")
+    return {song[0]: song[0] for song in songs}
+
+
+def playlist_record(name, song_ids, created=None):
+    """
+    Stamp a playlist record for song IDs already taken from the catalog.
+
+    Generators that pick songs straight from the catalog use this instead
+    of create_playlists, which would resolve every ID again.
+
+    Args:
+        name (str): Playlist name
+        song_ids (iterable): Song IDs, all present in the catalog
+        created (datetime): Creation timestamp, defaults to now
+
+    Returns:
+        tuple: Playlist tuple (name, created, song_ids)
+    """
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("Playlist name cannot be empty")
+    song_ids = tuple(song_ids)
+    if not song_ids:
+        raise ValueError(f"Playlist '{name}' must contain at least one song ID")
+    return (name, (created or datetime.now()).strftime(CREATED_FORMAT), song_ids)
+
+
+def create_playlists(specs, songs=None, song_index=None, created=None):
+    """
+    Create immutable playlist records for many (name, song_ids) pairs.
+
+    Either songs or a prebuilt song_index must be given; passing the same
+    song_index to repeated batches avoids rebuilding it.
+
+    Args:
+        specs (iterable): (name, song_ids) pairs, one per playlist
+        songs (list): List of all available songs
+        song_index (dict): Index returned by build_song_index
+        created (datetime): Timestamp for the batch, defaults to now
+
+    Returns:
+        list: Playlist tuples (name, created, song_ids)
+    """
+    if specs is None:
+        raise ValueError("Playlist specs cannot be None")
+    if song_index is None:
+        song_index = build_song_index(songs)
+    stamp = (created or datetime.now()).strftime(CREATED_FORMAT)
+
+    playlists = []
+    for position, spec in enumerate(specs):
+        try:
+            name, song_ids = spec
+        except (TypeError, ValueError):
+            raise ValueError(f"Playlist spec {position} must be a (name, song_ids) pair") from None
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"Playlist spec {position} has an empty name")
+        if not isinstance(song_ids, (list, tuple)) or not song_ids:
+            raise ValueError(f"Playlist '{name}' must contain at least one song ID")
+        try:
+            # Reusing the catalog's ID strings keeps large batches compact
+            resolved = tuple([song_index[song_id] for song_id in song_ids])
+        except (KeyError, TypeError):
+            missing = [song_id for song_id in song_ids
+                       if not isinstance(song_id, str) or song_id not in song_index]
+            raise ValueError(f"Playlist '{name}' has unknown song IDs: {missing}") from None
+        playlists.append((name, stamp, resolved))
+    return playlists
@@ -0,0 +1,236 @@
+"""
+Playlist Command Line
+Non-interactive access to the playlist system for scripts and bulk jobs.
+The catalog is read from a CSV or JSON-lines file (the formats written by
+catalog_generator.py) and results stream to stdout as CSV or JSON lines.
+
+    python playlist_cli.py --catalog songs.csv filter genre rock
+    python playlist_cli.py --catalog songs.csv --format jsonl sort year
+    python playlist_cli.py --catalog songs.csv stats
+    python playlist_cli.py --catalog songs.csv create-playlist "Road Trip" S001 S004
+    python playlist_cli.py --catalog songs.csv integrate new_releases.csv
+    python playlist_cli.py --catalog songs.csv run commands.txt
+
+A commands file holds one command per line (anything after the global
+options above, e.g. "filter decade 1980"); blank lines and lines starting
+with # are skipped. All commands share one loaded catalog, and integrate
+updates it for the commands that follow.
+"""
+
+import argparse
+import csv
+import json
+import shlex
+import sys
+
+import skeleton
+from skeleton import SONG_FIELDS
+
+
+class CommandError(ValueError):
+    """Raised instead of exiting when a command line cannot be parsed."""
+
+
+class _Parser(argparse.ArgumentParser):
+    def error(self, message):
+        raise CommandError(message)
+
+
+def read_songs(path):
+    """
+    Read song tuples from a CSV (with header) or JSON-lines file.
+
+    Args:
+        path (str): File path; ".jsonl" and ".json" are read as JSON lines
+
+    Returns:
+        list: List of song tuples
+    """
+    songs = []
+    with open(path, newline="") as f:
+        if path.endswith((".jsonl", ".json")):
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is not None and tuple(header) != SONG_FIELDS:
+                raise ValueError(f"Unexpected CSV header in {path}: {header}")
+            rows = reader
+        for line_number, row in enumerate(rows, start=1):
+            if len(row) != len(SONG_FIELDS):
+                raise ValueError(f"{path}: record {line_number} has {len(row)} fields")
+            id, title, artist, genre, duration, release_year, album = row
+            songs.append((id, title, artist, genre, int(duration), int(release_year), album))
+    return songs
+
+
+class _Writer:
+    """Streams rows as CSV or JSON lines."""
+
+    def __init__(self, output, fmt):
+        self.output = output
+        self.fmt = fmt
+        self._csv = csv.writer(output) if fmt == "csv" else None
+
+    def row(self, values):
+        if self._csv is not None:
+            self._csv.writerow(values)
+        else:
+            self.output.write(json.dumps(values) + "\n")
+
+    def record(self, mapping):
+        if self._csv is not None:
+            self._csv.writerow(mapping.values())
+        else:
+            self.output.write(json.dumps(mapping) + "\n")
+
+
+class Session:
+    """
+    Catalog state shared by every command in one process.
+
+    Args:
+        songs (list): List of song tuples
+        writer (_Writer): Output writer
+    """
+
+    def __init__(self, songs, writer):
+        self.songs = songs
+        self.writer = writer
+        self.playlists = []
+
+    @property
+    def genres(self):
+        return tuple(sorted({song[3] for song in self.songs}))
+
+    def write_songs(self, songs):
+        for song in songs or ():
+            self.writer.row(song)
+
+    def filter(self, args):
+        if args.field == "genre":
+            result = skeleton.filter_by_genre(self.songs, args.values[0])
+        elif args.field == "artist":
+            result = skeleton.filter_by_artist(self.songs, args.values[0])
+        elif args.field == "duration":
+            if len(args.values) != 2:
+                raise CommandError("filter duration needs MIN MAX")
+            result = skeleton.filter_by_duration(self.songs, int(args.values[0]), int(args.values[1]))
+        else:
+            result = skeleton.filter_by_decade(self.songs, int(args.values[0]))
+        self.write_songs(result)
+
+    def sort(self, args):
+        self.write_songs(skeleton.sort_songs(self.songs, args.key))
+
+    def stats(self, args):
+        distribution = skeleton.calculate_genre_distribution(self.songs, self.genres) or {}
+        for genre, count in distribution.items():
+            self.writer.record({"stat": "genre", "key": genre, "value": count})
+        total = skeleton.calculate_total_duration(self.songs)
+        if total is not None:
+            hours, minutes, seconds = total
+            self.writer.record({"stat": "total_duration", "key": "h:m:s",
+                                "value": f"{hours}:{minutes:02d}:{seconds:02d}"})
+        self.writer.record({"stat": "songs", "key": "count", "value": len(self.songs)})
+
+    def create_playlist(self, args):
+        playlist = skeleton.create_playlist(args.name, args.song_ids, self.songs)
+        if playlist is None:
+            return
+        self.playlists.append(playlist)
+        name, created, song_ids = playlist
+        self.writer.record({"name": name, "created": str(created), "song_ids": " ".join(song_ids)})
+
+    def integrate(self, args):
+        combined = skeleton.integrate_new_releases(self.songs, read_songs(args.releases))
+        if combined is not None:
+            self.songs = combined
+        self.writer.record({"stat": "songs", "key": "count", "value": len(self.songs)})
+
+    def run(self, args):
+        parser = build_parser(commands_only=True)
+        with open(args.commands) as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    command = parser.parse_args(shlex.split(line))
+                    if command.command == "run":
+                        raise CommandError("run cannot be nested")
+                    getattr(self, command.handler)(command)
+                except (ValueError, OSError) as e:
+                    raise CommandError(f"{args.commands}:{line_number}: {e}") from None
+
+
+def build_parser(commands_only=False):
+    """
+    Build the argument parser.
+
+    Args:
+        commands_only (bool): Leave out the global options, for commands files
+
+    Returns:
+        argparse.ArgumentParser: Configured parser
+    """
+    parser = _Parser(prog="playlist_cli.py", description="Scripted music playlist operations")
+    if not commands_only:
+        parser.add_argument("--catalog", help="CSV or JSON-lines catalog (default: initialize_data)")
+        parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+        parser.add_argument("--output", help="write results here instead of stdout")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("filter", help="filter songs")
+    command.add_argument("field", choices=("genre", "artist", "duration", "decade"))
+    command.add_argument("values", nargs="+")
+    command.set_defaults(handler="filter")
+
+    command = commands.add_parser("sort", help="sort songs")
+    command.add_argument("key", choices=tuple(skeleton.SORT_KEYS))
+    command.set_defaults(handler="sort")
+
+    command = commands.add_parser("stats", help="genre distribution and total duration")
+    command.set_defaults(handler="stats")
+
+    command = commands.add_parser("create-playlist", help="create a playlist from song IDs")
+    command.add_argument("name")
+    command.add_argument("song_ids", nargs="+")
+    command.set_defaults(handler="create_playlist")
+
+    command = commands.add_parser("integrate", help="add new releases from a catalog file")
+    command.add_argument("releases")
+    command.set_defaults(handler="integrate")
+
+    command = commands.add_parser("run", help="execute a file of commands")
+    command.add_argument("commands")
+    command.set_defaults(handler="run")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+        if args.catalog:
+            songs = read_songs(args.catalog)
+        else:
+            data = skeleton.initialize_data()
+            if data is None:
+                raise CommandError("initialize_data returned no catalog; pass --catalog")
+            songs = data[0]
+        output = open(args.output, "w", newline="") if args.output else sys.stdout
+        try:
+            session = Session(songs, _Writer(output, args.format))
+            getattr(session, args.handler)(args)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+    except (ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Playlist Service
+Asyncio front-end exposing the playlist system over a local TCP or Unix
+socket. Clients send one JSON object per line and receive one JSON object
+per line in reply:
+
+    {"id": 1, "op": "filter_by_genre", "args": {"genre": "rock"}}
+    {"id": 1, "ok": true, "result": [["S001", "Bohemian Rhapsody", ...]]}
+
+Requests on one connection run concurrently and replies carry the request
+id. Filter, sort and statistics work runs in an executor so a slow query
+does not hold up other clients.
+"""
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import skeleton
+
+
+class PlaylistService:
+    """
+    Request dispatcher holding the current catalog and playlists.
+
+    Args:
+        songs (list): List of song tuples
+        genres (tuple): Tuple of valid genres
+        executor (Executor): Executor for CPU-heavy operations
+    """
+
+    def __init__(self, songs, genres, executor=None):
+        if songs is None or genres is None:
+            raise ValueError("Songs and genres are required")
+        self.songs = list(songs)
+        self.genres = tuple(genres)
+        self.playlists = []
+        self._executor = executor or ThreadPoolExecutor()
+        self._write_lock = asyncio.Lock()
+        # op name -> (handler, runs in executor)
+        self._ops = {
+            "filter_by_genre": (self._filter_by_genre, True),
+            "filter_by_artist": (self._filter_by_artist, True),
+            "filter_by_duration": (self._filter_by_duration, True),
+            "filter_by_decade": (self._filter_by_decade, True),
+            "sort_songs": (self._sort_songs, True),
+            "genre_distribution": (self._genre_distribution, True),
+            "total_duration": (self._total_duration, True),
+            "list_songs": (self._list_songs, False),
+            "list_playlists": (self._list_playlists, False),
+            "create_playlist": (self._create_playlist, False),
+            "integrate_new_releases": (self._integrate_new_releases, False),
+        }
+
+    # Read operations receive a snapshot of the song list so a concurrent
+    # update cannot change the data mid-query.
+
+    def _filter_by_genre(self, songs, genre):
+        return skeleton.filter_by_genre(songs, genre)
+
+    def _filter_by_artist(self, songs, artist):
+        return skeleton.filter_by_artist(songs, artist)
+
+    def _filter_by_duration(self, songs, min_duration, max_duration):
+        return skeleton.filter_by_duration(songs, min_duration, max_duration)
+
+    def _filter_by_decade(self, songs, decade):
+        return skeleton.filter_by_decade(songs, decade)
+
+    def _sort_songs(self, songs, sort_key):
+        return skeleton.sort_songs(songs, sort_key)
+
+    def _genre_distribution(self, songs):
+        return skeleton.calculate_genre_distribution(songs, self.genres)
+
+    def _total_duration(self, songs):
+        return skeleton.calculate_total_duration(songs)
+
+    def _list_songs(self, songs):
+        return songs
+
+    def _list_playlists(self, songs):
+        return self.playlists
+
+    async def _create_playlist(self, songs, name, song_ids):
+        async with self._write_lock:
+            playlist = skeleton.create_playlist(name, song_ids, self.songs)
+            self.playlists = self.playlists + [playlist]
+        return playlist
+
+    async def _integrate_new_releases(self, songs, new_releases):
+        new_releases = [tuple(release) for release in new_releases]
+        async with self._write_lock:
+            self.songs = skeleton.integrate_new_releases(self.songs, new_releases)
+            return len(self.songs)
+
+    async def handle_request(self, request):
+        """
+        Execute one decoded request.
+
+        Args:
+            request (dict): Request with "op" and optional "id" and "args"
+
+        Returns:
+            dict: Response with "ok" and either "result" or "error"
+        """
+        response = {"id": request.get("id") if isinstance(request, dict) else None}
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            op = request.get("op")
+            if op not in self._ops:
+                raise ValueError(f"Unknown operation: {op}")
+            args = request.get("args") or {}
+            if not isinstance(args, dict):
+                raise ValueError("args must be a JSON object")
+            handler, offload = self._ops[op]
+            songs = self.songs
+            if offload:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._executor, lambda: handler(songs, **args))
+            else:
+                result = handler(songs, **args)
+                if asyncio.iscoroutine(result):
+                    result = await result
+            response["ok"] = True
+            response["result"] = result
+        except (ValueError, TypeError) as e:
+            response["ok"] = False
+            response["error"] = str(e)
+        except Exception as e:
+            # Any failure still gets a reply, or the client waits forever for this id
+            response["ok"] = False
+            response["error"] = f"{type(e).__name__}: {e}"
+        return response
+
+    async def _respond(self, line, writer):
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {"id": None, "ok": False, "error": f"Invalid JSON: {e}"}
+        else:
+            response = await self.handle_request(request)
+        try:
+            # Results such as datetimes are sent as their string form
+            data = json.dumps(response, default=str)
+        except (ValueError, TypeError) as e:
+            data = json.dumps({"id": response["id"], "ok": False, "error": f"Unencodable result: {e}"},
+                              default=str)
+        writer.write(data.encode() + b"\n")
+        await writer.drain()
+
+    async def handle_client(self, reader, writer):
+        """Serve one client connection until it closes."""
+        tasks = set()
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765, unix_path=None):
+        """
+        Accept clients until cancelled.
+
+        Args:
+            host (str): TCP host to bind
+            port (int): TCP port to bind
+            unix_path (str): Unix socket path, used instead of TCP when given
+        """
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=unix_path)
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    """Start the service with the data from initialize_data."""
+    parser = argparse.ArgumentParser(description="Music playlist JSON-lines service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="serve on a Unix socket path instead of TCP")
+    args = parser.parse_args()
+
+    songs, new_releases, genres = skeleton.initialize_data()
+    service = PlaylistService(songs, genres)
+    try:
+        asyncio.run(service.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""
+Persistent Playlist Vector
+An immutable sequence of song IDs whose edited versions share storage.
+Songs are kept in small chunks at the leaves of a balanced tree, so adding,
+removing or moving a song copies only one chunk and the path above it
+instead of the whole song_ids tuple.
+"""
+
+from collections.abc import Sequence
+
+# Maximum number of song IDs stored in one leaf chunk
+CHUNK_SIZE = 32
+
+
+class _Node:
+    """Tree node; leaves hold a tuple of items, branches hold two children."""
+
+    __slots__ = ("left", "right", "items", "size", "height")
+
+    def __init__(self, left=None, right=None, items=None):
+        self.left = left
+        self.right = right
+        self.items = items
+        if items is not None:
+            self.size = len(items)
+            self.height = 1
+        else:
+            self.size = left.size + right.size
+            self.height = max(left.height, right.height) + 1
+
+
+def _leaf(items):
+    return _Node(items=tuple(items)) if items else None
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _balance(left, right):
+    """Join two subtrees whose heights differ by at most two."""
+    if left.height > right.height + 1:
+        if _height(left.left) >= _height(left.right):
+            return _Node(left.left, _Node(left.right, right))
+        inner = left.right
+        return _Node(_Node(left.left, inner.left), _Node(inner.right, right))
+    if right.height > left.height + 1:
+        if _height(right.right) >= _height(right.left):
+            return _Node(_Node(left, right.left), right.right)
+        inner = right.left
+        return _Node(_Node(left, inner.left), _Node(inner.right, right.right))
+    return _Node(left, right)
+
+
+def _first_leaf(node):
+    while node.items is None:
+        node = node.left
+    return node
+
+
+def _last_leaf(node):
+    while node.items is None:
+        node = node.right
+    return node
+
+
+def _with_last_leaf(node, items):
+    """Copy the right spine, replacing the last leaf's items; heights are unchanged."""
+    if node.items is not None:
+        return _Node(items=items)
+    return _Node(node.left, _with_last_leaf(node.right, items))
+
+
+def _without_first_leaf(node):
+    """Remove the first leaf, rebalancing on the way up."""
+    if node.items is not None:
+        return None
+    if node.left.items is not None:
+        return node.right
+    return _balance(_without_first_leaf(node.left), node.right)
+
+
+def _concat(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    # Merge the two leaves that meet at the join when they fit in one chunk,
+    # so repeated appends and edits do not leave a trail of tiny leaves
+    last, first = _last_leaf(left), _first_leaf(right)
+    if last.size + first.size <= CHUNK_SIZE:
+        left = _with_last_leaf(left, last.items + first.items)
+        right = _without_first_leaf(right)
+        if right is None:
+            return left
+    return _join(left, right)
+
+
+def _join(left, right):
+    if left.height > right.height + 1:
+        return _balance(left.left, _join(left.right, right))
+    if right.height > left.height + 1:
+        return _balance(_join(left, right.left), right.right)
+    return _Node(left, right)
+
+
+def _split(node, index):
+    """Split a tree into the first index items and the rest."""
+    if node is None:
+        return None, None
+    if index <= 0:
+        return None, node
+    if index >= node.size:
+        return node, None
+    if node.items is not None:
+        return _leaf(node.items[:index]), _leaf(node.items[index:])
+    left_size = node.left.size
+    if index < left_size:
+        head, tail = _split(node.left, index)
+        return head, _concat(tail, node.right)
+    if index == left_size:
+        return node.left, node.right
+    head, tail = _split(node.right, index - left_size)
+    return _concat(node.left, head), tail
+
+
+def _replace(node, index, value):
+    """Copy the path to one item, replacing it with value."""
+    if node.items is not None:
+        items = node.items
+        return _Node(items=items[:index] + (value,) + items[index + 1:])
+    if index < node.left.size:
+        return _Node(_replace(node.left, index, value), node.right)
+    return _Node(node.left, _replace(node.right, index - node.left.size, value))
+
+
+def _build(items):
+    """Build a balanced tree from an iterable in linear time."""
+    items = tuple(items)
+    level = [_Node(items=items[i:i + CHUNK_SIZE]) for i in range(0, len(items), CHUNK_SIZE)]
+    if not level:
+        return None
+    while len(level) > 1:
+        paired = [_Node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired[-1] = _concat(paired[-1], level[-1])
+        level = paired
+    return level[0]
+
+
+class PersistentPlaylist(Sequence):
+    """
+    Immutable, structurally shared sequence of song IDs.
+
+    Reads behave like a tuple (indexing, slicing, iteration, len, in,
+    index, count, equality with tuples). Every edit returns a new
+    PersistentPlaylist and leaves the original untouched.
+
+    Args:
+        song_ids (iterable): Initial song IDs
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, song_ids=()):
+        self._root = _build(song_ids)
+
+    @classmethod
+    def _from_root(cls, root):
+        playlist = cls.__new__(cls)
+        playlist._root = root
+        return playlist
+
+    def __len__(self):
+        return self._root.size if self._root is not None else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                if start >= stop:
+                    return PersistentPlaylist()
+                head, _ = _split(self._root, stop)
+                _, middle = _split(head, start)
+                return self._from_root(middle)
+            return PersistentPlaylist(self[i] for i in range(start, stop, step))
+        if not isinstance(index, int):
+            raise TypeError("Playlist indices must be integers or slices")
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Playlist index out of range")
+        node = self._root
+        while node.items is None:
+            if index < node.left.size:
+                node = node.left
+            else:
+                index -= node.left.size
+                node = node.right
+        return node.items[index]
+
+    def __iter__(self):
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.items is not None:
+                yield from node.items
+            else:
+                stack.append(node.right)
+                stack.append(node.left)
+
+    def __contains__(self, song_id):
+        return any(item == song_id for item in self)
+
+    def index(self, song_id, start=0, stop=None):
+        for position, item in enumerate(self):
+            if stop is not None and position >= stop:
+                break
+            if position >= start and item == song_id:
+                return position
+        raise ValueError(f"{song_id!r} is not in playlist")
+
+    def __eq__(self, other):
+        if isinstance(other, (PersistentPlaylist, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.to_tuple())
+
+    def __add__(self, other):
+        if not isinstance(other, PersistentPlaylist):
+            other = PersistentPlaylist(other)
+        return self._from_root(_concat(self._root, other._root))
+
+    def __repr__(self):
+        return f"PersistentPlaylist({self.to_tuple()!r})"
+
+    def _check_position(self, index, allow_end=False):
+        size = len(self)
+        if not isinstance(index, int):
+            raise ValueError("Position must be an integer")
+        if index < 0:
+            index += size
+        limit = size if allow_end else size - 1
+        if not 0 <= index <= limit:
+            raise ValueError(f"Position {index} out of range")
+        return index
+
+    def to_tuple(self):
+        """
+        Materialize the playlist as a plain tuple.
+
+        Returns:
+            tuple: Song IDs in order
+        """
+        return tuple(self)
+
+    def append(self, song_id):
+        """
+        Add a song at the end.
+
+        Args:
+            song_id (str): Song ID to add
+
+        Returns:
+            PersistentPlaylist: New playlist version
+        """
+        return self._from_root(_concat(self._root, _leaf((song_id,))))
+
+    def insert(self, index, song_id):
+        """
+        Insert a song before the given position.
+
+        Args:
+            index (int): Position to insert at
+            song_id (str): Song ID to insert
+
+        Returns:
+            PersistentPlaylist: New playlist version
+        """
+        index = self._check_position(index, allow_end=True)
+        head, tail = _split(self._root, index)
+        return self._from_root(_concat(_concat(head, _leaf((song_id,))), tail))
+
+    def delete(self, index):
+        """
+        Remove the song at the given position.
+
+        Args:
+            index (int): Position to remove
+
+        Returns:
+            PersistentPlaylist: New playlist version
+        """
+        index = self._check_position(index)
+        head, tail = _split(self._root, index)
+        _, tail = _split(tail, 1)
+        return self._from_root(_concat(head, tail))
+
+    def remove(self, song_id):
+        """
+        Remove the first occurrence of a song ID.
+
+        Args:
+            song_id (str): Song ID to remove
+
+        Returns:
+            PersistentPlaylist: New playlist version
+        """
+        try:
+            return self.delete(self.index(song_id))
+        except ValueError:
+            raise ValueError(f"Song ID {song_id} not in playlist") from None
+
+    def set(self, index, song_id):
+        """
+        Replace the song at the given position.
+
+        Args:
+            index (int): Position to replace
+            song_id (str): New song ID
+
+        Returns:
+            PersistentPlaylist: New playlist version
+        """
+        index = self._check_position(index)
+        return self._from_root(_replace(self._root, index, song_id))
+
+    def move(self, source, destination):
+        """
+        Move a song to a new position.
+
+        Args:
+            source (int): Current position of the song
+            destination (int): Position the song should end up at
+
+        Returns:
+            PersistentPlaylist: New playlist version
+        """
+        source = self._check_position(source)
+        destination = self._check_position(destination)
+        song_id = self[source]
+        return self.delete(source).insert(destination, song_id)
+
+
+def as_persistent(playlist):
+    """
+    Convert a create_playlist record to use a PersistentPlaylist for its songs.
+
+    Args:
+        playlist (tuple): Playlist tuple (name, created, song_ids)
+
+    Returns:
+        tuple: Playlist tuple with song_ids as a PersistentPlaylist
+    """
+    if not isinstance(playlist, tuple) or len(playlist) != 3:
+        raise ValueError("Playlist must be a (name, created, song_ids) tuple")
+    name, created, song_ids = playlist
+    if not isinstance(song_ids, PersistentPlaylist):
+        song_ids = PersistentPlaylist(song_ids)
+    return (name, created, song_ids)
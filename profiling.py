@@ -0,0 +1,98 @@
+"""
+Menu Profiling
+Profiling mode for the interactive menu in skeleton.main(). When enabled
+with --profile DIR or the PLAYLIST_PROFILE environment variable, each menu
+action runs under cProfile and tracemalloc and its reports are written to DIR:
+
+    <n>_action-<choice>.prof        raw cProfile data (open with pstats or snakeviz)
+    <n>_action-<choice>.txt         functions sorted by cumulative time
+    <n>_action-<choice>_alloc.txt   peak memory and top allocation sites
+"""
+
+import contextlib
+import os
+import time
+
+PROFILE_ENV = "PLAYLIST_PROFILE"
+
+_action_count = 0
+
+
+def profile_dir_from_args(argv):
+    """
+    Find the profile output directory requested on the command line or environment.
+
+    Args:
+        argv (list): Command-line arguments, without the program name
+
+    Returns:
+        str: Output directory, or None when profiling is off
+    """
+    for position, arg in enumerate(argv):
+        if arg == "--profile":
+            if position + 1 >= len(argv):
+                raise ValueError("--profile requires a directory")
+            return argv[position + 1]
+        if arg.startswith("--profile="):
+            return arg.split("=", 1)[1]
+    return os.environ.get(PROFILE_ENV) or None
+
+
+@contextlib.contextmanager
+def profile_action(action, profile_dir):
+    """
+    Profile the body of a with-block as one menu action.
+
+    Does nothing when profile_dir is None, so the menu pays no cost unless
+    profiling was requested.
+
+    Args:
+        action (str): Menu choice being handled
+        profile_dir (str): Directory for the reports, or None
+    """
+    if not profile_dir:
+        yield
+        return
+
+    # Imported here so normal runs never load the profilers
+    import cProfile
+    import io
+    import pstats
+    import re
+    import tracemalloc
+
+    global _action_count
+    _action_count += 1
+    os.makedirs(profile_dir, exist_ok=True)
+    label = re.sub(r"[^A-Za-z0-9_-]", "_", str(action).strip()) or "empty"
+    base = os.path.join(profile_dir, f"{_action_count:03d}_action-{label}")
+
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        elapsed = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        # Leave out the profiler's own bookkeeping
+        allocations = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, contextlib.__file__),
+        )).statistics("lineno")
+        tracemalloc.stop()
+
+        profiler.dump_stats(base + ".prof")
+        report = io.StringIO()
+        report.write(f"Action {action!r}: {elapsed:.4f}s wall time\n\n")
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(30)
+        with open(base + ".txt", "w") as f:
+            f.write(report.getvalue())
+
+        with open(base + "_alloc.txt", "w") as f:
+            f.write(f"Action {action!r}: peak {peak / 1024:.1f} KiB, "
+                    f"still allocated {current / 1024:.1f} KiB\n\n")
+            for stat in allocations[:25]:
+                f.write(f"{stat}\n")
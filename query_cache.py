@@ -0,0 +1,182 @@
+"""
+Query Result Cache
+Bounded cache for repeated filter and sort queries. Entries are keyed by
+the function, its arguments and the catalog version, and are
+evicted least-recently-used first when the entry or result-size budget is
+exceeded, or when older than a TTL. CachedCatalog ties the cache to a
+SharedCatalog so integrating new releases invalidates stale results
+automatically.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import skeleton
+from catalog_snapshot import SharedCatalog
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache with size- and TTL-based eviction.
+
+    Args:
+        max_entries (int): Most cached results
+        max_items (int): Most song tuples held across all cached results
+        ttl (float): Seconds a result stays valid, None for no expiry
+        clock (callable): Time source, for tests
+    """
+
+    def __init__(self, max_entries=1024, max_items=1_000_000, ttl=300.0, clock=time.monotonic):
+        if max_entries < 1 or max_items < 1:
+            raise ValueError("Cache limits must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive or None")
+        self.max_entries = max_entries
+        self.max_items = max_items
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, size, result)
+        self._items = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._items -= size
+
+    def get_or_compute(self, name, args, version, compute):
+        """
+        Return a cached result, computing and storing it on a miss.
+
+        Args:
+            name (str): Query name, e.g. "filter_by_genre"
+            args (tuple): Query arguments, compared as given: the cache must not
+                merge queries the function itself may answer differently
+            version (int): Catalog version the result belongs to
+            compute (callable): Produces the result on a miss
+
+        Returns:
+            list: Copy of the result
+        """
+        # Types are part of the key: 1990 == 1990.0 and 1 == True, but the
+        # function may validate or treat them differently
+        key = (name, tuple((type(arg), arg) for arg in args), version)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] is not None and entry[0] <= now:
+                    self._drop(key)
+                    self.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return list(entry[2])
+            self.misses += 1
+
+        result = compute()
+        if result is None:
+            return result
+        size = len(result)
+        if size > self.max_items:
+            return list(result)
+        expires = now + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (expires, size, tuple(result))
+            self._items += size
+            while len(self._entries) > self.max_entries or self._items > self.max_items:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return list(result)
+
+    def invalidate(self, before_version=None):
+        """
+        Drop cached results.
+
+        Args:
+            before_version (int): Only drop results for older catalog versions;
+                None drops everything
+        """
+        with self._lock:
+            stale = [key for key in self._entries if before_version is None or key[2] < before_version]
+            for key in stale:
+                self._drop(key)
+            self.invalidations += len(stale)
+
+    def stats(self):
+        """
+        Counters for monitoring.
+
+        Returns:
+            dict: hits, misses, evictions, expirations, invalidations,
+            entries, items and hit_ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "items": self._items,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class CachedCatalog:
+    """
+    SharedCatalog whose filter and sort queries go through a QueryCache.
+
+    Args:
+        songs (list): Initial list of song tuples
+        genres (tuple): Tuple of valid genres
+        cache (QueryCache): Cache to use, a default one if omitted
+    """
+
+    def __init__(self, songs, genres, cache=None):
+        self.catalog = SharedCatalog(songs, genres)
+        self.cache = cache or QueryCache()
+
+    def _query(self, name, *args):
+        snapshot = self.catalog.snapshot()
+        func = getattr(skeleton, name)
+        return self.cache.get_or_compute(name, args, snapshot.version,
+                                         lambda: func(list(snapshot.songs), *args))
+
+    def filter_by_genre(self, genre):
+        return self._query("filter_by_genre", genre)
+
+    def filter_by_artist(self, artist):
+        return self._query("filter_by_artist", artist)
+
+    def filter_by_duration(self, min_duration, max_duration):
+        return self._query("filter_by_duration", min_duration, max_duration)
+
+    def filter_by_decade(self, decade):
+        return self._query("filter_by_decade", decade)
+
+    def sort_songs(self, sort_key):
+        return self._query("sort_songs", sort_key)
+
+    def integrate_new_releases(self, new_releases):
+        """
+        Add new releases and invalidate results cached for older versions.
+
+        Args:
+            new_releases (list): List of new release tuples
+
+        Returns:
+            CatalogSnapshot: The published snapshot
+        """
+        snapshot = self.catalog.integrate_new_releases(new_releases)
+        self.cache.invalidate(before_version=snapshot.version)
+        return snapshot
@@ -0,0 +1,196 @@
+"""
+Full-Text Song Search
+Tokenized inverted index over song titles, artists and albums with
+prefix matching for autocomplete. Songs can be added incrementally, e.g.
+right after integrate_new_releases, without rebuilding the index.
+"""
+
+import heapq
+import re
+from bisect import bisect_left
+
+from skeleton import SONG_FIELDS
+from song_keys import normalize_key
+
+# Field name -> (song tuple position, bit flag, score weight)
+SEARCH_FIELDS = {
+    "title": (SONG_FIELDS.index("title"), 1, 3.0),
+    "artist": (SONG_FIELDS.index("artist"), 2, 2.0),
+    "album": (SONG_FIELDS.index("album"), 4, 1.0),
+}
+
+# A prefix match scores this fraction of a whole-word match
+PREFIX_FACTOR = 0.6
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """
+    Split text into normalized search tokens.
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        list: Casefolded, NFKC-normalized word tokens
+    """
+    return _TOKEN.findall(normalize_key(text))
+
+
+class SearchIndex:
+    """
+    Inverted index from word tokens to the songs and fields containing them.
+
+    Args:
+        songs (list): Initial list of song tuples
+    """
+
+    def __init__(self, songs=()):
+        self.songs = []
+        self._postings = {}      # token -> {row: field bit mask}
+        self._vocabulary = []    # sorted tokens, for prefix lookups
+        self._pending = set()    # new tokens not yet merged into _vocabulary
+        self.add_songs(songs)
+
+    def __len__(self):
+        return len(self.songs)
+
+    def add_songs(self, songs):
+        """
+        Index additional songs.
+
+        Args:
+            songs (list): Song tuples to append to the index
+        """
+        if songs is None:
+            raise ValueError("Songs cannot be None")
+        postings = self._postings
+        for song in songs:
+            row = len(self.songs)
+            self.songs.append(song)
+            for position, flag, _ in SEARCH_FIELDS.values():
+                for token in tokenize(song[position]):
+                    rows = postings.get(token)
+                    if rows is None:
+                        rows = postings[token] = {}
+                        self._pending.add(token)
+                    rows[row] = rows.get(row, 0) | flag
+
+    def _prefix_tokens(self, prefix):
+        if self._pending:
+            # Sorting a sorted list with a sorted tail appended is a linear merge
+            self._vocabulary.extend(sorted(self._pending))
+            self._vocabulary.sort()
+            self._pending.clear()
+        vocabulary = self._vocabulary
+        tokens = []
+        for i in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            if not vocabulary[i].startswith(prefix):
+                break
+            tokens.append(vocabulary[i])
+        return tokens
+
+    def _sources(self, term, prefix):
+        """Posting lists matching one query term, each with its score factor."""
+        sources = []
+        if term in self._postings:
+            sources.append((self._postings[term], 1.0))
+        if prefix:
+            sources.extend((self._postings[token], PREFIX_FACTOR)
+                           for token in self._prefix_tokens(term) if token != term)
+        return sources
+
+    def search(self, query, limit=20, prefix=True):
+        """
+        Find songs whose title, artist or album contain every query word.
+
+        Title matches outrank artist matches, which outrank album matches,
+        and whole-word matches outrank prefix matches.
+
+        Args:
+            query (str): Search text
+            limit (int): Maximum number of results
+            prefix (bool): Treat the last word as a prefix, for autocomplete
+
+        Returns:
+            list: Song tuples, best match first
+        """
+        if not isinstance(query, str):
+            raise ValueError("Query must be a string")
+        if not isinstance(limit, int) or limit < 1:
+            raise ValueError("Limit must be a positive integer")
+        terms = tokenize(query)
+        if not terms:
+            return []
+        per_term = [
+            self._sources(term, prefix and i == len(terms) - 1)
+            for i, term in enumerate(terms)
+        ]
+        # Start from the most selective term and only probe its matches for the rest
+        per_term.sort(key=lambda sources: sum(len(rows) for rows, _ in sources))
+
+        totals = {}
+        for rows, factor in per_term[0]:
+            for row, mask in rows.items():
+                score = _mask_weight(mask) * factor
+                if score > totals.get(row, 0.0):
+                    totals[row] = score
+        for sources in per_term[1:]:
+            narrowed = {}
+            if len(totals) * len(sources) > sum(len(rows) for rows, _ in sources):
+                # A short prefix can expand to many words: score their rows once
+                # instead of probing every candidate in every posting list
+                best_scores = {}
+                for rows, factor in sources:
+                    for row, mask in rows.items():
+                        score = _mask_weight(mask) * factor
+                        if score > best_scores.get(row, 0.0):
+                            best_scores[row] = score
+                for row, total in totals.items():
+                    best = best_scores.get(row)
+                    if best:
+                        narrowed[row] = total + best
+            else:
+                for row, total in totals.items():
+                    best = 0.0
+                    for rows, factor in sources:
+                        mask = rows.get(row)
+                        if mask:
+                            best = max(best, _mask_weight(mask) * factor)
+                    if best:
+                        narrowed[row] = total + best
+            totals = narrowed
+            if not totals:
+                return []
+        ranked = heapq.nsmallest(limit, totals.items(), key=lambda item: (-item[1], item[0]))
+        return [self.songs[row] for row, _ in ranked]
+
+    def complete(self, prefix, limit=10):
+        """
+        Suggest indexed words starting with prefix, most common first.
+
+        Args:
+            prefix (str): Beginning of a word
+            limit (int): Maximum number of suggestions
+
+        Returns:
+            list: Suggested words
+        """
+        terms = tokenize(prefix)
+        if not terms:
+            return []
+        tokens = self._prefix_tokens(terms[-1])
+        tokens.sort(key=lambda token: (-len(self._postings[token]), token))
+        return tokens[:limit]
+
+
+# Best field weight for every possible field bit mask
+_MASK_WEIGHTS = [
+    max((weight for _, flag, weight in SEARCH_FIELDS.values() if mask & flag), default=0.0)
+    for mask in range(1 << len(SEARCH_FIELDS))
+]
+
+
+def _mask_weight(mask):
+    return _MASK_WEIGHTS[mask]
@@ -0,0 +1,129 @@
+"""
+Playlist Shuffling
+Lazy shuffle iterators for large playlists. None of them copies and
+shuffles the song_ids tuple up front:
+
+- shuffled: Fisher-Yates over a compact index array, one swap per song played
+- permuted: a keyed pseudo-random permutation needing O(1) extra memory
+- smart_shuffled: spreads each artist's songs out so the same artist does
+  not play twice in a row whenever that is possible
+"""
+
+import heapq
+import random
+from array import array
+
+from skeleton import SONG_FIELDS
+
+_ARTIST = SONG_FIELDS.index("artist")
+
+
+def shuffled(song_ids, seed=None):
+    """
+    Yield song IDs in random order, shuffling one step per song yielded.
+
+    Args:
+        song_ids (tuple): Playlist song IDs
+        seed (int): Random seed, None for a different order each time
+
+    Yields:
+        str: Song IDs
+    """
+    rng = random.Random(seed)
+    count = len(song_ids)
+    order = array("I" if count < 2 ** 32 else "Q", range(count))
+    for i in range(count):
+        j = rng.randrange(i, count)
+        order[i], order[j] = order[j], order[i]
+        yield song_ids[order[i]]
+
+
+def _feistel(value, bits, keys):
+    """Bijection on [0, 2**bits) built from a balanced Feistel network."""
+    half = (bits + 1) // 2
+    mask = (1 << half) - 1
+    left, right = value >> half, value & mask
+    for key in keys:
+        left, right = right, left ^ (hash((right, key)) & mask)
+    return (left << half) | right
+
+
+def permuted(song_ids, seed=None):
+    """
+    Yield song IDs in a pseudo-random order using O(1) extra memory.
+
+    Positions are mapped through a keyed Feistel permutation; values that
+    land past the end of the playlist are mapped again until they fit.
+
+    Args:
+        song_ids (tuple): Playlist song IDs
+        seed (int): Random seed, None for a different order each time
+
+    Yields:
+        str: Song IDs
+    """
+    count = len(song_ids)
+    if count == 0:
+        return
+    rng = random.Random(seed)
+    keys = tuple(rng.getrandbits(64) for _ in range(4))
+    # An even bit width keeps both Feistel halves the same size
+    bits = max(2, (count - 1).bit_length())
+    bits += bits % 2
+    for i in range(count):
+        position = _feistel(i, bits, keys)
+        while position >= count:
+            position = _feistel(position, bits, keys)
+        yield song_ids[position]
+
+
+def smart_shuffled(song_ids, songs, seed=None):
+    """
+    Yield song IDs in random order, avoiding back-to-back songs by one artist.
+
+    Each artist's songs are shuffled, then the next song always comes from
+    the artist with the most songs left, other than the artist just played.
+    Consecutive songs by one artist only happen when a single artist makes
+    up more than half of the playlist.
+
+    Args:
+        song_ids (tuple): Playlist song IDs
+        songs (list): List of all available songs, used to look up artists
+        seed (int): Random seed, None for a different order each time
+
+    Yields:
+        str: Song IDs
+    """
+    if songs is None:
+        raise ValueError("Songs cannot be None")
+    wanted = set(song_ids)
+    artist_of = {song[0]: song[_ARTIST] for song in songs if song[0] in wanted}
+    missing = wanted.difference(artist_of)
+    if missing:
+        raise ValueError(f"Unknown song IDs: {sorted(missing)[:10]}")
+
+    rng = random.Random(seed)
+    by_artist = {}
+    for song_id in song_ids:
+        by_artist.setdefault(artist_of[song_id], []).append(song_id)
+    # Heap entries: (-songs left, random tie-breaker, artist)
+    heap = []
+    for artist, ids in by_artist.items():
+        rng.shuffle(ids)
+        heap.append((-len(ids), rng.random(), artist))
+    heapq.heapify(heap)
+
+    held = None
+    while heap:
+        remaining, _, artist = heapq.heappop(heap)
+        yield by_artist[artist].pop()
+        if held is not None:
+            heapq.heappush(heap, held)
+            held = None
+        if remaining + 1 < 0:
+            entry = (remaining + 1, rng.random(), artist)
+            if heap:
+                # Keep this artist out for one turn
+                held = entry
+            else:
+                heapq.heappush(heap, entry)
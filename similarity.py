@@ -0,0 +1,146 @@
+"""
+Song Similarity
+"More like this" playlists from a seed song. Songs are encoded as compact
+numeric feature columns (genre, artist, release year, duration) and grouped
+into buckets by genre and decade, each sorted by duration. A query visits
+buckets in order of their smallest possible distance and scans outward
+from the seed's duration, stopping as soon as nothing closer can remain,
+so only a small part of the catalog is examined.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left
+
+from playlist_batch import playlist_record
+from skeleton import SONG_FIELDS
+
+_ARTIST = SONG_FIELDS.index("artist")
+_GENRE = SONG_FIELDS.index("genre")
+_DURATION = SONG_FIELDS.index("duration")
+_YEAR = SONG_FIELDS.index("release_year")
+
+# Distance added for a different genre, a different artist, each decade apart
+# and each minute of duration difference
+DEFAULT_WEIGHTS = {"genre": 4.0, "artist": 1.0, "decade": 1.0, "minute": 1.0}
+
+
+class SimilarityIndex:
+    """
+    Nearest-neighbor index over encoded song features.
+
+    Args:
+        songs (list): List of song tuples
+        weights (dict): Distance weights, see DEFAULT_WEIGHTS
+    """
+
+    def __init__(self, songs, weights=None):
+        if not songs:
+            raise ValueError("Songs cannot be empty")
+        self.songs = songs
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        if any(weight < 0 for weight in self.weights.values()):
+            raise ValueError("Weights must not be negative")
+
+        genre_codes = {}
+        artist_codes = {}
+        self.genre = array("H", (genre_codes.setdefault(s[_GENRE], len(genre_codes)) for s in songs))
+        self.artist = array("I", (artist_codes.setdefault(s[_ARTIST], len(artist_codes)) for s in songs))
+        self.year = array("H", (s[_YEAR] for s in songs))
+        self.duration = array("I", (s[_DURATION] for s in songs))
+        self.row_of_id = {song[0]: row for row, song in enumerate(songs)}
+
+        grouped = {}
+        for row in range(len(songs)):
+            grouped.setdefault((self.genre[row], self.year[row] // 10), []).append(row)
+        # (genre code, decade) -> (rows sorted by duration, their durations)
+        self.buckets = {}
+        for key, rows in grouped.items():
+            rows.sort(key=self.duration.__getitem__)
+            self.buckets[key] = (array("I", rows), array("I", (self.duration[r] for r in rows)))
+
+    def distance(self, a, b):
+        """
+        Distance between two rows.
+
+        Args:
+            a (int): Row position
+            b (int): Row position
+
+        Returns:
+            float: Weighted feature distance
+        """
+        w = self.weights
+        return (w["genre"] * (self.genre[a] != self.genre[b])
+                + w["artist"] * (self.artist[a] != self.artist[b])
+                + w["decade"] * abs(self.year[a] // 10 - self.year[b] // 10)
+                + w["minute"] * abs(self.duration[a] - self.duration[b]) / 60)
+
+    def nearest(self, seed_id, count=50):
+        """
+        Find the songs closest to a seed song.
+
+        Args:
+            seed_id (str): Song ID of the seed
+            count (int): Number of songs to return
+
+        Returns:
+            list: (distance, song tuple) pairs, closest first, seed excluded
+        """
+        if seed_id not in self.row_of_id:
+            raise ValueError(f"Unknown song ID: {seed_id}")
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("Count must be a positive integer")
+        seed = self.row_of_id[seed_id]
+        w = self.weights
+        seed_genre = self.genre[seed]
+        seed_decade = self.year[seed] // 10
+        seed_duration = self.duration[seed]
+        per_second = w["minute"] / 60
+
+        bounds = sorted(
+            (w["genre"] * (genre != seed_genre) + w["decade"] * abs(decade - seed_decade), genre, decade)
+            for genre, decade in self.buckets
+        )
+        best = []  # max-heap of (-distance, -row)
+        for bound, genre, decade in bounds:
+            if len(best) >= count and bound > -best[0][0]:
+                break
+            rows, durations = self.buckets[(genre, decade)]
+            right = bisect_left(durations, seed_duration)
+            left = right - 1
+            # Walk outward from the seed duration, nearest durations first
+            while left >= 0 or right < len(rows):
+                if right >= len(rows) or (left >= 0 and seed_duration - durations[left] <= durations[right] - seed_duration):
+                    row, gap = rows[left], seed_duration - durations[left]
+                    left -= 1
+                else:
+                    row, gap = rows[right], durations[right] - seed_duration
+                    right += 1
+                if len(best) >= count and bound + gap * per_second > -best[0][0]:
+                    break
+                if row == seed:
+                    continue
+                entry = (-self.distance(seed, row), -row)
+                if len(best) < count:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+        ranked = sorted((-d, -r) for d, r in best)
+        return [(d, self.songs[r]) for d, r in ranked]
+
+    def similar_playlist(self, name, seed_id, count=50):
+        """
+        Create a playlist of the seed song followed by its nearest neighbors.
+
+        Args:
+            name (str): Playlist name
+            seed_id (str): Song ID of the seed
+            count (int): Total number of songs in the playlist
+
+        Returns:
+            tuple: Playlist tuple (name, created, song_ids)
+        """
+        neighbors = self.nearest(seed_id, max(count - 1, 1))[:count - 1]
+        song_ids = [seed_id] + [song[0] for _, song in neighbors]
+        return playlist_record(name, song_ids)
@@ -4,9 +4,16 @@ This program demonstrates tuple operations through a music playlist management s
 Students should implement the functions while maintaining immutability of tuples.
 """
 
+import sys
 from collections import namedtuple
 from datetime import datetime
 
+# Order of the fields inside every song tuple
+SONG_FIELDS = ("id", "title", "artist", "genre", "duration", "release_year", "album")
+
+# Song tuple position used by each sort_songs key
+SORT_KEYS = {"title": 1, "artist": 2, "year": 5, "duration": 4}
+
 def initialize_data():
     """
     Initialize the music data with predefined songs using tuples.
@@ -229,8 +236,15 @@ def display_data(data, data_type="songs"):
 
 def main():
     """Main program function."""
-    # Initialize data
-    songs, new_releases, genres = initialize_data()
+    # Imported here so library users of this module do not pay for them
+    from catalog_cache import load_catalog
+    from profiling import profile_action, profile_dir_from_args
+
+    # Profiling is off unless requested with --profile DIR or PLAYLIST_PROFILE
+    profile_dir = profile_dir_from_args(sys.argv[1:])
+
+    # Initialize data, reusing the cached snapshot while this file is unchanged
+    songs, new_releases, genres = load_catalog(initialize_data)
     playlists = []  # List to store created playlists
     
     while True:
@@ -246,12 +260,13 @@ def main():
         
         choice = input("Enter your choice (0-6): ")
         
-        # TODO: Implement menu choice handling
-        if choice == "0":
-            print("Thank you for using the Music Playlist Management System!")
-            break
-        else:
-            print("Option not implemented yet!")
+        with profile_action(choice, profile_dir):
+            # TODO: Implement menu choice handling
+            if choice == "0":
+                print("Thank you for using the Music Playlist Management System!")
+                break
+            else:
+                print("Option not implemented yet!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
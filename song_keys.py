@@ -0,0 +1,196 @@
+"""
+Normalized Comparison Keys
+Casefolded, NFKC-normalized, whitespace-collapsed keys for the text fields
+that filters and sorts compare. KeyedCatalog computes them once as songs
+are ingested and keeps them in columns next to the song tuples, so
+filter_by_genre, filter_by_artist and sort_songs("title"/"artist") only
+compare ready-made keys instead of normalizing every song on every query.
+With a collate function, titles and artists also get cached collation keys
+and each sort order is kept and extended as songs are added.
+"""
+
+import heapq
+import unicodedata
+from itertools import compress
+
+from skeleton import SONG_FIELDS, SORT_KEYS
+
+# Text fields that get a precomputed key
+KEYED_FIELDS = ("title", "artist", "genre")
+
+# Text fields that get a collation key when a collate function is given
+COLLATED_FIELDS = ("title", "artist")
+
+
+def normalize_key(text):
+    """
+    Build the comparison key for a text value.
+
+    Args:
+        text (str): Text to normalize
+
+    Returns:
+        str: NFKC-normalized, casefolded text with runs of whitespace collapsed
+    """
+    if not isinstance(text, str):
+        raise ValueError("Text must be a string")
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+class KeyedCatalog:
+    """
+    Song list with normalized key columns computed at ingestion.
+
+    Args:
+        songs (list): Initial list of song tuples
+        collate (callable): Collation key function such as collation.collation_key;
+            when given, sort_songs orders titles and artists by it
+    """
+
+    def __init__(self, songs=(), collate=None):
+        self.songs = []
+        self.keys = {field: [] for field in KEYED_FIELDS}
+        self.collate = collate
+        self.collation_keys = {field: [] for field in COLLATED_FIELDS} if collate else {}
+        # raw text -> key, so repeated artists and genres are normalized once
+        # and share one key object
+        self._seen = {}
+        self._collated = {}
+        # sort_key -> row positions in sorted order, kept up to date by add_songs
+        self._orders = {}
+        self.add_songs(songs)
+
+    def __len__(self):
+        return len(self.songs)
+
+    def _key(self, text):
+        key = self._seen.get(text)
+        if key is None:
+            key = self._seen[text] = normalize_key(text)
+        return key
+
+    def _collation_key(self, text):
+        key = self._collated.get(text)
+        if key is None:
+            key = self._collated[text] = self.collate(text)
+        return key
+
+    def _sort_column(self, sort_key):
+        field = SONG_FIELDS[SORT_KEYS[sort_key]]
+        if field in self.collation_keys:
+            return self.collation_keys[field]
+        if field in self.keys:
+            return self.keys[field]
+        position = SORT_KEYS[sort_key]
+        return [song[position] for song in self.songs]
+
+    def add_songs(self, songs):
+        """
+        Ingest songs and compute their keys.
+
+        Args:
+            songs (list): Song tuples to append
+        """
+        if songs is None:
+            raise ValueError("Songs cannot be None")
+        positions = [(self.keys[field], SONG_FIELDS.index(field)) for field in KEYED_FIELDS]
+        collated = [(self.collation_keys[field], SONG_FIELDS.index(field))
+                    for field in self.collation_keys]
+        songs = list(songs)
+        for song in songs:
+            if not isinstance(song, tuple) or len(song) != len(SONG_FIELDS):
+                raise ValueError(f"Invalid song record: {song!r}")
+        # Key the whole batch before storing any of it, so a rejected batch
+        # leaves the songs, key columns and cached orders untouched
+        new_keys = [[self._key(song[position]) for song in songs] for _, position in positions]
+        new_collated = [[self._collation_key(song[position]) for song in songs] for _, position in collated]
+        first_new = len(self.songs)
+        self.songs.extend(songs)
+        for (column, _), keys in zip(positions, new_keys):
+            column.extend(keys)
+        for (column, _), keys in zip(collated, new_collated):
+            column.extend(keys)
+
+        # Sort only the new rows and merge them into each cached order
+        new_rows = range(first_new, len(self.songs))
+        for sort_key, order in self._orders.items():
+            column = self._sort_column(sort_key)
+            added = sorted(new_rows, key=column.__getitem__)
+            self._orders[sort_key] = list(heapq.merge(order, added, key=column.__getitem__))
+
+    def integrate_new_releases(self, new_releases):
+        """
+        Add new releases, keying only the new songs.
+
+        Args:
+            new_releases (list): List of new release tuples
+
+        Returns:
+            list: Combined list of songs
+        """
+        self.add_songs(new_releases)
+        return self.songs
+
+    def _matching(self, field, value, label):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"{label} must be a non-empty string")
+        key = normalize_key(value)
+        return list(compress(self.songs, [k == key for k in self.keys[field]]))
+
+    def filter_by_genre(self, genre):
+        """
+        Filter songs by genre, ignoring case, Unicode form and spacing.
+
+        Args:
+            genre (str): Genre to filter by
+
+        Returns:
+            list: Filtered list of song tuples
+        """
+        return self._matching("genre", genre, "Genre")
+
+    def filter_by_artist(self, artist):
+        """
+        Filter songs by artist, ignoring case, Unicode form and spacing.
+
+        Args:
+            artist (str): Artist to filter by
+
+        Returns:
+            list: Filtered list of song tuples
+        """
+        return self._matching("artist", artist, "Artist")
+
+    def sorted_order(self, sort_key):
+        """
+        Row positions in sorted order, computed on first use and then cached.
+
+        Text keys use the collation keys when a collate function was given,
+        otherwise the normalized keys. Ties keep catalog order.
+
+        Args:
+            sort_key (str): Attribute to sort by ("title", "artist", "year", "duration")
+
+        Returns:
+            list: Row positions
+        """
+        if sort_key not in SORT_KEYS:
+            raise ValueError(f"Invalid sort key: {sort_key}")
+        order = self._orders.get(sort_key)
+        if order is None:
+            column = self._sort_column(sort_key)
+            order = self._orders[sort_key] = sorted(range(len(self.songs)), key=column.__getitem__)
+        return order
+
+    def sort_songs(self, sort_key):
+        """
+        Sort songs by the given attribute using the cached sort order.
+
+        Args:
+            sort_key (str): Attribute to sort by ("title", "artist", "year", "duration")
+
+        Returns:
+            list: Sorted list of song tuples
+        """
+        songs = self.songs
+        return [songs[row] for row in self.sorted_order(sort_key)]
@@ -0,0 +1,42 @@
+import unittest
+
+from benchmarks.bench_skeleton import compare, measure, scaling_exponents
+from benchmarks.common import best_of, make_catalog
+
+
+class TestBenchmarkHelpers(unittest.TestCase):
+    def test_make_catalog_is_reproducible(self):
+        self.assertEqual(make_catalog(50, seed=2), make_catalog(50, seed=2))
+        self.assertEqual(len(make_catalog(50)), 50)
+
+    def test_best_of_runs_each_repeat(self):
+        calls = []
+        self.assertGreaterEqual(best_of(lambda: calls.append(1), 4), 0)
+        self.assertEqual(len(calls), 4)
+
+    def test_measure_reports_throughput_and_memory(self):
+        result = measure(lambda: [0] * 10000, repeat=2)
+        self.assertGreater(result["ops_per_sec"], 0)
+        self.assertGreater(result["peak_bytes"], 0)
+
+    def test_scaling_exponents(self):
+        results = {
+            "linear@100": {"ops_per_sec": 1000.0}, "linear@10000": {"ops_per_sec": 10.0},
+            "flat@100": {"ops_per_sec": 50.0}, "flat@10000": {"ops_per_sec": 50.0},
+            "single@1": {"ops_per_sec": 5.0},
+        }
+        exponents = scaling_exponents(results, [100, 10000])
+        self.assertAlmostEqual(exponents["linear"], 1.0)
+        self.assertAlmostEqual(exponents["flat"], 0.0)
+        self.assertNotIn("single", exponents)
+        self.assertEqual(scaling_exponents(results, [100]), {})
+
+    def test_compare_flags_only_slowdowns_beyond_tolerance(self):
+        baseline = {"a@1": {"ops_per_sec": 100.0}, "b@1": {"ops_per_sec": 100.0},
+                    "gone@1": {"ops_per_sec": 100.0}}
+        results = {"a@1": {"ops_per_sec": 80.0}, "b@1": {"ops_per_sec": 70.0}}
+        self.assertEqual(compare(results, baseline, 0.25), [("b@1", 100.0, 70.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
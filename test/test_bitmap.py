@@ -0,0 +1,83 @@
+import operator
+import random
+import unittest
+from unittest import mock
+
+from bitmap import CHUNK_SIZE, SPARSE_LIMIT, RowBitmap, _offsets_of, row_index
+
+OPERATORS = (operator.and_, operator.or_, operator.sub, operator.xor)
+
+
+def _random_rows(rng):
+    """Rows mixing empty, sparse, near-limit and dense chunks."""
+    rows = set()
+    for high in range(4):
+        kind = rng.randrange(4)
+        base = high * CHUNK_SIZE
+        if kind == 1:
+            rows.update(base + rng.randrange(CHUNK_SIZE) for _ in range(rng.randint(1, 200)))
+        elif kind == 2:
+            rows.update(base + offset for offset in rng.sample(range(CHUNK_SIZE), SPARSE_LIMIT - 2))
+        elif kind == 3:
+            rows.update(base + offset for offset in range(0, CHUNK_SIZE, rng.choice((2, 3, 5))))
+    return rows
+
+
+class TestRowBitmap(unittest.TestCase):
+    def test_set_operations_match_python_sets(self):
+        rng = random.Random(45)
+        for _ in range(12):
+            a, b = _random_rows(rng), _random_rows(rng)
+            left, right = RowBitmap(a), RowBitmap(b)
+            for op in OPERATORS:
+                with self.subTest(op=op.__name__):
+                    result = op(left, right)
+                    self.assertEqual(list(result), sorted(op(a, b)))
+                    self.assertEqual(len(result), len(op(a, b)))
+                    self.assertEqual(result, RowBitmap(op(a, b)))
+
+    def test_sparse_union_crossing_the_limit_stays_correct(self):
+        # Two chunks of exactly SPARSE_LIMIT rows each union into a dense chunk
+        evens = RowBitmap(range(0, 2 * SPARSE_LIMIT, 2))
+        odds = RowBitmap(range(1, 2 * SPARSE_LIMIT, 2))
+        self.assertEqual(list(evens | odds), list(range(2 * SPARSE_LIMIT)))
+        self.assertEqual(list((evens | odds) - odds), list(evens))
+
+    def test_sparse_chunks_never_expand_to_bitsets(self):
+        a = RowBitmap(range(0, 3000, 3))
+        b = RowBitmap(range(0, 3000, 5))
+        with mock.patch("bitmap._bits_of", side_effect=AssertionError("dense path used")):
+            for op in OPERATORS:
+                self.assertEqual(set(op(a, b)), op(set(range(0, 3000, 3)), set(range(0, 3000, 5))))
+
+    def test_offsets_of_scans_set_bits(self):
+        rng = random.Random(7)
+        for count in (0, 1, 64, 1000, 40000):
+            offsets = sorted(rng.sample(range(CHUNK_SIZE), count))
+            bits = sum(1 << offset for offset in offsets)
+            self.assertEqual(list(_offsets_of(bits)), offsets)
+
+    def test_membership_complement_and_full(self):
+        rows = {0, 5, CHUNK_SIZE - 1, CHUNK_SIZE, 3 * CHUNK_SIZE + 7}
+        bitmap = RowBitmap(rows)
+        size = 3 * CHUNK_SIZE + 10
+        for row in list(rows) + [1, CHUNK_SIZE + 1, 10 ** 9]:
+            self.assertEqual(row in bitmap, row in rows)
+        self.assertEqual(set(bitmap.complement(size)), set(range(size)) - rows)
+        self.assertEqual(len(RowBitmap.full(size)), size)
+        self.assertFalse(RowBitmap())
+
+    def test_song_conversions(self):
+        songs = [(f"S{i}", "t", "a", "rock", 200, 2000, "x") for i in range(10)]
+        index = row_index(songs)
+        bitmap = RowBitmap.from_song_ids(("S7", "S2"), index)
+        self.assertEqual(bitmap.to_song_ids(songs), ("S2", "S7"))
+        self.assertEqual(bitmap.to_songs(songs), [songs[2], songs[7]])
+        with self.assertRaises(ValueError):
+            RowBitmap.from_song_ids(("S99",), index)
+        with self.assertRaises(ValueError):
+            RowBitmap([-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
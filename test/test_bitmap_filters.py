@@ -0,0 +1,55 @@
+import unittest
+
+from bitmap import RowBitmap
+from bitmap_filters import BitmapFilters
+from catalog_generator import generate_songs
+from song_keys import normalize_key
+
+
+class TestBitmapFilters(unittest.TestCase):
+    def setUp(self):
+        self.songs = list(generate_songs(3000, seed=46))
+        self.filters = BitmapFilters(self.songs)
+
+    def test_filters_match_list_scans(self):
+        self.assertEqual(self.filters.filter_by_genre("ROCK"),
+                         [s for s in self.songs if normalize_key(s[3]) == "rock"])
+        self.assertEqual(self.filters.filter_by_artist("artist 3"),
+                         [s for s in self.songs if s[2] == "Artist 3"])
+        self.assertEqual(self.filters.filter_by_duration(200, 260),
+                         [s for s in self.songs if 200 <= s[4] <= 260])
+        self.assertEqual(self.filters.filter_by_decade(1970),
+                         [s for s in self.songs if 1970 <= s[5] <= 1979])
+
+    def test_compound_query(self):
+        f = self.filters
+        hits = (f.filter_by_genre("rock", as_bitmap=True)
+                & f.filter_by_decade(2000, as_bitmap=True)
+                & f.negate(f.filter_by_duration(0, 179, as_bitmap=True)))
+        hits = hits | f.filter_by_artist("Artist 1", as_bitmap=True)
+        self.assertIsInstance(hits, RowBitmap)
+        expected = [s for s in self.songs
+                    if (s[3] == "rock" and 2000 <= s[5] <= 2009 and not s[4] <= 179) or s[2] == "Artist 1"]
+        self.assertEqual(f.materialize(hits), expected)
+
+    def test_add_songs_refreshes_cached_bitmaps(self):
+        self.filters.filter_by_genre("jazz")
+        self.filters.filter_by_decade(2020)
+        extra = [("N1", "t", "New", "jazz", 200, 2024, "x")]
+        self.filters.add_songs(extra)
+        self.assertEqual(self.filters.filter_by_genre("jazz")[-1], extra[0])
+        self.assertEqual(self.filters.filter_by_decade(2020)[-1], extra[0])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.filters.filter_by_genre("")
+        with self.assertRaises(ValueError):
+            self.filters.filter_by_duration(100, 50)
+        with self.assertRaises(ValueError):
+            self.filters.filter_by_decade(1975)
+        with self.assertRaises(ValueError):
+            BitmapFilters(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from catalog_cache import load_catalog, load_snapshot
+
+SONGS = [("S001", "One", "A", "rock", 200, 1990, "X")]
+RELEASES = [("N001", "New", "B", "pop", 180, 2024, "Y")]
+GENRES = ("rock", "pop")
+
+calls = []
+
+
+def loader():
+    calls.append(1)
+    return SONGS, RELEASES, GENRES
+
+
+def stub_loader():
+    return None
+
+
+class TestCatalogCache(unittest.TestCase):
+    def setUp(self):
+        calls.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "catalog.snapshot")
+
+    def test_second_load_is_served_from_snapshot(self):
+        self.assertEqual(load_catalog(loader, self.path), (SONGS, RELEASES, GENRES))
+        self.assertEqual(load_catalog(loader, self.path), (SONGS, RELEASES, GENRES))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(set(load_snapshot(loader, self.path)),
+                         {"fingerprint", "songs", "new_releases", "genres"})
+
+    def test_corrupt_snapshot_is_rebuilt(self):
+        load_catalog(loader, self.path)
+        with open(self.path, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            f.write(b"\x00")
+        self.assertEqual(load_catalog(loader, self.path), (SONGS, RELEASES, GENRES))
+        self.assertEqual(len(calls), 2)
+
+    def test_unusable_loader_output_is_returned_uncached(self):
+        self.assertIsNone(load_catalog(stub_loader, self.path))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_failed_write_leaves_no_temp_file(self):
+        with mock.patch("catalog_cache.os.replace", side_effect=OSError("disk full")):
+            self.assertEqual(load_catalog(loader, self.path), (SONGS, RELEASES, GENRES))
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
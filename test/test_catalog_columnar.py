@@ -0,0 +1,103 @@
+import marshal
+import os
+import tempfile
+import unittest
+
+from catalog_columnar import CODECS, _MAGIC, _TRAILER, export_songs, import_songs, iter_blocks, read_footer
+from catalog_generator import generate_songs
+
+
+class TestCatalogColumnar(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "catalog.plc")
+        self.songs = list(generate_songs(2500, seed=50))
+
+    def test_round_trip_both_codecs(self):
+        for codec in CODECS:
+            with self.subTest(codec=codec):
+                self.assertEqual(export_songs(iter(self.songs), self.path, codec=codec, block_rows=1000), 2500)
+                self.assertEqual(import_songs(self.path), self.songs)
+        self.assertEqual(os.listdir(self.directory.name), ["catalog.plc"])
+
+    def test_selected_fields_and_blocks(self):
+        export_songs(self.songs, self.path, block_rows=1000)
+        self.assertEqual(import_songs(self.path, fields=("release_year", "id")),
+                         [(song[5], song[0]) for song in self.songs])
+        self.assertEqual(import_songs(self.path, blocks=[2, 0]), self.songs[2000:] + self.songs[:1000])
+        self.assertEqual([len(rows) for rows in iter_blocks(self.path)], [1000, 1000, 500])
+        with self.assertRaises(ValueError):
+            import_songs(self.path, fields=("tempo",))
+
+    def test_mixed_and_large_values(self):
+        songs = [
+            ("A", "Title", "Artist", "rock", 200, 1990, None),
+            ("B", "Title", "Artist", "rock", 2 ** 70, 1991.5, ("disc", 1)),
+            ("C", "", "Artist", "pop", -1, 1992, "Album"),
+        ]
+        export_songs(songs, self.path)
+        self.assertEqual(import_songs(self.path), songs)
+
+    def test_empty_catalog(self):
+        self.assertEqual(export_songs([], self.path), 0)
+        self.assertEqual(import_songs(self.path), [])
+
+    def test_failed_export_leaves_no_temp_file(self):
+        export_songs(self.songs[:10], self.path)
+        with self.assertRaises(ValueError):
+            export_songs(self.songs[:10] + [("X", "too short")], self.path)
+        self.assertEqual(os.listdir(self.directory.name), ["catalog.plc"])
+        self.assertEqual(import_songs(self.path), self.songs[:10])
+
+    def _flip_byte(self, offset):
+        with open(self.path, "r+b") as f:
+            f.seek(offset)
+            value = f.read(1)[0]
+            f.seek(offset)
+            f.write(bytes([value ^ 0xFF]))
+
+    def test_corrupt_columns_raise_value_error(self):
+        for codec in CODECS:
+            export_songs(self.songs, self.path, codec=codec, block_rows=1000)
+            with open(self.path, "rb") as f:
+                footer = read_footer(f)
+            for field in ("id", "duration"):
+                _, offset, length = footer["blocks"][1][1][field]
+                self._flip_byte(offset + length // 2)
+                with self.subTest(codec=codec, field=field), self.assertRaises(ValueError):
+                    import_songs(self.path, fields=(field,))
+                export_songs(self.songs, self.path, codec=codec, block_rows=1000)
+
+    def test_corrupt_footer_raises_value_error(self):
+        export_songs(self.songs[:10], self.path)
+        size = os.path.getsize(self.path)
+        with open(self.path, "rb") as f:
+            f.seek(size - len(_MAGIC) - _TRAILER.size)
+            (footer_size,) = _TRAILER.unpack(f.read(_TRAILER.size))
+        # Overwrite the footer with marshal data that is not a footer dict
+        with open(self.path, "r+b") as f:
+            f.seek(size - len(_MAGIC) - _TRAILER.size - footer_size)
+            f.write(marshal.dumps("x")[:1] + b"\0" * (footer_size - 1))
+        with self.assertRaises(ValueError):
+            import_songs(self.path)
+
+    def test_invalid_files_and_arguments(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a columnar file at all")
+        with self.assertRaises(ValueError):
+            import_songs(self.path)
+        export_songs(self.songs, self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 3)
+        with self.assertRaises(ValueError):
+            import_songs(self.path)
+        for kwargs in ({"codec": "gzip"}, {"block_rows": 0}):
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                export_songs(self.songs, self.path, **kwargs)
+        with self.assertRaises(ValueError):
+            export_songs(None, self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
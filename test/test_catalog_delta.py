@@ -0,0 +1,91 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from catalog_delta import CatalogDelta, apply_delta, diff_catalogs, manifest, read_delta, song_digest, write_delta
+from catalog_generator import generate_songs
+
+
+def _integrate(songs, new_releases):
+    return songs + list(new_releases)
+
+
+class TestCatalogDelta(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch("skeleton.integrate_new_releases", _integrate)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "catalog.delta")
+
+    def _edited(self, songs, rng, round_number):
+        kept = [song for song in songs if rng.random() > 0.1]
+        edited = [(s[0], s[1] + " (remaster)") + s[2:] if rng.random() < 0.1 else s for s in kept]
+        added = [(f"NEW{round_number}-{i}", "t", "a", "rock", 200, 2024, "x") for i in range(rng.randint(0, 20))]
+        return edited + added
+
+    def test_diff_and_apply_round_trip(self):
+        rng = random.Random(49)
+        songs = list(generate_songs(500, seed=49))
+        for round_number in range(5):
+            new = self._edited(songs, rng, round_number)
+            delta = diff_catalogs(songs, new)
+            self.assertEqual(delta, diff_catalogs(manifest(songs), new))
+            self.assertEqual(apply_delta(songs, delta), new)
+            songs = new
+
+    def test_reloaded_copy_has_empty_delta(self):
+        songs = list(generate_songs(500, seed=9))
+        reloaded = [tuple(song) for song in json.loads(json.dumps(songs))]
+        self.assertEqual(reloaded, songs)
+        self.assertEqual(diff_catalogs(songs, reloaded), CatalogDelta((), (), ()))
+        self.assertEqual(diff_catalogs(manifest(reloaded), songs), CatalogDelta((), (), ()))
+        title = "".join(["Ti", "tle"])
+        self.assertEqual(song_digest(("S1", "Title", "A", "rock", 1, 2000, "Title")),
+                         song_digest(("S1", title, "A", "rock", 1, 2000, "Title")))
+
+    def test_kinds_and_order(self):
+        old = [("A", 1), ("B", 1), ("C", 1)]
+        new = [("C", 2), ("B", 1), ("D", 1)]
+        self.assertEqual(diff_catalogs(old, new), CatalogDelta((("D", 1),), (("C", 2),), ("A",)))
+        self.assertEqual(diff_catalogs(old, old), CatalogDelta((), (), ()))
+
+    def test_file_round_trip(self):
+        delta = diff_catalogs(list(generate_songs(50, seed=1)), list(generate_songs(60, seed=2)))
+        write_delta(delta, self.path)
+        self.assertEqual(read_delta(self.path), delta)
+        self.assertEqual(os.listdir(self.directory.name), ["catalog.delta"])
+
+    def test_corrupt_file_is_rejected(self):
+        write_delta(CatalogDelta((("A", 1),), (), ("B",)), self.path)
+        with open(self.path, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 1]))
+        with self.assertRaises(ValueError):
+            read_delta(self.path)
+        with open(self.path, "wb") as f:
+            f.write(b"not a delta")
+        with self.assertRaises(ValueError):
+            read_delta(self.path)
+
+    def test_failed_write_leaves_no_temp_file(self):
+        with mock.patch("catalog_cache.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_delta(CatalogDelta((), (), ("A",)), self.path)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            diff_catalogs(None, [])
+        with self.assertRaises(ValueError):
+            apply_delta(None, CatalogDelta((), (), ()))
+
+
+if __name__ == "__main__":
+    unittest.main()
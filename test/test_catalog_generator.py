@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+import unittest
+from collections import Counter
+
+from catalog_generator import GENRES, LATEST_YEAR, generate_songs, write_songs
+from skeleton import SONG_FIELDS
+
+
+class TestGenerateSongs(unittest.TestCase):
+    def test_same_seed_same_catalog(self):
+        self.assertEqual(list(generate_songs(200, seed=9)), list(generate_songs(200, seed=9)))
+        self.assertNotEqual(list(generate_songs(200, seed=9)), list(generate_songs(200, seed=10)))
+
+    def test_songs_are_valid_records(self):
+        songs = list(generate_songs(2000, seed=1, start=5, prefix="T"))
+        self.assertEqual(len({song[0] for song in songs}), 2000)
+        self.assertEqual(songs[0][0], "T0005")
+        for song in songs:
+            self.assertEqual(len(song), len(SONG_FIELDS))
+            self.assertIn(song[3], GENRES)
+            self.assertTrue(30 <= song[4] <= 1800)
+            self.assertTrue(1950 <= song[5] <= LATEST_YEAR)
+
+    def test_popularity_is_skewed(self):
+        counts = Counter(song[2] for song in generate_songs(20000, seed=0))
+        top, bottom = counts.most_common()[0][1], counts.most_common()[-1][1]
+        self.assertGreater(top, 20 * bottom)
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"count": -1}, {"count": 5, "genres": ()}, {"count": 5, "skew": 0}):
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                list(generate_songs(**kwargs))
+
+
+class TestWriteSongs(unittest.TestCase):
+    def setUp(self):
+        self.songs = list(generate_songs(20, seed=4))
+
+    def test_csv(self):
+        output = io.StringIO()
+        self.assertEqual(write_songs(self.songs, output, "csv"), 20)
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        self.assertEqual(tuple(rows[0]), SONG_FIELDS)
+        self.assertEqual(rows[1][0], self.songs[0][0])
+        self.assertEqual(len(rows), 21)
+
+    def test_jsonl(self):
+        output = io.StringIO()
+        write_songs(self.songs, output, "jsonl")
+        self.assertEqual([tuple(json.loads(line)) for line in output.getvalue().splitlines()], self.songs)
+        with self.assertRaises(ValueError):
+            write_songs(self.songs, output, "xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import threading
+import unittest
+from unittest import mock
+
+from catalog_snapshot import SharedCatalog
+
+SONGS = [("S001", "One", "A", "rock", 200, 1990, "X")]
+RELEASE = ("N001", "New", "B", "pop", 180, 2024, "Y")
+
+
+def _integrate(songs, new_releases):
+    return songs + list(new_releases)
+
+
+class TestSharedCatalog(unittest.TestCase):
+    def test_update_publishes_new_version(self):
+        catalog = SharedCatalog(SONGS, ("rock", "pop"))
+        before = catalog.snapshot()
+        with mock.patch("skeleton.integrate_new_releases", _integrate):
+            after = catalog.integrate_new_releases([RELEASE])
+        self.assertEqual((before.version, after.version), (0, 1))
+        self.assertEqual(before.songs, tuple(SONGS))
+        self.assertEqual(after.songs, tuple(SONGS) + (RELEASE,))
+        self.assertIs(catalog.snapshot(), after)
+        self.assertEqual(catalog.query(len), 2)
+
+    def test_failed_update_keeps_snapshot(self):
+        catalog = SharedCatalog(SONGS, ("rock",))
+        with self.assertRaises(ValueError):
+            catalog.update(lambda songs: None)
+        self.assertEqual(catalog.version, 0)
+        with self.assertRaises(ValueError):
+            SharedCatalog(None, ("rock",))
+
+    def test_concurrent_writers_serialize(self):
+        catalog = SharedCatalog([], ())
+        threads = [threading.Thread(target=lambda: [catalog.update(lambda s: s + [("x",)]) for _ in range(50)])
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(catalog.version, 200)
+        self.assertEqual(len(catalog.songs), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
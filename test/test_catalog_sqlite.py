@@ -0,0 +1,54 @@
+import unittest
+
+from catalog_generator import generate_songs
+from catalog_sqlite import SQLiteCatalog
+
+
+class TestSQLiteCatalog(unittest.TestCase):
+    def setUp(self):
+        self.songs = list(generate_songs(500, seed=3))
+        self.songs.append(("X1", "b side", "Queen", "Rock", 200, 1975, "Live"))
+        self.songs.append(("X2", "A side", "queen", "rock", 200, 1975, "Live"))
+        self.catalog = SQLiteCatalog(":memory:", pool_size=2)
+        self.catalog.load(self.songs, batch_size=64)
+
+    def tearDown(self):
+        self.catalog.close()
+
+    def test_load_keeps_every_song(self):
+        self.assertEqual(len(self.catalog), len(self.songs))
+
+    def test_genre_and_artist_match_exactly(self):
+        for genre in ("rock", "Rock", "ROCK", "rock "):
+            self.assertEqual(self.catalog.filter_by_genre(genre),
+                             [s for s in self.songs if s[3] == genre])
+        for artist in ("Queen", "queen", "Artist 1"):
+            self.assertEqual(self.catalog.filter_by_artist(artist),
+                             [s for s in self.songs if s[2] == artist])
+
+    def test_range_filters_match_list_scan(self):
+        self.assertEqual(self.catalog.filter_by_duration(180, 240),
+                         [s for s in self.songs if 180 <= s[4] <= 240])
+        self.assertEqual(self.catalog.filter_by_decade(1980),
+                         [s for s in self.songs if 1980 <= s[5] <= 1989])
+
+    def test_sort_matches_stable_python_sort(self):
+        for key, index in (("title", 1), ("artist", 2), ("year", 5), ("duration", 4)):
+            self.assertEqual(self.catalog.sort_songs(key),
+                             sorted(self.songs, key=lambda s: s[index]))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.catalog.filter_by_genre("")
+        with self.assertRaises(ValueError):
+            self.catalog.filter_by_duration(10, 5)
+        with self.assertRaises(ValueError):
+            self.catalog.filter_by_decade(1985)
+        with self.assertRaises(ValueError):
+            self.catalog.sort_songs("album")
+        with self.assertRaises(ValueError):
+            self.catalog.load([("too", "short")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import threading
+import unittest
+from unittest import mock
+
+from change_feed import ADDED, REMOVED, REPLACED, ChangeFeed, FeedCatalog, diff_songs
+
+
+def _song(song_id, title="t"):
+    return (song_id, title, "a", "rock", 200, 2000, "x")
+
+
+def _apply(by_id, events):
+    for event in events:
+        if event.kind == REMOVED:
+            del by_id[event.previous[0]]
+        else:
+            by_id[event.song[0]] = event.song
+
+
+class TestDiffSongs(unittest.TestCase):
+    def test_kinds(self):
+        old = [_song("A"), _song("B"), _song("C")]
+        new = [_song("B", "changed"), _song("C"), _song("D")]
+        self.assertEqual(diff_songs(old, new), [
+            (REPLACED, _song("B", "changed"), _song("B")),
+            (ADDED, _song("D"), None),
+            (REMOVED, None, _song("A")),
+        ])
+
+
+class TestFeedCatalog(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch("skeleton.integrate_new_releases", lambda songs, new: songs + list(new))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_random_updates_replay_to_catalog(self):
+        rng = random.Random(48)
+        catalog = FeedCatalog([_song(f"S{i}") for i in range(50)], ("rock",))
+        mirror = {song[0]: song for song in catalog.songs}
+        received = []
+        catalog.feed.subscribe(received.append)
+        for step in range(100):
+            if rng.random() < 0.6 or len(catalog.songs) < 10:
+                catalog.integrate_new_releases([_song(f"N{step}"), _song(rng.choice(catalog.songs)[0], f"v{step}")])
+            else:
+                drop = set(rng.sample([s[0] for s in catalog.songs], 3))
+                catalog.update(lambda songs: [s for s in songs if s[0] not in drop])
+        _apply(mirror, received)
+        self.assertEqual(mirror, {song[0]: song for song in catalog.songs})
+        self.assertEqual([e.sequence for e in received], list(range(1, len(received) + 1)))
+        self.assertEqual(received, catalog.feed.events())
+        self.assertTrue(all(a.version <= b.version for a, b in zip(received, received[1:])))
+
+    def test_failing_subscriber_does_not_block_others(self):
+        catalog = FeedCatalog([_song("A")], ("rock",))
+        failed, healthy = [], []
+
+        def broken(event):
+            failed.append(event.sequence)
+            raise RuntimeError("index out of sync")
+
+        catalog.feed.subscribe(broken)
+        catalog.feed.subscribe(healthy.append)
+        with self.assertLogs("change_feed", level="ERROR") as logs:
+            snapshot = catalog.integrate_new_releases([_song("B"), _song("C")])
+        self.assertEqual(snapshot.version, catalog.snapshot().version)
+        self.assertEqual(failed, [1, 2])
+        self.assertEqual([event.song for event in healthy], [_song("B"), _song("C")])
+        self.assertEqual(len(logs.records), 2)
+
+    def test_events_since_and_retention(self):
+        feed = ChangeFeed(max_events=3)
+        for i in range(5):
+            feed.publish(i + 1, [(ADDED, _song(f"S{i}"), None)])
+        self.assertEqual([e.sequence for e in feed.events(since=3)], [4, 5])
+        self.assertEqual(feed.events(since=5), [])
+        with self.assertRaises(ValueError):
+            feed.events(since=1)
+
+    def test_follow_and_unsubscribe(self):
+        feed = ChangeFeed()
+        seen = []
+        unsubscribe = feed.subscribe(seen.append)
+        followed = []
+        reader = threading.Thread(target=lambda: followed.extend(feed.follow(0, timeout=1.0)))
+        reader.start()
+        feed.publish(1, [(ADDED, _song("A"), None), (ADDED, _song("B"), None)])
+        unsubscribe()
+        feed.publish(2, [(REMOVED, None, _song("A"))])
+        reader.join()
+        self.assertEqual([e.sequence for e in followed], [1, 2, 3])
+        self.assertEqual([e.sequence for e in seen], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import locale
+import unittest
+
+from catalog_generator import generate_songs
+from collation import collation_key, locale_collator
+from song_keys import KeyedCatalog
+
+
+class TestCollationKey(unittest.TestCase):
+    def test_accents_and_case_only_break_ties(self):
+        words = ["cote", "Côte", "côte", "Cote", "coté", "Alpha", "beta", "Zulu"]
+        self.assertEqual(sorted(words, key=collation_key),
+                         ["Alpha", "beta", "cote", "Cote", "coté", "côte", "Côte", "Zulu"])
+
+    def test_spacing_is_ignored_at_primary_level(self):
+        self.assertEqual(collation_key("a  b")[0], collation_key(" A b ")[0])
+        with self.assertRaises(ValueError):
+            collation_key(3)
+
+    def test_locale_collator(self):
+        self.assertIs(locale_collator("C"), locale.strxfrm)
+        with self.assertRaises(ValueError):
+            locale_collator("xx_NOT_A_LOCALE.UTF-8")
+
+
+class TestCollatedCatalog(unittest.TestCase):
+    def test_collated_sort_matches_sorted_with_key(self):
+        songs = list(generate_songs(800, seed=13))
+        songs += [("X1", "Éclair", "Ümit", "pop", 100, 2000, "A"), ("X2", "eclair", "umit", "pop", 100, 2000, "A")]
+        catalog = KeyedCatalog(songs[:500], collate=collation_key)
+        catalog.sort_songs("title")
+        catalog.add_songs(songs[500:])
+        self.assertEqual(catalog.sort_songs("title"), sorted(songs, key=lambda s: collation_key(s[1])))
+        self.assertEqual(catalog.sort_songs("artist"), sorted(songs, key=lambda s: collation_key(s[2])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import itertools
+import random
+import unittest
+
+from catalog_generator import generate_songs
+from duration_playlist import _closest_subset, generate_duration_playlist
+from song_keys import normalize_key
+
+
+class TestClosestSubset(unittest.TestCase):
+    def test_matches_exhaustive_search(self):
+        rng = random.Random(4)
+        for _ in range(200):
+            durations = [rng.randint(1, 40) for _ in range(rng.randint(1, 8))]
+            low = rng.randint(0, 80)
+            high = low + rng.randint(0, 20)
+            goal = rng.randint(low, high)
+            sums = {sum(c) for r in range(len(durations) + 1) for c in itertools.combinations(durations, r)}
+            fitting = [total for total in sums if low <= total <= high]
+            chosen = _closest_subset(durations, low, high, goal)
+            if not fitting:
+                self.assertIsNone(chosen)
+                continue
+            total = sum(durations[i] for i in chosen)
+            self.assertEqual(len(set(chosen)), len(chosen))
+            self.assertTrue(low <= total <= high)
+            self.assertEqual(abs(total - goal), min(abs(t - goal) for t in fitting))
+
+
+class TestGenerateDurationPlaylist(unittest.TestCase):
+    def setUp(self):
+        self.songs = list(generate_songs(5000, seed=31))
+        self.by_id = {song[0]: song for song in self.songs}
+
+    def test_total_within_tolerance_and_filters_hold(self):
+        for target, tolerance, criteria in ((3600, 30, {"genre": "ROCK"}),
+                                            (1200, 0, {"decade": 2010}),
+                                            (5400, 60, {"genre": "pop", "max_duration": 240})):
+            with self.subTest(target=target, criteria=criteria):
+                name, _, song_ids = generate_duration_playlist("Timed", self.songs, target, tolerance,
+                                                               seed=1, **criteria)
+                picked = [self.by_id[song_id] for song_id in song_ids]
+                self.assertEqual(name, "Timed")
+                self.assertEqual(len(set(song_ids)), len(song_ids))
+                self.assertLessEqual(abs(sum(song[4] for song in picked) - target), tolerance)
+                for song in picked:
+                    if "genre" in criteria:
+                        self.assertEqual(normalize_key(song[3]), normalize_key(criteria["genre"]))
+                    if "decade" in criteria:
+                        self.assertEqual(song[5] // 10 * 10, criteria["decade"])
+                    if "max_duration" in criteria:
+                        self.assertLessEqual(song[4], criteria["max_duration"])
+
+    def test_seed_is_reproducible(self):
+        first = generate_duration_playlist("A", self.songs, 1800, seed=9)
+        second = generate_duration_playlist("A", self.songs, 1800, seed=9)
+        self.assertEqual(first[2], second[2])
+
+    def test_impossible_requests(self):
+        songs = [("S1", "t", "a", "rock", 200, 2000, "x"), ("S2", "t", "a", "rock", 200, 2000, "x")]
+        with self.assertRaises(ValueError):
+            generate_duration_playlist("A", songs, 500, tolerance=10)
+        with self.assertRaises(ValueError):
+            generate_duration_playlist("A", songs, 400, genre="jazz")
+        with self.assertRaises(ValueError):
+            generate_duration_playlist("A", songs, 400, tolerance=400)
+        with self.assertRaises(ValueError):
+            generate_duration_playlist("A", songs, 400, decade=2005)
+
+
+if __name__ == "__main__":
+    unittest.main()
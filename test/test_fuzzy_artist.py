@@ -0,0 +1,96 @@
+import random
+import string
+import unittest
+
+from fuzzy_artist import ArtistIndex, bounded_edit_distance
+from song_keys import normalize_key
+
+
+def _levenshtein(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, start=1):
+        current = [i]
+        for j, other in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != other)))
+        previous = current
+    return previous[-1]
+
+
+def _mutate(rng, text, edits):
+    letters = string.ascii_lowercase + " "
+    for _ in range(edits):
+        position = rng.randrange(len(text) + 1)
+        op = rng.randrange(3)
+        if op == 0:
+            text = text[:position] + rng.choice(letters) + text[position:]
+        elif op == 1 and position < len(text):
+            text = text[:position] + text[position + 1:]
+        elif position < len(text):
+            text = text[:position] + rng.choice(letters) + text[position + 1:]
+    return text or "x"
+
+
+ARTISTS = ["Duran Duran", "Talk Talk", "The The", "Abba", "ABBA", "Queen", "Mama Mia Mama",
+           "Sade", "Blondie", "Lala Lala Band", "Nana Mouskouri", "Coldplay", "Cher"]
+
+
+def _songs(names):
+    return [(f"S{i}", f"Song {i}", name, "pop", 200, 1990, "Album") for i, name in enumerate(names)]
+
+
+class TestBoundedEditDistance(unittest.TestCase):
+    def test_matches_full_levenshtein(self):
+        rng = random.Random(2)
+        for _ in range(500):
+            a = _mutate(rng, "".join(rng.choice("abc ") for _ in range(rng.randint(1, 9))), 0)
+            b = _mutate(rng, a, rng.randint(0, 4))
+            limit = rng.randint(0, 3)
+            expected = _levenshtein(a, b)
+            self.assertEqual(bounded_edit_distance(a, b, limit), expected if expected <= limit else limit + 1)
+
+
+class TestArtistIndex(unittest.TestCase):
+    def _brute_force(self, names, query, max_distance):
+        key = normalize_key(query)
+        found = {}
+        for name in names:
+            distance = _levenshtein(key, normalize_key(name))
+            if distance <= max_distance:
+                found.setdefault(normalize_key(name), distance)
+        return found
+
+    def _check(self, index, names, query, max_distance):
+        expected = self._brute_force(names, query, max_distance)
+        found = {normalize_key(name): distance for name, distance in index.match_artists(query, max_distance)}
+        self.assertEqual(found, expected, query)
+
+    def test_repeated_trigrams_still_match(self):
+        index = ArtistIndex(_songs(ARTISTS))
+        self.assertEqual(index.match_artists("Duran Duram", 1), [("Duran Duran", 1)])
+        self.assertEqual(index.match_artists("Talk Tolk", 1), [("Talk Talk", 1)])
+        self.assertEqual(index.match_artists("Duran Dura", 1), [("Duran Duran", 1)])
+        self.assertEqual(index.match_artists("Talk Talkk", 1), [("Talk Talk", 1)])
+
+    def test_random_queries_match_brute_force(self):
+        rng = random.Random(11)
+        names = ARTISTS + ["".join(rng.choice("ab ") for _ in range(rng.randint(3, 12))) for _ in range(150)]
+        index = ArtistIndex(_songs(names))
+        for _ in range(400):
+            query = _mutate(rng, rng.choice(names), rng.randint(0, 3))
+            if not query.strip():
+                continue
+            self._check(index, names, query, rng.randint(1, 3))
+
+    def test_filter_by_artist_returns_catalog_order(self):
+        songs = _songs(["Queen", "Abba", "queen ", "Quen"])
+        index = ArtistIndex(songs)
+        self.assertEqual(index.filter_by_artist("Queen", 1), [songs[0], songs[2], songs[3]])
+        self.assertEqual(index.filter_by_artist("QUEEN", 0), [songs[0], songs[2]])
+        with self.assertRaises(ValueError):
+            index.match_artists("", 1)
+        with self.assertRaises(ValueError):
+            index.match_artists("Queen", -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
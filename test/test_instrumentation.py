@@ -0,0 +1,69 @@
+import types
+import unittest
+
+import instrumentation
+from instrumentation import INSTRUMENTED_FUNCTIONS, LATENCY_BUCKETS
+
+SONGS = [("S1",), ("S2",), ("S3",), ("S4",)]
+
+
+def _fake_module():
+    module = types.ModuleType("fake_skeleton")
+    for name in INSTRUMENTED_FUNCTIONS:
+        setattr(module, name, lambda *args, **kwargs: [1, 2])
+    module.get_playlist_info = lambda playlist, songs: {"songs": 2}
+
+    def sort_songs(songs, sort_key):
+        raise ValueError("bad key")
+    module.sort_songs = sort_songs
+    return module
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.module = _fake_module()
+        instrumentation.reset()
+        instrumentation.install(module=self.module)
+        self.addCleanup(instrumentation.uninstall)
+        self.addCleanup(instrumentation.reset)
+
+    def test_input_size_is_the_songs_argument(self):
+        self.module.filter_by_genre(SONGS, "rock")
+        self.module.create_playlist("A much longer name", ["S1"], SONGS)
+        self.module.get_playlist_info(("Mix", "2024", ("S1",)), SONGS)
+        self.module.create_playlist("Mix", ["S1"], songs=SONGS)
+        stats = instrumentation.snapshot()
+        self.assertEqual(stats["filter_by_genre"]["input_items"], 4)
+        self.assertEqual(stats["create_playlist"]["input_items"], 8)
+        self.assertEqual(stats["create_playlist"]["output_items"], 4)
+        self.assertEqual(stats["get_playlist_info"]["input_items"], 4)
+
+    def test_errors_and_histogram(self):
+        with self.assertRaises(ValueError):
+            self.module.sort_songs(SONGS, "nope")
+        self.module.filter_by_decade(SONGS, 1990)
+        stats = instrumentation.snapshot()
+        self.assertEqual((stats["sort_songs"]["calls"], stats["sort_songs"]["errors"]), (1, 1))
+        self.assertEqual(sum(stats["filter_by_decade"]["buckets"]), 1)
+        self.assertEqual(len(stats["filter_by_decade"]["buckets"]), len(LATENCY_BUCKETS) + 1)
+
+    def test_install_is_idempotent_and_uninstall_restores(self):
+        original = self.module.filter_by_genre
+        instrumentation.install(module=self.module)
+        self.module.filter_by_genre(SONGS, "rock")
+        self.assertEqual(instrumentation.snapshot()["filter_by_genre"]["calls"], 1)
+        instrumentation.uninstall()
+        self.assertFalse(instrumentation.is_installed())
+        self.assertIsNot(self.module.filter_by_genre, original)
+        self.assertFalse(getattr(self.module.filter_by_genre, "__wrapped_for_timing__", False))
+
+    def test_exports(self):
+        self.module.filter_by_genre(SONGS, "rock")
+        text = instrumentation.to_prometheus()
+        self.assertIn('playlist_call_seconds_count{function="filter_by_genre"} 1', text)
+        self.assertIn('playlist_input_items_total{function="filter_by_genre"} 4', text)
+        self.assertIn('"filter_by_genre"', instrumentation.to_json())
+
+
+if __name__ == "__main__":
+    unittest.main()
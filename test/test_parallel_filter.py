@@ -0,0 +1,50 @@
+import unittest
+from multiprocessing import shared_memory
+from unittest import mock
+
+from catalog_generator import generate_songs
+from parallel_filter import PartitionedCatalog
+
+
+class TestPartitionedCatalog(unittest.TestCase):
+    def test_filters_match_list_scan(self):
+        songs = list(generate_songs(3000, seed=5))
+        with PartitionedCatalog(songs, workers=2, shards_per_worker=3) as catalog:
+            self.assertEqual(catalog.filter_by_duration(150, 210),
+                             [s for s in songs if 150 <= s[4] <= 210])
+            self.assertEqual(catalog.filter_by_decade(1990),
+                             [s for s in songs if 1990 <= s[5] <= 1999])
+            with self.assertRaises(ValueError):
+                catalog.filter_by_decade(1995)
+
+    def test_empty_catalog(self):
+        with PartitionedCatalog([], workers=1) as catalog:
+            self.assertEqual(catalog.filter_by_duration(0, 100), [])
+
+    def test_invalid_workers(self):
+        for workers in (0, -1, 1.5):
+            with self.subTest(workers=workers), self.assertRaises(ValueError):
+                PartitionedCatalog([], workers=workers)
+
+    def test_failed_init_releases_shared_memory(self):
+        created = []
+        real = shared_memory.SharedMemory
+
+        def recording(*args, **kwargs):
+            shm = real(*args, **kwargs)
+            created.append(shm.name)
+            return shm
+
+        # A release year too large for the int column fails after the
+        # duration column has been created
+        songs = [("S1", "t", "a", "rock", 200, 2 ** 40, "x")]
+        with mock.patch("parallel_filter.shared_memory.SharedMemory", side_effect=recording):
+            with self.assertRaises(OverflowError):
+                PartitionedCatalog(songs, workers=1)
+        self.assertEqual(len(created), 1)
+        with self.assertRaises(FileNotFoundError):
+            real(name=created[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime
+
+from playlist_batch import CREATED_FORMAT, build_song_index, create_playlists, playlist_record
+
+SONGS = [
+    ("S001", "One", "A", "rock", 200, 1990, "X"),
+    ("S002", "Two", "B", "pop", 180, 2001, "Y"),
+    ("S003", "Three", "A", "rock", 240, 1985, "X"),
+]
+
+
+class TestCreatePlaylists(unittest.TestCase):
+    def test_batch_shares_stamp_and_resolves_ids(self):
+        created = datetime(2024, 5, 6, 7, 8, 9)
+        playlists = create_playlists([("Rock", ["S001", "S003"]), ("All", ("S001", "S002", "S003"))],
+                                     songs=SONGS, created=created)
+        stamp = created.strftime(CREATED_FORMAT)
+        self.assertEqual(playlists, [("Rock", stamp, ("S001", "S003")),
+                                     ("All", stamp, ("S001", "S002", "S003"))])
+        self.assertIsInstance(playlists[0][2], tuple)
+
+    def test_reused_index_gives_same_result(self):
+        index = build_song_index(SONGS)
+        created = datetime(2024, 1, 1)
+        specs = [("Mix", ["S002"])]
+        self.assertEqual(create_playlists(specs, song_index=index, created=created),
+                         create_playlists(specs, songs=SONGS, created=created))
+
+    def test_default_stamp_is_current_time(self):
+        (_, stamp, _), = create_playlists([("Mix", ["S001"])], songs=SONGS)
+        parsed = datetime.strptime(stamp, CREATED_FORMAT)
+        self.assertLess(abs((datetime.now() - parsed).total_seconds()), 60)
+
+    def test_invalid_specs(self):
+        for specs in ([("Mix", ["S999"])], [("", ["S001"])], [("Mix", [])], [("Mix",)],
+                      [("Mix", [["S001"]])]):
+            with self.subTest(specs=specs), self.assertRaises(ValueError):
+                create_playlists(specs, songs=SONGS)
+        with self.assertRaises(ValueError):
+            create_playlists(None, songs=SONGS)
+        with self.assertRaises(ValueError):
+            build_song_index(None)
+
+    def test_unknown_ids_are_reported(self):
+        with self.assertRaisesRegex(ValueError, "S404"):
+            create_playlists([("Mix", ["S001", "S404"])], songs=SONGS)
+
+
+class TestPlaylistRecord(unittest.TestCase):
+    def test_stamps_record(self):
+        created = datetime(2024, 2, 3, 4, 5, 6)
+        self.assertEqual(playlist_record("Mix", ["S001", "S002"], created),
+                         ("Mix", created.strftime(CREATED_FORMAT), ("S001", "S002")))
+
+    def test_invalid_records(self):
+        with self.assertRaises(ValueError):
+            playlist_record(" ", ["S001"])
+        with self.assertRaises(ValueError):
+            playlist_record("Mix", [])
+
+
+if __name__ == "__main__":
+    unittest.main()
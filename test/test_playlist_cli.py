@@ -0,0 +1,88 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from catalog_generator import generate_songs, write_songs
+from playlist_cli import main, read_songs
+
+
+def _filter_by_genre(songs, genre):
+    return [song for song in songs if song[3] == genre]
+
+
+def _filter_by_decade(songs, decade):
+    return [song for song in songs if decade <= song[5] <= decade + 9]
+
+
+def _sort_songs(songs, sort_key):
+    return sorted(songs, key=lambda song: song[{"title": 1, "artist": 2, "year": 5, "duration": 4}[sort_key]])
+
+
+def _integrate(songs, new_releases):
+    return songs + new_releases
+
+
+class TestPlaylistCli(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.songs = list(generate_songs(100, seed=8))
+        self.catalog = self._write("songs.csv", self.songs)
+        for name, func in (("filter_by_genre", _filter_by_genre), ("filter_by_decade", _filter_by_decade),
+                           ("sort_songs", _sort_songs), ("integrate_new_releases", _integrate)):
+            patcher = mock.patch(f"skeleton.{name}", func)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _write(self, name, songs, fmt="csv"):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", newline="") as f:
+            write_songs(songs, f, fmt)
+        return path
+
+    def _run(self, *argv):
+        output = os.path.join(self.directory.name, "out.jsonl")
+        code = main(["--catalog", self.catalog, "--format", "jsonl", "--output", output, *argv])
+        with open(output) as f:
+            return code, [json.loads(line) for line in f]
+
+    def test_read_songs_round_trips_both_formats(self):
+        self.assertEqual(read_songs(self.catalog), self.songs)
+        self.assertEqual(read_songs(self._write("songs.jsonl", self.songs, "jsonl")), self.songs)
+
+    def test_filter_and_sort(self):
+        code, rows = self._run("filter", "genre", "rock")
+        self.assertEqual(code, 0)
+        self.assertEqual([tuple(row) for row in rows], _filter_by_genre(self.songs, "rock"))
+        _, rows = self._run("sort", "year")
+        self.assertEqual([tuple(row) for row in rows], _sort_songs(self.songs, "year"))
+
+    def test_commands_file_shares_state(self):
+        releases = self._write("new.csv", list(generate_songs(5, seed=1, start=1000)))
+        commands = os.path.join(self.directory.name, "commands.txt")
+        with open(commands, "w") as f:
+            f.write(f"# refresh\nintegrate {releases}\n\nfilter decade 1990\n")
+        code, rows = self._run("run", commands)
+        self.assertEqual(code, 0)
+        self.assertEqual(rows[0], {"stat": "songs", "key": "count", "value": 105})
+        combined = self.songs + read_songs(releases)
+        self.assertEqual([tuple(row) for row in rows[1:]], _filter_by_decade(combined, 1990))
+
+    def test_errors_return_exit_code(self):
+        commands = os.path.join(self.directory.name, "bad.txt")
+        with open(commands, "w") as f:
+            f.write("sort album\n")
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertEqual(main(["--catalog", self.catalog, "run", commands]), 1)
+            self.assertEqual(main(["--catalog", self.catalog, "sort", "album"]), 1)
+            self.assertEqual(main(["--catalog", "missing.csv", "stats"]), 1)
+        self.assertIn("bad.txt:1", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from playlist_service import PlaylistService
+
+SONGS = [
+    ("S001", "One", "A", "rock", 200, 1990, "X"),
+    ("S002", "Two", "B", "pop", 180, 2001, "Y"),
+]
+GENRES = ("rock", "pop")
+
+
+def _filter_by_genre(songs, genre):
+    return [song for song in songs if song[3] == genre]
+
+
+class TestPlaylistService(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch("skeleton.filter_by_genre", _filter_by_genre)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _exchange(self, service, lines):
+        """Send raw request lines over a real socket and return the decoded replies."""
+        async def run():
+            server = await asyncio.start_server(service.handle_client, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                for line in lines:
+                    writer.write(line.encode() + b"\n")
+                await writer.drain()
+                replies = [json.loads(await asyncio.wait_for(reader.readline(), 5)) for _ in lines]
+                writer.close()
+                await writer.wait_closed()
+                return replies
+        return asyncio.run(run())
+
+    def test_filter_request(self):
+        service = PlaylistService(SONGS, GENRES)
+        reply, = self._exchange(service, [json.dumps(
+            {"id": 1, "op": "filter_by_genre", "args": {"genre": "rock"}})])
+        self.assertEqual(reply, {"id": 1, "ok": True, "result": [list(SONGS[0])]})
+
+    def test_every_request_gets_one_reply(self):
+        service = PlaylistService(SONGS, GENRES)
+        created = datetime(2024, 1, 2, 3, 4, 5)
+        with mock.patch("skeleton.create_playlist", return_value=("Mix", created, ("S001",))), \
+                mock.patch("skeleton.sort_songs", side_effect=KeyError("title")):
+            replies = self._exchange(service, [
+                json.dumps({"id": 1, "op": "sort_songs", "args": {"sort_key": "title"}}),
+                json.dumps({"id": 2, "op": "create_playlist",
+                            "args": {"name": "Mix", "song_ids": ["S001"]}}),
+                json.dumps({"id": 3, "op": "nope"}),
+                "not json",
+            ])
+        by_id = {reply["id"]: reply for reply in replies}
+        self.assertEqual(set(by_id), {1, 2, 3, None})
+        self.assertFalse(by_id[1]["ok"])
+        self.assertIn("KeyError", by_id[1]["error"])
+        self.assertEqual(by_id[2], {"id": 2, "ok": True, "result": ["Mix", str(created), ["S001"]]})
+        self.assertFalse(by_id[3]["ok"])
+        self.assertFalse(by_id[None]["ok"])
+
+    def test_handle_request_rejects_bad_arguments(self):
+        service = PlaylistService(SONGS, GENRES)
+        response = asyncio.run(service.handle_request(
+            {"id": 7, "op": "filter_by_genre", "args": {"colour": "red"}}))
+        self.assertEqual((response["id"], response["ok"]), (7, False))
+        response = asyncio.run(service.handle_request(["not", "a", "dict"]))
+        self.assertFalse(response["ok"])
+
+    def test_integrate_new_releases_updates_catalog(self):
+        service = PlaylistService(SONGS, GENRES)
+        release = ["S003", "Three", "C", "pop", 190, 2024, "Z"]
+        with mock.patch("skeleton.integrate_new_releases", side_effect=lambda songs, new: songs + new):
+            response = asyncio.run(service.handle_request(
+                {"id": 1, "op": "integrate_new_releases", "args": {"new_releases": [release]}}))
+        self.assertEqual(response["result"], 3)
+        self.assertEqual(service.songs[-1], tuple(release))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import random
+import unittest
+
+from playlist_vector import CHUNK_SIZE, PersistentPlaylist, as_persistent
+
+
+def _height(node):
+    return 0 if node is None else node.height
+
+
+def _check_balanced(test, node):
+    if node is None or node.items is not None:
+        return
+    test.assertLessEqual(abs(_height(node.left) - _height(node.right)), 1)
+    test.assertEqual(node.size, node.left.size + node.right.size)
+    _check_balanced(test, node.left)
+    _check_balanced(test, node.right)
+
+
+def _leaf_sizes(node):
+    if node is None:
+        return []
+    if node.items is not None:
+        return [len(node.items)]
+    return _leaf_sizes(node.left) + _leaf_sizes(node.right)
+
+
+def _check_occupancy(test, node):
+    # Neighbouring leaves that would fit in one chunk should have been merged
+    sizes = _leaf_sizes(node)
+    for a, b in zip(sizes, sizes[1:]):
+        test.assertGreater(a + b, CHUNK_SIZE, sizes)
+
+
+class TestPersistentPlaylist(unittest.TestCase):
+    def test_random_edits_match_list_model(self):
+        rng = random.Random(7)
+        playlist = PersistentPlaylist(f"S{i}" for i in range(100))
+        model = [f"S{i}" for i in range(100)]
+        versions = []
+        for step in range(2000):
+            op = rng.randrange(6)
+            if op == 0 or not model:
+                song_id = f"N{step}"
+                playlist = playlist.append(song_id)
+                model.append(song_id)
+            elif op == 1:
+                index = rng.randrange(len(model) + 1)
+                playlist = playlist.insert(index, f"N{step}")
+                model.insert(index, f"N{step}")
+            elif op == 2:
+                index = rng.randrange(len(model))
+                playlist = playlist.delete(index)
+                del model[index]
+            elif op == 3:
+                index = rng.randrange(len(model))
+                playlist = playlist.set(index, f"R{step}")
+                model[index] = f"R{step}"
+            elif op == 4:
+                source, destination = rng.randrange(len(model)), rng.randrange(len(model))
+                playlist = playlist.move(source, destination)
+                model.insert(destination, model.pop(source))
+            else:
+                song_id = rng.choice(model)
+                playlist = playlist.remove(song_id)
+                model.remove(song_id)
+            if step % 100 == 0:
+                versions.append((playlist, tuple(model)))
+        self.assertEqual(playlist.to_tuple(), tuple(model))
+        self.assertEqual(len(playlist), len(model))
+        _check_balanced(self, playlist._root)
+        _check_occupancy(self, playlist._root)
+        # Earlier versions are untouched by later edits
+        for version, expected in versions:
+            self.assertEqual(version.to_tuple(), expected)
+
+    def test_appends_and_inserts_fill_chunks(self):
+        playlist = PersistentPlaylist()
+        for i in range(1000):
+            playlist = playlist.append(f"S{i}")
+        self.assertEqual(_leaf_sizes(playlist._root), [CHUNK_SIZE] * 31 + [8])
+        rng = random.Random(27)
+        for i in range(200):
+            playlist = playlist.insert(rng.randrange(len(playlist) + 1), f"N{i}")
+        _check_balanced(self, playlist._root)
+        _check_occupancy(self, playlist._root)
+        self.assertEqual(len(playlist), 1200)
+
+    def test_reads_behave_like_tuple(self):
+        items = tuple(f"S{i}" for i in range(5 * CHUNK_SIZE + 3))
+        playlist = PersistentPlaylist(items)
+        self.assertEqual(playlist, items)
+        for index in (0, 1, CHUNK_SIZE, len(items) - 1, -1, -len(items)):
+            self.assertEqual(playlist[index], items[index])
+        for window in (slice(3, 70), slice(None, None, 3), slice(-10, None), slice(50, 10)):
+            self.assertEqual(playlist[window].to_tuple(), items[window])
+        self.assertIn("S40", playlist)
+        self.assertNotIn("S999", playlist)
+        self.assertEqual(playlist.index("S40"), 40)
+        self.assertEqual((playlist + ("X",)).to_tuple(), items + ("X",))
+        self.assertEqual(hash(playlist), hash(items))
+
+    def test_invalid_positions(self):
+        playlist = PersistentPlaylist(("a", "b"))
+        with self.assertRaises(IndexError):
+            playlist[2]
+        with self.assertRaises(ValueError):
+            playlist.delete(2)
+        with self.assertRaises(ValueError):
+            playlist.insert(3, "c")
+        with self.assertRaises(ValueError):
+            playlist.remove("z")
+
+    def test_as_persistent(self):
+        name, created, song_ids = as_persistent(("Mix", "2024-01-01 00:00:00", ("a", "b")))
+        self.assertEqual((name, created), ("Mix", "2024-01-01 00:00:00"))
+        self.assertIsInstance(song_ids, PersistentPlaylist)
+        self.assertEqual(song_ids, ("a", "b"))
+        with self.assertRaises(ValueError):
+            as_persistent(("Mix", ("a",)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import pstats
+import tempfile
+import unittest
+from unittest import mock
+
+from profiling import PROFILE_ENV, profile_action, profile_dir_from_args
+
+
+class TestProfileDirFromArgs(unittest.TestCase):
+    def test_command_line_forms(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(profile_dir_from_args(["--profile", "out"]), "out")
+            self.assertEqual(profile_dir_from_args(["--profile=out2"]), "out2")
+            self.assertIsNone(profile_dir_from_args([]))
+            with self.assertRaises(ValueError):
+                profile_dir_from_args(["--profile"])
+
+    def test_environment_fallback(self):
+        with mock.patch.dict(os.environ, {PROFILE_ENV: "env_dir"}):
+            self.assertEqual(profile_dir_from_args([]), "env_dir")
+            self.assertEqual(profile_dir_from_args(["--profile", "cli"]), "cli")
+
+
+class TestProfileAction(unittest.TestCase):
+    def test_disabled_writes_nothing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with profile_action("1", None):
+                sum(range(100))
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_reports_written_per_action(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with profile_action("2", directory):
+                sorted(range(10000), key=lambda x: -x)
+            with self.assertRaises(RuntimeError):
+                with profile_action("a/b", directory):
+                    raise RuntimeError("menu action failed")
+            names = sorted(os.listdir(directory))
+            self.assertEqual(len(names), 6)
+            prof = [name for name in names if name.endswith("action-2.prof")]
+            self.assertEqual(len(prof), 1)
+            self.assertGreater(pstats.Stats(os.path.join(directory, prof[0])).total_calls, 0)
+            self.assertTrue(any(name.endswith("action-a_b_alloc.txt") for name in names))
+            with open(os.path.join(directory, prof[0][:-5] + ".txt")) as f:
+                self.assertIn("Action '2'", f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from unittest import mock
+
+from query_cache import CachedCatalog, QueryCache
+
+SONGS = [
+    ("S001", "One", "Queen", "rock", 200, 1975, "X"),
+    ("S002", "Two", "Abba", "pop", 180, 1976, "Y"),
+]
+
+
+def _filter_by_artist(songs, artist):
+    return [song for song in songs if song[2] == artist]
+
+
+def _filter_by_decade(songs, decade):
+    if not isinstance(decade, int) or isinstance(decade, bool):
+        raise ValueError("Decade must be an integer")
+    return [song for song in songs if decade <= song[5] <= decade + 9]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestQueryCache(unittest.TestCase):
+    def test_hits_misses_and_lru_eviction(self):
+        cache = QueryCache(max_entries=2, ttl=None)
+        calls = []
+
+        def compute(value):
+            calls.append(value)
+            return [value]
+
+        for value in ("a", "b", "a", "c", "b"):
+            self.assertEqual(cache.get_or_compute("q", (value,), 0, lambda: compute(value)), [value])
+        # "b" was least recently used when "c" arrived, so it was computed again
+        self.assertEqual(calls, ["a", "b", "c", "b"])
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 4, 2))
+
+    def test_item_budget_and_ttl(self):
+        clock = _Clock()
+        cache = QueryCache(max_items=5, ttl=10, clock=clock)
+        cache.get_or_compute("q", (1,), 0, lambda: [1, 2, 3])
+        cache.get_or_compute("q", (2,), 0, lambda: [1, 2, 3])
+        self.assertEqual(cache.stats()["items"], 3)
+        self.assertEqual(cache.get_or_compute("big", (), 0, lambda: list(range(6))), list(range(6)))
+        self.assertEqual(cache.stats()["entries"], 1)
+        clock.now = 11
+        cache.get_or_compute("q", (2,), 0, lambda: [4])
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_results_are_copies(self):
+        cache = QueryCache()
+        first = cache.get_or_compute("q", (), 0, lambda: [1, 2])
+        first.append(3)
+        self.assertEqual(cache.get_or_compute("q", (), 0, lambda: []), [1, 2])
+
+    def test_invalid_limits(self):
+        for kwargs in ({"max_entries": 0}, {"max_items": 0}, {"ttl": 0}):
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                QueryCache(**kwargs)
+
+
+class TestCachedCatalog(unittest.TestCase):
+    def setUp(self):
+        for name, func in (("filter_by_artist", _filter_by_artist), ("filter_by_decade", _filter_by_decade),
+                           ("integrate_new_releases", lambda songs, new: songs + list(new))):
+            patcher = mock.patch(f"skeleton.{name}", func)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_cache_never_changes_results(self):
+        catalog = CachedCatalog(SONGS, ("rock", "pop"))
+        self.assertEqual(catalog.filter_by_artist("Queen"), [SONGS[0]])
+        self.assertEqual(catalog.filter_by_artist("QUEEN"), [])
+        self.assertEqual(catalog.filter_by_artist(" Queen"), [])
+        self.assertEqual(catalog.filter_by_decade(1970), SONGS)
+        with self.assertRaises(ValueError):
+            catalog.filter_by_decade(True)
+        with self.assertRaises(ValueError):
+            catalog.filter_by_decade(1970.0)
+        self.assertEqual(catalog.filter_by_artist("Queen"), [SONGS[0]])
+        self.assertEqual(catalog.cache.stats()["hits"], 1)
+
+    def test_new_releases_invalidate_results(self):
+        catalog = CachedCatalog(SONGS, ("rock", "pop"))
+        self.assertEqual(catalog.filter_by_decade(1970), SONGS)
+        release = ("S003", "Three", "Queen", "rock", 210, 1977, "Z")
+        catalog.integrate_new_releases([release])
+        self.assertEqual(catalog.filter_by_decade(1970), SONGS + [release])
+        self.assertEqual(catalog.cache.stats()["invalidations"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
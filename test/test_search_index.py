@@ -0,0 +1,84 @@
+import random
+import unittest
+
+from catalog_generator import generate_songs
+from search_index import SearchIndex, tokenize
+
+
+def _brute_force(songs, query, prefix):
+    terms = tokenize(query)
+    matches = []
+    for song in songs:
+        words = set(tokenize(" ".join((song[1], song[2], song[6]))))
+        ok = all(term in words for term in terms[:-1])
+        last = terms[-1]
+        ok = ok and (last in words or (prefix and any(word.startswith(last) for word in words)))
+        if ok:
+            matches.append(song)
+    return matches
+
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.songs = list(generate_songs(2000, seed=6))
+        self.index = SearchIndex(self.songs[:1500])
+        self.index.add_songs(self.songs[1500:])
+
+    def test_tokenize_normalizes(self):
+        self.assertEqual(tokenize("  Ｒock  AND roll! "), ["rock", "and", "roll"])
+
+    def test_results_match_brute_force(self):
+        rng = random.Random(1)
+        words = sorted({word for song in self.songs for word in tokenize(song[1])})
+        for _ in range(60):
+            query = " ".join(rng.sample(words, rng.randint(1, 2)))
+            if rng.random() < 0.5:
+                query = query[:-2]
+            for prefix in (True, False):
+                with self.subTest(query=query, prefix=prefix):
+                    expected = _brute_force(self.songs, query, prefix)
+                    found = self.index.search(query, limit=len(self.songs), prefix=prefix)
+                    self.assertEqual(sorted(found), sorted(expected))
+
+    def test_prefix_expands_to_every_matching_word(self):
+        songs = [(f"S{i}", f"a{i:05}", "X", "rock", 100, 2000, "Y") for i in range(1000)]
+        index = SearchIndex(songs)
+        self.assertEqual(sorted(index.search("a", limit=1000)), sorted(songs))
+        self.assertEqual(len(index.complete("a0", limit=2000)), 1000)
+        # The best match sorts after hundreds of weaker words
+        albums = [(f"B{i}", "Song", "X", "rock", 100, 2000, f"b{i:03}") for i in range(300)]
+        best = ("T1", "b999", "X", "rock", 100, 2000, "Y")
+        index = SearchIndex(albums + [best])
+        self.assertEqual(index.search("b", limit=1), [best])
+        self.assertEqual(index.search("song b", limit=1), [albums[0]])
+        for query in ("b", "song b", "b00", "song b2"):
+            self.assertEqual(sorted(index.search(query, limit=1000)),
+                             sorted(_brute_force(albums + [best], query, True)))
+
+    def test_words_added_after_a_lookup_are_found(self):
+        index = SearchIndex([("A", "Alpha", "X", "rock", 100, 2000, "Y")])
+        self.assertEqual(index.complete("al"), ["alpha"])
+        index.add_songs([("B", "Alpine", "X", "rock", 100, 2000, "Y"),
+                         ("C", "Aardvark", "X", "rock", 100, 2000, "Y")])
+        self.assertEqual(sorted(index.complete("al")), ["alpha", "alpine"])
+        self.assertEqual([song[0] for song in index.search("a", limit=5)], ["A", "B", "C"])
+
+    def test_title_outranks_album(self):
+        songs = [("A1", "Other", "X", "rock", 100, 2000, "Zebra"),
+                 ("A2", "Zebra", "Y", "rock", 100, 2000, "Other")]
+        index = SearchIndex(songs)
+        self.assertEqual(index.search("zebra"), [songs[1], songs[0]])
+        self.assertEqual(index.search("zeb"), [songs[1], songs[0]])
+        self.assertEqual(index.search("zeb", prefix=False), [])
+        self.assertEqual(index.complete("ze"), ["zebra"])
+
+    def test_invalid_queries(self):
+        self.assertEqual(self.index.search("!!!"), [])
+        with self.assertRaises(ValueError):
+            self.index.search(None)
+        with self.assertRaises(ValueError):
+            self.index.search("love", limit=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from collections import Counter
+
+from shuffle import permuted, shuffled, smart_shuffled
+
+
+class TestShuffles(unittest.TestCase):
+    def setUp(self):
+        self.song_ids = tuple(f"S{i:04d}" for i in range(1000))
+
+    def test_every_song_plays_once(self):
+        for count in (0, 1, 2, 3, 5, 17, 1000):
+            ids = self.song_ids[:count]
+            for shuffle in (shuffled, permuted):
+                with self.subTest(shuffle=shuffle.__name__, count=count):
+                    self.assertEqual(sorted(shuffle(ids, seed=1)), sorted(ids))
+
+    def test_seeded_orders_are_reproducible_and_vary(self):
+        for shuffle in (shuffled, permuted):
+            first = list(shuffle(self.song_ids, seed=5))
+            self.assertEqual(first, list(shuffle(self.song_ids, seed=5)))
+            self.assertNotEqual(first, list(shuffle(self.song_ids, seed=6)))
+            self.assertNotEqual(first, list(self.song_ids))
+
+    def test_shuffled_positions_are_roughly_uniform(self):
+        ids = ("a", "b", "c")
+        firsts = Counter(next(shuffled(ids, seed=seed)) for seed in range(3000))
+        for song_id in ids:
+            self.assertTrue(800 < firsts[song_id] < 1200, firsts)
+
+    def test_smart_shuffle_spreads_artists(self):
+        songs = [(f"S{i}", "t", f"Artist {i % 4}", "pop", 200, 2000, "x") for i in range(40)]
+        artist_of = {song[0]: song[2] for song in songs}
+        ids = tuple(song[0] for song in songs)
+        for seed in range(20):
+            order = list(smart_shuffled(ids, songs, seed=seed))
+            self.assertEqual(sorted(order), sorted(ids))
+            self.assertTrue(all(artist_of[a] != artist_of[b] for a, b in zip(order, order[1:])))
+
+    def test_smart_shuffle_with_dominant_artist(self):
+        songs = [(f"S{i}", "t", "Big" if i < 7 else f"Other {i}", "pop", 200, 2000, "x") for i in range(10)]
+        artist_of = {song[0]: song[2] for song in songs}
+        order = list(smart_shuffled(tuple(song[0] for song in songs), songs, seed=2))
+        repeats = sum(artist_of[a] == artist_of[b] for a, b in zip(order, order[1:]))
+        # 7 of 10 songs by one artist: 3 others can separate at most 4 runs
+        self.assertEqual(repeats, 3)
+        with self.assertRaises(ValueError):
+            list(smart_shuffled(("S1", "S99"), songs))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import random
+import unittest
+from datetime import datetime
+
+from catalog_generator import generate_songs
+from playlist_batch import CREATED_FORMAT
+from similarity import SimilarityIndex
+
+
+def _brute_force(index, seed_id, count):
+    seed = index.row_of_id[seed_id]
+    ranked = sorted((index.distance(seed, row), row) for row in range(len(index.songs)) if row != seed)
+    return [(distance, index.songs[row]) for distance, row in ranked[:count]]
+
+
+class TestSimilarityIndex(unittest.TestCase):
+    def setUp(self):
+        self.songs = list(generate_songs(3000, seed=21))
+        self.index = SimilarityIndex(self.songs)
+
+    def test_nearest_matches_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(25):
+            seed_id = rng.choice(self.songs)[0]
+            count = rng.choice((1, 10, 50, 400))
+            with self.subTest(seed_id=seed_id, count=count):
+                self.assertEqual(self.index.nearest(seed_id, count), _brute_force(self.index, seed_id, count))
+
+    def test_custom_weights_match_brute_force(self):
+        index = SimilarityIndex(self.songs, weights={"genre": 0.0, "minute": 5.0})
+        seed_id = self.songs[17][0]
+        self.assertEqual(index.nearest(seed_id, 30), _brute_force(index, seed_id, 30))
+
+    def test_similar_playlist_starts_with_seed(self):
+        seed_id = self.songs[5][0]
+        name, created, song_ids = self.index.similar_playlist("More like this", seed_id, count=20)
+        self.assertEqual(name, "More like this")
+        datetime.strptime(created, CREATED_FORMAT)
+        self.assertEqual(song_ids[0], seed_id)
+        self.assertEqual(list(song_ids[1:]), [song[0] for _, song in self.index.nearest(seed_id, 19)])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.index.nearest("missing")
+        with self.assertRaises(ValueError):
+            self.index.nearest(self.songs[0][0], 0)
+        with self.assertRaises(ValueError):
+            SimilarityIndex([])
+        with self.assertRaises(ValueError):
+            SimilarityIndex(self.songs, weights={"genre": -1.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from catalog_generator import generate_songs
+from song_keys import KeyedCatalog, normalize_key
+
+
+class TestNormalizeKey(unittest.TestCase):
+    def test_equivalent_spellings_share_a_key(self):
+        self.assertEqual(normalize_key("  The   Beatles "), "the beatles")
+        self.assertEqual(normalize_key("ＲＯＣＫ"), "rock")
+        self.assertEqual(normalize_key("Straße"), normalize_key("STRASSE"))
+        self.assertEqual(normalize_key("Cafe\u0301"), normalize_key("Caf\u00e9"))
+        with self.assertRaises(ValueError):
+            normalize_key(None)
+
+
+class TestKeyedCatalog(unittest.TestCase):
+    def setUp(self):
+        self.songs = list(generate_songs(1000, seed=12))
+        self.songs.append(("X1", "zed", " ROCK  ", "Rock", 100, 2000, "A"))
+
+    def test_filters_ignore_case_and_spacing(self):
+        catalog = KeyedCatalog(self.songs)
+        self.assertEqual(catalog.filter_by_genre("ROCK"),
+                         [s for s in self.songs if normalize_key(s[3]) == "rock"])
+        self.assertEqual(catalog.filter_by_artist("rock"), [self.songs[-1]])
+        with self.assertRaises(ValueError):
+            catalog.filter_by_genre(" ")
+
+    def test_sort_matches_stable_sort_on_keys(self):
+        catalog = KeyedCatalog(self.songs)
+        expected = {
+            "title": sorted(self.songs, key=lambda s: normalize_key(s[1])),
+            "artist": sorted(self.songs, key=lambda s: normalize_key(s[2])),
+            "year": sorted(self.songs, key=lambda s: s[5]),
+            "duration": sorted(self.songs, key=lambda s: s[4]),
+        }
+        for sort_key, songs in expected.items():
+            self.assertEqual(catalog.sort_songs(sort_key), songs)
+        with self.assertRaises(ValueError):
+            catalog.sort_songs("album")
+
+    def test_cached_orders_stay_correct_after_adding_songs(self):
+        catalog = KeyedCatalog(self.songs[:600])
+        for sort_key in ("title", "year"):
+            catalog.sort_songs(sort_key)
+        combined = catalog.integrate_new_releases(self.songs[600:])
+        self.assertEqual(combined, self.songs)
+        self.assertEqual(catalog.sort_songs("title"), sorted(self.songs, key=lambda s: normalize_key(s[1])))
+        self.assertEqual(catalog.sort_songs("year"), sorted(self.songs, key=lambda s: s[5]))
+        self.assertEqual(len(catalog), len(self.songs))
+
+    def test_rejected_batch_leaves_catalog_unchanged(self):
+        catalog = KeyedCatalog(self.songs[:1])
+        catalog.sort_songs("title")
+        bad_batches = ([self.songs[1], ("bad",)], [self.songs[1], ("S9", None, "A", "rock", 1, 2000, "X")])
+        for batch in bad_batches:
+            with self.subTest(batch=batch), self.assertRaises(ValueError):
+                catalog.add_songs(batch)
+            self.assertEqual(catalog.songs, self.songs[:1])
+            self.assertEqual(catalog.sort_songs("title"), self.songs[:1])
+            self.assertEqual({field: len(column) for field, column in catalog.keys.items()},
+                             {field: 1 for field in catalog.keys})
+        catalog.add_songs(self.songs[1:3])
+        self.assertEqual(catalog.sort_songs("title"), sorted(self.songs[:3], key=lambda s: normalize_key(s[1])))
+
+    def test_invalid_records(self):
+        with self.assertRaises(ValueError):
+            KeyedCatalog([("S1", "too short")])
+        with self.assertRaises(ValueError):
+            KeyedCatalog(None)
+
+
+if __name__ == "__main__":
+    unittest.main()